@@ -0,0 +1,188 @@
+"""
+In-process HTTP benchmark of the auth and user endpoints.
+
+Drives create_app() through httpx.ASGITransport (no network, no server processes) against the
+Postgres and Redis configured by the usual DB_* / REDIS_* settings, with migrations applied.
+Scenarios run in order, each one feeding the next:
+
+    signup -> verify -> login -> refresh -> me -> list
+
+Each scenario makes --requests calls from --concurrency concurrent clients and reports latency
+percentiles, throughput and SQL statements per request (taken from the Server-Timing header).
+The users created by the run are deleted at the end.
+
+    python -m benchmarks.http_bench --requests 200 --concurrency 16 --json bench/http.json
+
+Argon2 dominates signup and login: keep HASHER_* as in production to measure real latencies, or
+lower them to look at everything else. Rate limiting is turned off for the run, since every
+request comes from one client address.
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import statistics
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("METRICS_SERVER_TIMING", "true")
+
+import httpx  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from benchmarks.report import ScenarioResult, print_table, summarize, write_json  # noqa: E402
+from src.configs.database import settings as db_settings  # noqa: E402
+from src.configs.hasher import hasher_settings  # noqa: E402
+from src.infrastructure.db.base import async_session_maker, engine  # noqa: E402
+from src.infrastructure.fastapi.app import create_app  # noqa: E402
+
+PASSWORD = "bench-password-1"
+_SERVER_TIMING_DB = re.compile(r'db;dur=([\d.]+);desc="(\d+) queries"')
+
+
+@dataclass(frozen=True, slots=True)
+class Call:
+    method: str
+    url: str
+    json: dict | None = None
+    token: str | None = None
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, name: str, calls: list[Call], concurrency: int, ok: int
+) -> tuple[ScenarioResult, list[httpx.Response]]:
+    """Issue `calls` from `concurrency` workers; any status other than `ok` counts as an error."""
+    latencies = [0.0] * len(calls)
+    responses: list[httpx.Response | None] = [None] * len(calls)
+    pending = iter(range(len(calls)))
+
+    async def worker() -> None:
+        for i in pending:
+            call = calls[i]
+            headers = {"Authorization": f"Bearer {call.token}"} if call.token else None
+            start = time.perf_counter()
+            # A task per request: contextvars the app sets while serving one request (read routing,
+            # SQL stats) must not leak into the next one, as they would not across real connections.
+            responses[i] = await asyncio.create_task(client.request(call.method, call.url, json=call.json, headers=headers))
+            latencies[i] = time.perf_counter() - start
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(calls)))))
+    elapsed = time.perf_counter() - started
+
+    done = [r for r in responses if r is not None]
+    statuses = Counter(str(r.status_code) for r in done)
+    timings = [m for r in done if (m := _SERVER_TIMING_DB.search(r.headers.get("server-timing", "")))]
+    extra = {}
+    if timings:
+        extra = {
+            "queries_per_req": round(statistics.fmean(int(m[2]) for m in timings), 2),
+            "db_ms_per_req": round(statistics.fmean(float(m[1]) for m in timings), 2),
+        }
+    errors = sum(r.status_code != ok for r in done)
+    return summarize(name, latencies, elapsed, concurrency, errors, dict(statuses), extra), done
+
+
+async def fetch_codes(emails: list[str]) -> dict[str, str]:
+    """Latest verification code of each user."""
+    stmt = text(
+        "SELECT DISTINCT ON (u.id) u.email, v.code FROM users u JOIN verifications v ON v.user_id = u.id "
+        "WHERE u.email = ANY(:emails) ORDER BY u.id, v.created_at DESC, v.id DESC"
+    )
+    async with async_session_maker() as s:
+        return {row.email: row.code for row in await s.execute(stmt, {"emails": emails})}
+
+
+async def promote_to_admin(email: str) -> None:
+    async with async_session_maker() as s:
+        await s.execute(text("UPDATE users SET role = 'ADMIN' WHERE email = :email"), {"email": email})
+        await s.commit()
+
+
+async def delete_bench_data(prefix: str) -> None:
+    async with async_session_maker() as s:
+        await s.execute(text("DELETE FROM outbox WHERE payload->>'to' LIKE :p"), {"p": f"{prefix}%"})
+        await s.execute(text("DELETE FROM users WHERE email LIKE :p"), {"p": f"{prefix}%"})  # verifications cascade
+        await s.commit()
+
+
+async def run(requests: int, concurrency: int, keep: bool) -> list[ScenarioResult]:
+    prefix = f"bench-{uuid.uuid4().hex[:8]}-"
+    emails = [f"{prefix}{i}@bench.local" for i in range(requests)]
+    results: list[ScenarioResult] = []
+
+    app = create_app()
+    try:
+        async with (
+            app.router.lifespan_context(app),
+            httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client,
+        ):
+            signup = [Call("POST", "/auth/signup", {"email": e, "password": PASSWORD}) for e in emails]
+            result, _ = await run_scenario(client, "signup", signup, concurrency, ok=201)
+            results.append(result)
+
+            codes = await fetch_codes(emails)
+            verify = [Call("POST", "/auth/verify", {"email": e, "code": c}) for e, c in codes.items()]
+            result, _ = await run_scenario(client, "verify", verify, concurrency, ok=200)
+            results.append(result)
+
+            # Before any login, so that no cached copy of the user still has the old role.
+            await promote_to_admin(emails[0])
+            login = [Call("POST", "/auth/login", {"email": e, "password": PASSWORD}) for e in codes]
+            result, responses = await run_scenario(client, "login", login, concurrency, ok=200)
+            results.append(result)
+            tokens = [r.json() for r in responses if r.status_code == 200]
+            if not tokens:
+                raise RuntimeError("no successful logins, cannot run the authenticated scenarios")
+
+            refresh = [Call("POST", "/auth/refresh", token=t["refresh_token"]) for t in tokens]
+            result, _ = await run_scenario(client, "refresh", refresh, concurrency, ok=200)
+            results.append(result)
+
+            me = [Call("GET", "/users/me", token=tokens[i % len(tokens)]["access_token"]) for i in range(requests)]
+            result, _ = await run_scenario(client, "me", me, concurrency, ok=200)
+            results.append(result)
+
+            r = await client.post("/auth/login", json={"email": emails[0], "password": PASSWORD})
+            admin_token = r.json()["access_token"]
+            users = [Call("GET", "/users?limit=50", token=admin_token)] * requests
+            result, _ = await run_scenario(client, "list_users", users, concurrency, ok=200)
+            results.append(result)
+    finally:
+        if not keep:
+            await delete_bench_data(prefix)
+        await engine.dispose()
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the auth and user endpoints in process.")
+    parser.add_argument("--requests", type=int, default=200, help="calls per scenario (and users created)")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent clients")
+    parser.add_argument("--json", help="write machine-readable results to this file")
+    parser.add_argument("--keep", action="store_true", help="keep the users created by the run")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(args.requests, args.concurrency, args.keep))
+    print_table(results)
+    if args.json:
+        params = {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "hasher": {
+                "time_cost": hasher_settings.TIME_COST,
+                "memory_cost_kb": hasher_settings.MEMORY_COST_KB,
+                "pool_kind": hasher_settings.POOL_KIND,
+                "pool_workers": hasher_settings.POOL_WORKERS,
+            },
+            "db_pool_size": db_settings.POOL_SIZE,
+        }
+        write_json(args.json, "http", params, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Large-table benchmarks of the repository queries.
+
+Times the hot queries directly against the configured database, without HTTP or caches:
+
+* list_paginated at growing offsets (and list_after from the same positions, for comparison),
+* get_by_email and get_latest_for_user for random users,
+* cleanup_unverified batches, inside a transaction that is rolled back, so the data survives,
+* get_by_id and a 200-row list_after read as column rows (the repository) vs as hydrated ORM
+  objects (the previous path), same queries otherwise.
+
+Seed the tables first with benchmarks.seed and rerun at each scale; the table sizes are stored
+with the results:
+
+    python -m benchmarks.seed --users 1000000 --reset
+    python -m benchmarks.repo_bench --json bench/repo-1m.json
+"""
+
+import argparse
+import asyncio
+import datetime as dt
+import random
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import select, text
+
+from benchmarks.report import ScenarioResult, print_table, summarize, write_json
+from src.configs.celery_beat import celery_beat_settings
+from src.domain.value_objects.email_address import EmailAddress
+from src.infrastructure.db.base import async_session_maker, engine
+from src.infrastructure.db.models.user import UserORM
+from src.infrastructure.db.repositories.user_repo import UserRepository
+from src.infrastructure.db.repositories.verification_repository import VerificationRepository
+from src.infrastructure.tasks.cleanup import _delete_batch
+
+OFFSETS = (0, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+PAGE_SIZE = 50
+LIST_SIZE = 200
+
+
+async def timed(name: str, calls: int, fn: Callable[[int], Awaitable[object]]) -> ScenarioResult:
+    """Await fn(i) `calls` times one after another."""
+    latencies = []
+    started = time.perf_counter()
+    for i in range(calls):
+        start = time.perf_counter()
+        await fn(i)
+        latencies.append(time.perf_counter() - start)
+    return summarize(name, latencies, time.perf_counter() - started, concurrency=1)
+
+
+async def table_sizes() -> dict[str, int]:
+    async with async_session_maker() as s:
+        users = (await s.execute(text("SELECT count(*) FROM users"))).scalar_one()
+        unverified = (await s.execute(text("SELECT count(*) FROM users WHERE NOT is_verified"))).scalar_one()
+        # An estimate is enough for the biggest table; ANALYZE (done by the seeder) keeps it close.
+        verifications = (
+            await s.execute(text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'verifications'"))
+        ).scalar_one()
+    return {"users": users, "unverified_users": unverified, "verifications_estimate": max(verifications, 0)}
+
+
+async def sample_users(n: int, rnd: random.Random) -> list[tuple[int, str]]:
+    """Up to n random (id, email) pairs, found by probing random ids."""
+    async with async_session_maker() as s:
+        lo, hi = (await s.execute(text("SELECT min(id), max(id) FROM users"))).one()
+        if lo is None:
+            return []
+        probes = [rnd.randint(lo, hi) for _ in range(n * 2)]
+        rows = await s.execute(text("SELECT id, email FROM users WHERE id = ANY(:ids) LIMIT :n"), {"ids": probes, "n": n})
+        return [(r.id, r.email) for r in rows]
+
+
+async def bench_pagination(users: int, repeats: int) -> list[ScenarioResult]:
+    results = []
+    async with async_session_maker() as s:
+        repo = UserRepository(s)
+        for offset in (o for o in OFFSETS if o < users):
+            paginated = await timed(
+                f"list_paginated@{offset}", repeats, lambda _, o=offset: repo.list_paginated(o, PAGE_SIZE)
+            )
+            results.append(paginated)
+            after = (await s.execute(text("SELECT id FROM users ORDER BY id OFFSET :o LIMIT 1"), {"o": offset})).scalar()
+            results.append(await timed(f"list_after@{offset}", repeats, lambda _, a=after: repo.list_after(a, PAGE_SIZE)))
+    return results
+
+
+async def bench_point_lookups(sample: list[tuple[int, str]]) -> list[ScenarioResult]:
+    async with async_session_maker() as s:
+        users, verifications = UserRepository(s), VerificationRepository(s)
+        return [
+            await timed("get_by_email", len(sample), lambda i: users.get_by_email(EmailAddress(sample[i][1]))),
+            await timed("get_latest_for_user", len(sample), lambda i: verifications.get_latest_for_user(sample[i][0])),
+        ]
+
+
+async def bench_hydration(sample: list[tuple[int, str]]) -> list[ScenarioResult]:
+    """Column rows vs ORM objects; the session is cleared after every ORM read, as a request's session would be."""
+    ids = [user_id for user_id, _ in sample]
+    async with async_session_maker() as s:
+        repo = UserRepository(s)
+
+        async def orm_get(i: int) -> None:
+            UserRepository._to_domain(await s.get(UserORM, ids[i]))
+            s.expunge_all()
+
+        async def orm_list(i: int) -> None:
+            stmt = select(UserORM).where(UserORM.id > ids[i]).order_by(UserORM.id).limit(LIST_SIZE)
+            [UserRepository._to_domain(o) for o in (await s.execute(stmt)).scalars()]
+            s.expunge_all()
+
+        return [
+            await timed("get_by_id[orm]", len(ids), orm_get),
+            await timed("get_by_id[rows]", len(ids), lambda i: repo.get_by_id(ids[i])),
+            await timed(f"list_after{LIST_SIZE}[orm]", len(ids), orm_list),
+            await timed(f"list_after{LIST_SIZE}[rows]", len(ids), lambda i: repo.list_after(ids[i], LIST_SIZE)),
+        ]
+
+
+async def bench_cleanup(max_batches: int) -> list[ScenarioResult]:
+    """Time cleanup_unverified batches in one transaction and roll it back."""
+    cutoff = dt.datetime.now() - dt.timedelta(days=celery_beat_settings.UNVERIFIED_TTL_DAYS)
+    latencies: list[float] = []
+    deleted_total = 0
+    started = time.perf_counter()
+    async with async_session_maker() as s:
+        cursor = None
+        for _ in range(max_batches):
+            start = time.perf_counter()
+            deleted, cursor = await _delete_batch(s, cutoff, cursor)
+            latencies.append(time.perf_counter() - start)
+            deleted_total += len(deleted)
+            if len(deleted) < celery_beat_settings.CLEANUP_BATCH_SIZE:
+                break
+        await s.rollback()
+    elapsed = time.perf_counter() - started
+    result = summarize("cleanup_batch", latencies, elapsed, concurrency=1)
+    result.extra = {"batch_size": celery_beat_settings.CLEANUP_BATCH_SIZE, "rows_per_sec": round(deleted_total / elapsed)}
+    return [result]
+
+
+async def run(
+    samples: int, repeats: int, cleanup_batches: int, rnd_seed: int
+) -> tuple[dict[str, int], list[ScenarioResult]]:
+    try:
+        sizes = await table_sizes()
+        print(f"tables: {sizes}")
+        results = await bench_pagination(sizes["users"], repeats)
+        sample = await sample_users(samples, random.Random(rnd_seed))
+        results += await bench_point_lookups(sample)
+        results += await bench_hydration(sample)
+        results += await bench_cleanup(cleanup_batches)
+    finally:
+        await engine.dispose()
+    return sizes, results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark repository queries on large tables.")
+    parser.add_argument("--samples", type=int, default=500, help="random users for the point lookups")
+    parser.add_argument("--repeats", type=int, default=20, help="calls per pagination offset")
+    parser.add_argument("--cleanup-batches", type=int, default=20, help="cleanup batches to time (rolled back)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="write machine-readable results to this file")
+    args = parser.parse_args(argv)
+
+    sizes, results = asyncio.run(run(args.samples, args.repeats, args.cleanup_batches, args.seed))
+    print_table(results)
+    if args.json:
+        params = {"tables": sizes, "samples": args.samples, "repeats": args.repeats, "page_size": PAGE_SIZE}
+        write_json(args.json, "repo", params, results)
+
+
+if __name__ == "__main__":
+    main()
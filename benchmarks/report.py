@@ -0,0 +1,94 @@
+"""Shared result summaries and JSON output for the benchmark scripts."""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+
+@dataclass(slots=True)
+class ScenarioResult:
+    """Latency summary of one benchmark scenario (times in milliseconds)."""
+
+    name: str
+    requests: int
+    concurrency: int
+    elapsed_sec: float
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    max_ms: float
+    errors: int = 0
+    statuses: dict[str, int] = field(default_factory=dict)
+    extra: dict[str, float] = field(default_factory=dict)
+
+
+def summarize(
+    name: str,
+    latencies_sec: list[float],
+    elapsed_sec: float,
+    concurrency: int,
+    errors: int = 0,
+    statuses: dict[str, int] | None = None,
+    extra: dict[str, float] | None = None,
+) -> ScenarioResult:
+    """Build a ScenarioResult from per-call latencies."""
+    ms = sorted(x * 1000 for x in latencies_sec) or [0.0]
+    cuts = statistics.quantiles(ms, n=100, method="inclusive") if len(ms) > 1 else ms * 99
+    return ScenarioResult(
+        name=name,
+        requests=len(latencies_sec),
+        concurrency=concurrency,
+        elapsed_sec=round(elapsed_sec, 3),
+        throughput_rps=round(len(latencies_sec) / elapsed_sec, 1) if elapsed_sec else 0.0,
+        p50_ms=round(cuts[49], 2),
+        p95_ms=round(cuts[94], 2),
+        p99_ms=round(cuts[98], 2),
+        mean_ms=round(statistics.fmean(ms), 2),
+        max_ms=round(ms[-1], 2),
+        errors=errors,
+        statuses=statuses or {},
+        extra=extra or {},
+    )
+
+
+def print_table(results: list[ScenarioResult]) -> None:
+    """Print a human-readable summary."""
+    header = f"{'scenario':<22}{'n':>7}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}  extra"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        extra = " ".join(f"{k}={v:g}" for k, v in r.extra.items())
+        print(
+            f"{r.name:<22}{r.requests:>7}{r.throughput_rps:>10.1f}{r.p50_ms:>10.2f}{r.p95_ms:>10.2f}{r.p99_ms:>10.2f}"
+            f"{r.errors:>8}  {extra}"
+        )
+
+
+def write_json(path: str, suite: str, params: dict, results: list[ScenarioResult]) -> None:
+    """Write results with enough context (commit, host, parameters) to compare runs."""
+    doc = {
+        "suite": suite,
+        "commit": _git_commit(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "host": {"python": platform.python_version(), "machine": platform.machine(), "cpus": os.cpu_count()},
+        "params": params,
+        "results": [asdict(r) for r in results],
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(doc, indent=2) + "\n")
+    print(f"results written to {path}")
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
@@ -0,0 +1,161 @@
+"""
+Synthetic data generator for large-table benchmarks.
+
+Loads users and their verification rows straight into the configured database with COPY, in
+chunks, so millions of rows take minutes rather than hours:
+
+    python -m benchmarks.seed --users 1000000 --verifications-per-user 10 --verified-ratio 0.7
+
+* Passwords are a handful of Argon2 hashes computed once with the current HASHER_* settings, so
+  seeded users can log in (password: `seed-password-<n>`, n = user number % --distinct-hashes).
+* `created_at` is spread over the last --days days, so a share of the unverified users is older
+  than CELERY_BEAT_UNVERIFIED_TTL_DAYS and is picked up by cleanup_unverified.
+* Each user gets 0..2x --verifications-per-user verification rows (the average is the given
+  value), the newest one consumed for verified users.
+
+Seeded emails start with --prefix, which `--reset` uses to remove a previous run first. Run
+ANALYZE (done at the end) before benchmarking, or the planner works from stale statistics.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+
+import asyncpg
+
+from src.configs.database import settings as db_settings
+from src.domain.value_objects.user_role import UserRole
+from src.domain.value_objects.verification_channel import VerificationChannel
+from src.infrastructure.security.argon2_password_hasher import hasher
+
+USER_COLUMNS = ("email", "password", "first_name", "last_name", "is_verified", "role", "created_at", "updated_at")
+VERIFICATION_COLUMNS = ("user_id", "code", "channel", "created_at", "updated_at", "expires_at", "consumed_at")
+FIRST_NAMES = ("Ada", "Alan", "Grace", "Linus", "Barbara", "Ken", "Edsger", "Margaret", "Dennis", "Frances", None)
+LAST_NAMES = ("Lovelace", "Turing", "Hopper", "Torvalds", "Liskov", "Thompson", "Dijkstra", "Hamilton", "Ritchie", None)
+DOMAINS = ("example.com", "example.org", "mail.test", "coffee.test")
+VERIFICATION_TTL = timedelta(minutes=15)
+
+
+def raw_dsn() -> str:
+    """asyncpg DSN of the configured database."""
+    return db_settings.DSN.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+def user_rows(
+    prefix: str, start: int, count: int, verified_ratio: float, days: int, hashes: list[str], rnd: random.Random
+) -> Iterator[tuple]:
+    now = datetime.now()
+    for n in range(start, start + count):
+        created_at = now - timedelta(seconds=rnd.uniform(0, days * 86400))
+        yield (
+            f"{prefix}{n}@{DOMAINS[n % len(DOMAINS)]}",
+            hashes[n % len(hashes)],
+            rnd.choice(FIRST_NAMES),
+            rnd.choice(LAST_NAMES),
+            rnd.random() < verified_ratio,
+            UserRole.USER.name,
+            created_at,
+            created_at,
+        )
+
+
+def verification_rows(users: list[asyncpg.Record], per_user: float, rnd: random.Random) -> Iterator[tuple]:
+    for user in users:
+        count = rnd.randint(0, round(2 * per_user))
+        created_at = user["created_at"]
+        for i in range(count):
+            created_at += timedelta(seconds=rnd.uniform(1, 3600))
+            consumed_at = created_at + timedelta(seconds=30) if user["is_verified"] and i == count - 1 else None
+            yield (
+                user["id"],
+                f"{rnd.getrandbits(24):06x}",
+                VerificationChannel.EMAIL.name,
+                created_at,
+                created_at,
+                created_at + VERIFICATION_TTL,
+                consumed_at,
+            )
+
+
+async def seed(
+    users: int,
+    verifications_per_user: float,
+    verified_ratio: float,
+    days: int,
+    prefix: str,
+    chunk_size: int,
+    distinct_hashes: int,
+    reset: bool,
+    rnd_seed: int,
+) -> None:
+    rnd = random.Random(rnd_seed)
+    hashes = list(await asyncio.gather(*(hasher.hash_async(f"seed-password-{i}") for i in range(distinct_hashes))))
+    conn = await asyncpg.connect(raw_dsn())
+    try:
+        if reset:
+            deleted = await conn.execute("DELETE FROM users WHERE email LIKE $1", f"{prefix}%")
+            print(f"reset: {deleted}")
+
+        started = time.perf_counter()
+        total_verifications = 0
+        for start in range(0, users, chunk_size):
+            count = min(chunk_size, users - start)
+            async with conn.transaction():
+                await conn.copy_records_to_table(
+                    "users",
+                    records=user_rows(prefix, start, count, verified_ratio, days, hashes, rnd),
+                    columns=USER_COLUMNS,
+                )
+                # COPY returns no ids: read back the users just loaded to hang verifications off them.
+                emails = [f"{prefix}{n}@{DOMAINS[n % len(DOMAINS)]}" for n in range(start, start + count)]
+                loaded = await conn.fetch(
+                    "SELECT id, created_at, is_verified FROM users WHERE email = ANY($1::varchar[])", emails
+                )
+                rows = list(verification_rows(loaded, verifications_per_user, rnd))
+                await conn.copy_records_to_table("verifications", records=rows, columns=VERIFICATION_COLUMNS)
+            total_verifications += len(rows)
+            done = start + count
+            rate = done / (time.perf_counter() - started)
+            print(f"  {done}/{users} users, {total_verifications} verifications ({rate:,.0f} users/s)", flush=True)
+
+        print("analyzing ...", flush=True)
+        await conn.execute("ANALYZE users")
+        await conn.execute("ANALYZE verifications")
+        print(f"seeded {users} users and {total_verifications} verifications in {time.perf_counter() - started:.1f}s")
+    finally:
+        await conn.close()
+        hasher.pool.shutdown()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Bulk-generate users and verifications for benchmarks.")
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--verifications-per-user", type=float, default=3.0, help="average rows per user")
+    parser.add_argument("--verified-ratio", type=float, default=0.8)
+    parser.add_argument("--days", type=int, default=30, help="spread created_at over this many days")
+    parser.add_argument("--prefix", default="seed-", help="email prefix of seeded users")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="users per COPY transaction")
+    parser.add_argument("--distinct-hashes", type=int, default=8, help="Argon2 hashes computed up front")
+    parser.add_argument("--reset", action="store_true", help="delete users with --prefix first")
+    parser.add_argument("--seed", type=int, default=42, help="random seed (same seed, same data)")
+    args = parser.parse_args(argv)
+    asyncio.run(
+        seed(
+            users=args.users,
+            verifications_per_user=args.verifications_per_user,
+            verified_ratio=args.verified_ratio,
+            days=args.days,
+            prefix=args.prefix,
+            chunk_size=args.chunk_size,
+            distinct_hashes=args.distinct_hashes,
+            reset=args.reset,
+            rnd_seed=args.seed,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
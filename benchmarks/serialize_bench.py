@@ -0,0 +1,95 @@
+"""
+Serialization cost of a GET /users page, without I/O.
+
+Compares, for the same --rows entities:
+
+* fastapi: the route returns a UserPageDTO, FastAPI dumps it, re-validates it against the
+  response model and encodes it with the stdlib json (the path before DTOResponse),
+* dto: the route returns DTOResponse(UserPageDTO(...)), encoded once by pydantic-core.
+
+    python -m benchmarks.serialize_bench --rows 200
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from starlette.responses import JSONResponse
+
+from benchmarks.report import print_table, summarize, write_json
+from src.application.dto.user import UserOutDTO, UserPageDTO
+from src.domain.entities.user import UserEntity
+from src.domain.value_objects.email_address import EmailAddress
+from src.domain.value_objects.user_role import UserRole
+from src.ui.api.responses import DTOResponse
+
+
+def make_users(rows: int) -> list[UserEntity]:
+    now = datetime.now()
+    return [
+        UserEntity(
+            id=i,
+            created_at=now,
+            updated_at=None,
+            email=EmailAddress(f"user-{i}@example.com"),
+            password="x",
+            first_name="Ada",
+            last_name=None if i % 3 else "Lovelace",
+            is_verified=bool(i % 2),
+            role=UserRole.USER,
+        )
+        for i in range(rows)
+    ]
+
+
+def _page(users: list[UserEntity]) -> UserPageDTO:
+    return UserPageDTO(items=[UserOutDTO.from_entity(u) for u in users], next_cursor="abc")
+
+
+async def fastapi_path(users: list[UserEntity], field: object) -> bytes:
+    content = await serialize_response(field=field, response_content=_page(users), is_coroutine=True)
+    return JSONResponse(content).body
+
+
+async def dto_path(users: list[UserEntity]) -> bytes:
+    return DTOResponse(_page(users)).body
+
+
+async def run(rows: int, iterations: int) -> list:
+    users = make_users(rows)
+    field = create_model_field(name="Response_list_users", type_=UserPageDTO, mode="serialization")
+    if await fastapi_path(users, field) != await dto_path(users):
+        raise RuntimeError("the two paths disagree on the response body")
+
+    results = []
+    for name, call in (("fastapi", lambda: fastapi_path(users, field)), ("dto", lambda: dto_path(users))):
+        latencies = []
+        started = time.perf_counter()
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - start)
+        result = summarize(name, latencies, time.perf_counter() - started, concurrency=1)
+        result.extra = {"us_per_row": round(sorted(latencies)[len(latencies) // 2] / rows * 1e6, 2)}
+        results.append(result)
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare response serialization paths for a page of users.")
+    parser.add_argument("--rows", type=int, default=200, help="users per page")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--json", help="write machine-readable results to this file")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(args.rows, args.iterations))
+    print_table(results)
+    if args.json:
+        write_json(args.json, "serialize", {"rows": args.rows, "iterations": args.iterations}, results)
+
+
+if __name__ == "__main__":
+    main()
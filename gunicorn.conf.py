@@ -0,0 +1,10 @@
+# Gunicorn loads ./gunicorn.conf.py automatically; command line flags are in start_app.sh.
+from gunicorn.arbiter import Arbiter
+from gunicorn.workers.base import Worker
+
+
+def child_exit(_server: Arbiter, worker: Worker) -> None:
+    """Drop the live gauges of an exited worker from the Prometheus multiprocess directory."""
+    from src.infrastructure.monitoring.metrics import mark_process_dead
+
+    mark_process_dead(worker.pid)
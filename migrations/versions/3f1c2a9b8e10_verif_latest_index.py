@@ -0,0 +1,46 @@
+"""verification latest-code index
+
+Revision ID: 3f1c2a9b8e10
+Revises: 7d8904ccdbc1
+Create Date: 2026-10-18 10:12:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9b8e10'
+down_revision: Union[str, Sequence[str], None] = '7d8904ccdbc1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Matches the "latest code for user" lookup (ORDER BY created_at DESC, id DESC LIMIT 1) exactly.
+    # Built CONCURRENTLY so signups/verifications are not blocked on a large table.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_verif_user_latest',
+            'verifications',
+            ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_verif_user_created', table_name='verifications', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_verif_user_created',
+            'verifications',
+            ['user_id', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_verif_user_latest', table_name='verifications', postgresql_concurrently=True)
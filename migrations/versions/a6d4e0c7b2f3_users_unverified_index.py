@@ -0,0 +1,37 @@
+"""partial index for unverified users cleanup
+
+Revision ID: a6d4e0c7b2f3
+Revises: 3f1c2a9b8e10
+Create Date: 2026-10-18 12:03:47.918254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d4e0c7b2f3'
+down_revision: Union[str, Sequence[str], None] = '3f1c2a9b8e10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_unverified_created',
+            'users',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_where=sa.text('NOT is_verified'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_unverified_created', table_name='users', postgresql_concurrently=True)
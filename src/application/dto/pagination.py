@@ -0,0 +1,24 @@
+import base64
+import binascii
+import json
+
+from src.domain.exceptions import InvalidCursorError
+
+
+def encode_cursor(last_id: int) -> str:
+    """Return an opaque cursor pointing right after `last_id`."""
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """Return the last seen id encoded in `cursor`; raise InvalidCursorError if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        last_id = json.loads(raw)["id"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as err:
+        raise InvalidCursorError() from err
+    # bool is an int subclass: a forged {"id": true} must not decode to id 1.
+    if not isinstance(last_id, int) or isinstance(last_id, bool) or last_id < 0:
+        raise InvalidCursorError()
+    return last_id
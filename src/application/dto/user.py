@@ -1,7 +1,13 @@
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Literal
 
+from pydantic import BaseModel, Field, model_validator
+
+from src.domain.entities.user import UserEntity
 from src.domain.value_objects.user_role import UserRole
 
+MAX_BATCH_IDS = 10_000
+
 
 class UserOutDTO(BaseModel):
     id: int
@@ -11,6 +17,17 @@ class UserOutDTO(BaseModel):
     is_verified: bool
     role: UserRole
 
+    @classmethod
+    def from_entity(cls, user: UserEntity) -> "UserOutDTO":
+        return cls(
+            id=user.id,
+            email=user.email.as_str(),
+            first_name=user.first_name,
+            last_name=user.last_name,
+            is_verified=user.is_verified,
+            role=user.role,
+        )
+
 
 class UserCreateDTO(BaseModel):
     email: str
@@ -18,9 +35,58 @@ class UserCreateDTO(BaseModel):
     first_name: str | None = None
     last_name: str | None = None
     role: UserRole
+    is_verified: bool = False
 
 
 class UserUpdateDTO(BaseModel):
     first_name: str | None = None
     last_name: str | None = None
     role: UserRole | None = None
+
+
+class UserPageDTO(BaseModel):
+    items: list[UserOutDTO]
+    next_cursor: str | None = None
+
+
+class UserFilterDTO(BaseModel):
+    role: UserRole | None = None
+    is_verified: bool | None = None
+    created_before: datetime | None = None
+    created_after: datetime | None = None
+    email_domain: str | None = Field(None, description="Matches emails ending with `@<email_domain>`")
+
+
+class UserBatchSelectionDTO(BaseModel):
+    """Users to act on: explicit `ids` or a non-empty `filter`, not both."""
+
+    ids: list[int] | None = Field(None, min_length=1, max_length=MAX_BATCH_IDS)
+    filter: UserFilterDTO | None = None
+
+    @model_validator(mode="after")
+    def _one_selector(self) -> "UserBatchSelectionDTO":
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("exactly one of ids or filter is required")
+        if self.filter is not None and not self.filter.model_dump(exclude_none=True):
+            raise ValueError("filter must set at least one field")
+        return self
+
+
+class UserBatchUpdateDTO(UserBatchSelectionDTO):
+    changes: UserUpdateDTO
+
+    @model_validator(mode="after")
+    def _some_changes(self) -> "UserBatchUpdateDTO":
+        if not self.changes.model_dump(exclude_unset=True):
+            raise ValueError("changes must set at least one field")
+        return self
+
+
+class UserBatchItemDTO(BaseModel):
+    id: int
+    status: Literal["updated", "deleted", "not_found", "skipped"]
+
+
+class UserBatchResultDTO(BaseModel):
+    affected: int
+    results: list[UserBatchItemDTO]
@@ -0,0 +1,63 @@
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from src.domain.exceptions import InvalidEmailAddressError
+from src.domain.value_objects.email_address import EmailAddress
+from src.domain.value_objects.user_role import UserRole
+
+MAX_REPORTED = 1000  # per list in UserImportReportDTO; counts are always exact
+
+
+class UserImportRowDTO(BaseModel):
+    """
+    One user of a bulk import: either a raw `password` or an Argon2 `password_hash`.
+    """
+
+    email: str
+    password: str | None = Field(None, min_length=8)
+    password_hash: str | None = Field(None, pattern=r"^\$argon2(id|i|d)\$")
+    first_name: str | None = Field(None, max_length=120)
+    last_name: str | None = Field(None, max_length=120)
+    role: UserRole = UserRole.USER
+    is_verified: bool = True  # migrated accounts were already verified by the source system
+
+    @field_validator("email")
+    @classmethod
+    def _normalize_email(cls, value: str) -> str:
+        try:
+            return EmailAddress(value).as_str()
+        except InvalidEmailAddressError as err:
+            raise ValueError(err.message) from err
+
+    @field_validator("password", "password_hash", "first_name", "last_name", mode="before")
+    @classmethod
+    def _blank_to_none(cls, value: object) -> object:
+        return None if value == "" else value  # empty CSV cells
+
+    @model_validator(mode="after")
+    def _one_password(self) -> "UserImportRowDTO":
+        if (self.password is None) == (self.password_hash is None):
+            raise ValueError("exactly one of password or password_hash is required")
+        return self
+
+
+class UserImportErrorDTO(BaseModel):
+    line: int
+    error: str
+
+
+class UserImportReportDTO(BaseModel):
+    inserted: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    duplicate_emails: list[str] = []
+    invalid_rows: list[UserImportErrorDTO] = []
+
+    def add_duplicate(self, email: str) -> None:
+        self.duplicates += 1
+        if len(self.duplicate_emails) < MAX_REPORTED:
+            self.duplicate_emails.append(email)
+
+    def add_invalid(self, line: int, error: str) -> None:
+        self.invalid += 1
+        if len(self.invalid_rows) < MAX_REPORTED:
+            self.invalid_rows.append(UserImportErrorDTO(line=line, error=error))
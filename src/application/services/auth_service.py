@@ -1,12 +1,12 @@
 import secrets
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from src.application.dto.user import UserCreateDTO
 from src.domain.entities.user import UserEntity
-from src.domain.entities.verification import VerificationEntity
 from src.domain.exceptions import (
     EmailAlreadyTakenError,
     InvalidCredentialsError,
+    ServiceBusyError,
     UserNotFoundError,
     UserNotVerifiedError,
     VerificationCodeInvalidError,
@@ -15,6 +15,7 @@ from src.domain.interfaces.uow import IUnitOfWork
 from src.domain.ports.password_hasher import PasswordHasher
 from src.domain.ports.token_provider import TokenProvider
 from src.domain.value_objects.email_address import EmailAddress
+from src.domain.value_objects.outbox_kind import OutboxKind
 from src.domain.value_objects.user_role import UserRole
 from src.domain.value_objects.verification_channel import VerificationChannel
 
@@ -31,45 +32,61 @@ class AuthService:
         self.verif_ttl_min = verif_ttl_min
 
     async def signup(self, email: str, password: str, first: str | None, last: str | None) -> UserEntity:
-        """Create a new unverified user and issue a verification code."""
+        """Create a new unverified user and queue a verification code email in the same transaction."""
+        # Hash before opening the transaction so no pooled connection is held while Argon2 runs.
+        password_hash = await self.hasher.hash_async(password)
+        user = UserCreateDTO(
+            email=EmailAddress(email).as_str(),
+            password=password_hash,
+            first_name=first,
+            last_name=last,
+            role=UserRole.USER,
+        )
+        now = datetime.now()
+        code = secrets.token_hex(3)  # 6 hex chars
+        verification = {
+            "code": code,
+            "channel": VerificationChannel.EMAIL,
+            "created_at": now,
+            "expires_at": now + timedelta(minutes=self.verif_ttl_min),
+        }
+        outbox = {"kind": OutboxKind.VERIFICATION_EMAIL, "payload": {"to": user.email, "code": code}}
         async with self.uow as uow:
-            if await uow.users.get_by_email(EmailAddress(email)):
-                raise EmailAlreadyTakenError(f"Email {email} is already taken")
-            now = datetime.now()
-            user = UserCreateDTO(
-                email=EmailAddress(email).as_str(),
-                password=self.hasher.hash(password),
-                first_name=first,
-                last_name=last,
-                role=UserRole.USER,
-            )
-            user = await uow.users.add(user.model_dump())
-
-            code = secrets.token_hex(3)  # 6 hex chars
-            ver = VerificationEntity.new(
-                user_id=user.id, code=code, channel=VerificationChannel.EMAIL, ttl_minutes=self.verif_ttl_min, now=now
-            )
-            await uow.verifications.add(ver)
-            return user
+            created = await uow.users.add_with_verification(user.model_dump(), verification, outbox)
+        if created is None:
+            raise EmailAlreadyTakenError(f"Email {email} is already taken")
+        return created
 
     async def login(self, email: str, password: str) -> tuple[str, str]:
         """Validate credentials and return (access, refresh) tokens."""
-        async with self.uow as uow:
-            user = await uow.users.get_by_email(EmailAddress(email))
-            if not user:
-                raise InvalidCredentialsError("Invalid email or password")
-            if not self.hasher.verify(password, user.password):
-                raise InvalidCredentialsError("Invalid email or password")
-            if not user.is_verified:
-                raise UserNotVerifiedError("User must be verified before login")
+        # Primary only: login right after /auth/verify must see is_verified.
+        async with self.uow.read_only(use_replica=False) as uow:
+            user = await uow.users.get_by_email(EmailAddress(email), include_password=True)
+        if not user:
+            raise InvalidCredentialsError("Invalid email or password")
+        if not await self.hasher.verify_async(password, user.password):
+            raise InvalidCredentialsError("Invalid email or password")
+        if not user.is_verified:
+            raise UserNotVerifiedError("User must be verified before login")
+        if self.hasher.needs_rehash(user.password):
+            await self._rehash(user.id, password)
 
-            access = self.tokens.issue_access(str(user.id), {"role": user.role.value})
-            refresh = self.tokens.issue_refresh(str(user.id))
-            return access, refresh
+        access = self.tokens.issue_access(str(user.id), {"role": user.role.value})
+        refresh = self.tokens.issue_refresh(str(user.id))
+        return access, refresh
+
+    async def _rehash(self, user_id: int, password: str) -> None:
+        """Upgrade a stored hash to the current hasher parameters (best effort, never fails login)."""
+        try:
+            password_hash = await self.hasher.hash_async(password)
+        except ServiceBusyError:
+            return  # try again on a later login
+        async with self.uow as uow:
+            await uow.users.update(user_id=user_id, data={"password": password_hash})
 
     async def refresh(self, subject: str) -> str:
         """Issue a new access token for given subject id."""
-        async with self.uow as uow:
+        async with self.uow.read_only() as uow:
             user = await uow.users.get_by_id(int(subject))
             if not user:
                 raise UserNotFoundError("Subject not found")
@@ -78,16 +95,9 @@ class AuthService:
     async def verify(self, email: str, code: str) -> None:
         """Confirm verification by code."""
         async with self.uow as uow:
-            user = await uow.users.get_by_email(EmailAddress(email))
-            if not user:
-                raise UserNotFoundError("User not found")
-
-            latest = await uow.verifications.get_latest_for_user(user.id)
-            now = datetime.now()
-            if not latest or latest.code != code or latest.is_expired(now) or latest.is_consumed():
-                raise VerificationCodeInvalidError("Invalid or expired verification code")
-
-            latest.consume(now)
-            await uow.verifications.mark_consumed(latest)
-            user.verify()
-            await uow.users.update(user_id=user.id, data={"is_verified": user.is_verified})
+            result = await uow.users.verify_with_code(EmailAddress(email), code, datetime.now())
+        if result is None:
+            raise UserNotFoundError("User not found")
+        _, verified = result
+        if not verified:
+            raise VerificationCodeInvalidError("Invalid or expired verification code")
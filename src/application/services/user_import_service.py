@@ -0,0 +1,89 @@
+import asyncio
+from collections.abc import AsyncIterable
+
+from pydantic import ValidationError
+
+from src.application.dto.user_import import UserImportReportDTO, UserImportRowDTO
+from src.domain.interfaces.uow import IUnitOfWork
+from src.domain.ports.password_hasher import PasswordHasher
+
+
+class UserImportService:
+    """
+    Bulk user import (migration from other systems).
+
+    Rows are validated and hashed batch by batch; each batch is loaded in its own transaction while
+    the next one is being hashed. Rows whose email already exists are skipped and reported.
+    """
+
+    def __init__(self, uow: IUnitOfWork, hasher: PasswordHasher, batch_size: int = 5000) -> None:
+        self.uow = uow
+        self.hasher = hasher
+        self.batch_size = batch_size
+
+    async def import_users(self, rows: AsyncIterable[tuple[int, object]]) -> UserImportReportDTO:
+        """Import `(line_number, raw_row)` pairs and return what was inserted, skipped and rejected."""
+        report = UserImportReportDTO()
+        loading: asyncio.Task | None = None
+        batch: list[tuple[int, object]] = []
+        try:
+            async for row in rows:
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    records = await self._prepare(batch, report)
+                    if loading is not None:
+                        await loading
+                    loading = asyncio.create_task(self._load(records, report))
+                    batch = []
+            records = await self._prepare(batch, report)
+            if loading is not None:
+                await loading
+            await self._load(records, report)
+        finally:
+            if loading is not None and not loading.done():
+                loading.cancel()
+        return report
+
+    async def _prepare(self, batch: list[tuple[int, object]], report: UserImportReportDTO) -> list[dict]:
+        rows: dict[str, UserImportRowDTO] = {}
+        for line, raw in batch:
+            try:
+                row = UserImportRowDTO.model_validate(raw)
+            except ValidationError as err:
+                report.add_invalid(line, _describe(err))
+                continue
+            if row.email in rows:
+                report.add_duplicate(row.email)
+                continue
+            rows[row.email] = row
+
+        to_hash = [row for row in rows.values() if row.password is not None]
+        hashes = await self.hasher.hash_many_async([row.password for row in to_hash])
+        for row, password_hash in zip(to_hash, hashes, strict=True):
+            row.password_hash = password_hash
+
+        return [
+            {
+                "email": row.email,
+                "password": row.password_hash,
+                "first_name": row.first_name,
+                "last_name": row.last_name,
+                "is_verified": row.is_verified,
+                "role": row.role,
+            }
+            for row in rows.values()
+        ]
+
+    async def _load(self, records: list[dict], report: UserImportReportDTO) -> None:
+        if not records:
+            return
+        async with self.uow as uow:
+            inserted = set(await uow.users.bulk_insert(records))
+        report.inserted += len(inserted)
+        for record in records:
+            if record["email"] not in inserted:
+                report.add_duplicate(record["email"])
+
+
+def _describe(err: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, e['loc'])) or 'row'}: {e['msg']}" for e in err.errors())
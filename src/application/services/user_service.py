@@ -1,9 +1,11 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 
-from src.application.dto.user import UserUpdateDTO
+from src.application.dto.pagination import decode_cursor, encode_cursor
+from src.application.dto.user import MAX_BATCH_IDS, UserUpdateDTO
 from src.domain.entities.user import UserEntity
-from src.domain.exceptions import UserNotFoundError
+from src.domain.exceptions import BatchTooLargeError, ConflictingPaginationError, UserNotFoundError
 from src.domain.interfaces.uow import IUnitOfWork
+from src.domain.value_objects.user_filter import UserFilter
 
 
 class UserService:
@@ -16,20 +18,47 @@ class UserService:
 
     async def me(self, user_id: int) -> UserEntity:
         """Return current user entity."""
-        async with self.uow as uow:
+        async with self.uow.read_only() as uow:
             user = await uow.users.get_by_id(user_id)
             if not user:
                 raise UserNotFoundError("User not found")
             return user
 
-    async def list_users(self, offset: int, limit: int) -> Sequence[UserEntity]:
-        """Return a page of users."""
-        async with self.uow as uow:
-            return await uow.users.list_paginated(offset, limit)
+    async def list_users(
+        self, limit: int, cursor: str | None = None, offset: int | None = None
+    ) -> tuple[Sequence[UserEntity], str | None]:
+        """
+        Return a page of users and the cursor of the next page (None on the last page).
+
+        Pages are keyed on id by default; `offset` is a legacy fallback that gets slower on deep pages.
+        Passing both is refused rather than silently preferring one.
+        """
+        if cursor is not None and offset is not None:
+            raise ConflictingPaginationError()
+        async with self.uow.read_only() as uow:
+            if offset is not None:
+                users = await uow.users.list_paginated(offset, limit + 1)
+            else:
+                after_id = decode_cursor(cursor) if cursor else None
+                users = await uow.users.list_after(after_id, limit + 1)
+        if len(users) <= limit:
+            return users, None
+        users = users[:limit]
+        return users, encode_cursor(users[-1].id)
+
+    async def export_users(self, batch_size: int = 1000) -> AsyncIterator[UserEntity]:
+        """
+        Yield every user ordered by id.
+
+        Rows come from a server-side cursor, so the transaction stays open until the iterator is exhausted or closed.
+        """
+        async with self.uow.read_only() as uow:
+            async for user in uow.users.stream_all(batch_size):
+                yield user
 
     async def get_user(self, user_id: int) -> UserEntity:
         """Return user by id."""
-        async with self.uow as uow:
+        async with self.uow.read_only() as uow:
             user = await uow.users.get_by_id(user_id)
             if not user:
                 raise UserNotFoundError("User not found")
@@ -47,3 +76,41 @@ class UserService:
         """Delete user by id (idempotent)."""
         async with self.uow as uow:
             await uow.users.delete(user_id)
+
+    async def update_users(
+        self,
+        changes: UserUpdateDTO,
+        actor_id: int,
+        ids: Sequence[int] | None = None,
+        where: UserFilter | None = None,
+    ) -> list[int]:
+        """
+        Apply the same partial update to many users at once; return the ids that were updated.
+
+        A filter may match at most MAX_BATCH_IDS users, else nothing is changed. Role changes skip
+        the acting admin, so nobody demotes themselves by accident.
+        """
+        data = changes.model_dump(exclude_unset=True)
+        async with self.uow as uow:
+            if not data:
+                return []
+            exclude_id = actor_id if "role" in data else None
+            return self._within_cap(
+                await uow.users.update_many(data, ids=ids, where=where, limit=MAX_BATCH_IDS + 1, exclude_id=exclude_id)
+            )
+
+    async def delete_users(
+        self, actor_id: int, ids: Sequence[int] | None = None, where: UserFilter | None = None
+    ) -> list[int]:
+        """Delete many users at once (never the acting admin, at most MAX_BATCH_IDS); return the ids deleted."""
+        async with self.uow as uow:
+            return self._within_cap(
+                await uow.users.delete_many(ids=ids, where=where, limit=MAX_BATCH_IDS + 1, exclude_id=actor_id)
+            )
+
+    @staticmethod
+    def _within_cap(affected: list[int]) -> list[int]:
+        """Raising inside the unit of work rolls the statement back."""
+        if len(affected) > MAX_BATCH_IDS:
+            raise BatchTooLargeError(f"The filter selects more than {MAX_BATCH_IDS} users; narrow it down")
+        return affected
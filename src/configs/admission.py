@@ -0,0 +1,21 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class AdmissionSettings(BaseSettings):
+    """
+    Admission control for CPU-bound endpoints (per gunicorn worker).
+    """
+
+    MAX_CONCURRENCY: int = 4  # requests allowed inside the guarded section at once
+    MAX_QUEUE: int = 16  # requests allowed to wait for a slot
+    MAX_WAIT_SEC: float = 2.0  # how long a queued request may wait before it is shed
+    RETRY_AFTER_SEC: int = 1
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="ADMISSION_",
+        extra="ignore",
+    )
+
+
+admission_settings = AdmissionSettings()
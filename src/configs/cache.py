@@ -0,0 +1,22 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class CacheSettings(BaseSettings):
+    """
+    Read-through cache for user lookups (in-process LRU in front of Redis).
+    """
+
+    ENABLED: bool = True
+    L1_MAX_ENTRIES: int = 10_000
+    L1_TTL_SEC: float = 5.0  # keep short: other workers' L1 is not invalidated on writes
+    REDIS_TTL_SEC: int = 300
+    REDIS_DB: int = 2  # 0 and 1 are used by Celery
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="CACHE_",
+        extra="ignore",
+    )
+
+
+cache_settings = CacheSettings()
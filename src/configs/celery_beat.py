@@ -7,6 +7,16 @@ class CeleryBeatSettings(BaseSettings):
     """
 
     UNVERIFIED_TTL_DAYS: int = 2
+    CLEANUP_BATCH_SIZE: int = 1000  # users deleted per transaction
+    CLEANUP_SLEEP_SEC: float = 0.1  # pause between batches to leave room for regular traffic
+
+    OUTBOX_POLL_SEC: float = 2.0  # how often the outbox relay runs (upper bound on email delay)
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_MAX_ATTEMPTS: int = 8  # then the message is left undelivered with its last_error
+    OUTBOX_LEASE_SEC: int = 60  # claimed messages are retried after this if the relay dies
+    OUTBOX_BACKOFF_BASE_SEC: float = 10.0  # retry n waits base * 2**(n-1), capped below
+    OUTBOX_BACKOFF_MAX_SEC: float = 3600.0
+    OUTBOX_RETENTION_DAYS: int = 7  # delivered messages are purged after this
 
     model_config = SettingsConfigDict(
         env_file=".env",
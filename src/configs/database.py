@@ -20,6 +20,17 @@ class DBSettings(BaseSettings):
     MAX_POOL_OVERFLOW: int = 20
     POOL_TIMEOUT: int = 30
 
+    # Read replicas (full SQLAlchemy URLs, JSON list in env); each gets its own pool of POOL_SIZE.
+    REPLICA_DSNS: list[str] = []
+    # After a write, the writer's reads stay on the primary this long; keep above the replica lag.
+    READ_YOUR_WRITES_SEC: float = 5.0
+    STICKY_REDIS_DB: int = 2
+
+    # Statements at least this slow are logged with their SQL (parameters are never logged).
+    SLOW_QUERY_MS: float = 200.0
+    # Raise instead of warning when a request goes over its query budget; turn on in tests/CI.
+    QUERY_BUDGET_STRICT: bool = False
+
     @property
     def DSN(self) -> str:  # noqa: N802
         return f"postgresql+asyncpg://{self.USER}:{quote_plus(self.PASS)}@{self.HOST}:{self.PORT}/{self.NAME}"
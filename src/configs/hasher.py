@@ -0,0 +1,36 @@
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class HasherSettings(BaseSettings):
+    """
+    Password hashing configuration.
+    """
+
+    TIME_COST: int = 3
+    MEMORY_COST_KB: int = 64 * 1024
+    PARALLELISM: int = 4
+
+    # Used by `python -m src.infrastructure.security.argon2_calibration` (and start_app.sh when enabled)
+    CALIBRATE_ON_STARTUP: bool = False
+    CALIBRATION_TARGET_MS: int = 250  # desired verify latency on this host
+    CALIBRATION_MAX_MEMORY_KB: int = 64 * 1024  # memory budget per hash
+
+    POOL_KIND: Literal["thread", "process"] = "thread"
+    POOL_WORKERS: int | None = None  # defaults to the number of CPUs
+    POOL_QUEUE_SIZE: int = 32  # calls allowed to wait for a free worker
+
+    # Separate process pool for bulk imports. Its processes still share the CPUs with signup/login,
+    # and every API worker has its own, so keep it small there (the CLI can raise it).
+    BULK_POOL_WORKERS: int = 2
+    BULK_CHUNK_SIZE: int = 64  # passwords hashed per task sent to a bulk worker
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="HASHER_",
+        extra="ignore",
+    )
+
+
+hasher_settings = HasherSettings()
@@ -6,10 +6,14 @@ class JWTSettings(BaseSettings):
     JWT configuration settings.
     """
 
-    secret: str = "super-secret"  #  override in .env
-    algorithm: str = "HS256"
+    secret: str = "super-secret"  #  override in .env (HS* algorithms only)
+    algorithm: str = "HS256"  # HS256 | EdDSA | RS256
+    keys_dir: str | None = None  # asymmetric algorithms: directory of <kid>.pem private keys
+    active_kid: str | None = None  # key used for signing; defaults to the newest kid in keys_dir
+    jwks_max_age_sec: int = 300  # Cache-Control max-age of /.well-known/jwks.json
     access_ttl_min: int = 15  # access token lifetime in minutes
     refresh_ttl_days: int = 7  # refresh token lifetime in days
+    decode_cache_size: int = 10_000  # verified tokens kept per worker (0 disables the cache)
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -12,11 +12,20 @@ class MailSettings(BaseSettings):
     smtp_username: str | None = None
     smtp_password: str | None = None
     smtp_starttls: bool = False
+    smtp_timeout_sec: float = 10.0
     sender_email: str = "no-reply@coffeeshop.local"
     sender_name: str = "Coffee Shop"
 
+    # Connection pool of the long-lived mailer (per process)
+    pool_size: int = 4  # authenticated connections kept open
+    pool_check_idle_sec: float = 30.0  # NOOP a connection idle longer than this before reusing it
+    pool_max_messages: int = 500  # reconnect after this many messages (relays often cap a session)
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_prefix="MAIL_",
         extra="ignore",
     )
+
+
+mail_settings = MailSettings()
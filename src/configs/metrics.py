@@ -0,0 +1,24 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class MetricsSettings(BaseSettings):
+    """
+    Prometheus metrics.
+
+    With several processes per host (gunicorn workers, Celery prefork), also set
+    PROMETHEUS_MULTIPROC_DIR (read by prometheus_client itself) to an empty directory;
+    start_app.sh and start_celery.sh do that.
+    """
+
+    ENABLED: bool = True  # HTTP middleware and GET /metrics
+    CELERY_PORT: int = 9808  # the Celery worker serves /metrics here (0 disables)
+    SERVER_TIMING: bool = True  # add a Server-Timing header (SQL count/time, pool wait) to API responses
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="METRICS_",
+        extra="ignore",
+    )
+
+
+metrics_settings = MetricsSettings()
@@ -0,0 +1,30 @@
+from pydantic import PositiveInt
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class RateLimitSettings(BaseSettings):
+    """
+    Sliding-window rate limits for the auth endpoints (shared across workers through Redis).
+    """
+
+    ENABLED: bool = True
+    REDIS_DB: int = 2  # shared with the user cache; keys are prefixed with "rl:"
+    LOCAL_MAX_KEYS: int = 100_000  # in-process fallback used while Redis is down (limits then apply per worker)
+
+    # Limits must be positive: the Lua script has no oldest entry to compute Retry-After from at 0.
+    # Use ENABLED=false to turn rate limiting off.
+    WINDOW_SEC: PositiveInt = 60
+    LOGIN_PER_IP: PositiveInt = 30
+    LOGIN_PER_EMAIL: PositiveInt = 10
+    SIGNUP_PER_IP: PositiveInt = 10
+    VERIFY_PER_IP: PositiveInt = 30
+    VERIFY_PER_EMAIL: PositiveInt = 5  # verification codes are short: keep guessing slow
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="RATE_LIMIT_",
+        extra="ignore",
+    )
+
+
+rate_limit_settings = RateLimitSettings()
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.domain.entities.base import BaseEntity
+
+
+@dataclass(slots=True)
+class OutboxMessageEntity(BaseEntity):
+    """
+    Side effect (e.g. an email) recorded in the same transaction as the change that caused it.
+
+    Attributes:
+        kind: What to do with the payload (see OutboxKind).
+        payload: JSON-serializable arguments.
+        attempts: Delivery attempts so far.
+        next_attempt_at: Earliest time of the next attempt.
+        sent_at: When it was delivered (None while pending).
+        last_error: Error of the last failed attempt.
+    """
+
+    kind: str
+    payload: dict
+    attempts: int
+    next_attempt_at: datetime
+    sent_at: datetime | None = None
+    last_error: str | None = None
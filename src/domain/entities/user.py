@@ -12,7 +12,8 @@ class UserEntity(BaseEntity):
 
     Attributes:
         email: Email address (value object).
-        password: Hashed password (algorithm hidden behind PasswordHasher port).
+        password: Hashed password (algorithm hidden behind PasswordHasher port); None when
+            the entity was read without it.
         first_name: Optional first name.
         last_name: Optional last name.
         is_verified: Whether the user has completed verification.
@@ -20,7 +21,7 @@ class UserEntity(BaseEntity):
     """
 
     email: EmailAddress
-    password: str
+    password: str | None
     first_name: str | None
     last_name: str | None
     is_verified: bool
@@ -55,3 +55,39 @@ class AccessDeniedError(DomainError):
 class InvalidEmailAddressError(DomainError):
     code = "invalid_email"
     default_message = "The provided email address is not valid."
+
+
+class RetryLaterError(DomainError):
+    """
+    Base for errors the client should retry after a while.
+    `retry_after_sec` is a hint for the caller (None: use the presentation layer's default).
+    """
+
+    def __init__(self, message: str | None = None, retry_after_sec: int | None = None) -> None:
+        super().__init__(message)
+        self.retry_after_sec = retry_after_sec
+
+
+class ServiceBusyError(RetryLaterError):
+    code = "service_busy"
+    default_message = "Service is busy, please retry later."
+
+
+class RateLimitedError(RetryLaterError):
+    code = "rate_limited"
+    default_message = "Too many requests, please retry later."
+
+
+class BatchTooLargeError(DomainError):
+    code = "batch_too_large"
+    default_message = "The filter selects too many users for one batch operation."
+
+
+class InvalidCursorError(DomainError):
+    code = "invalid_cursor"
+    default_message = "Pagination cursor is malformed."
+
+
+class ConflictingPaginationError(DomainError):
+    code = "conflicting_pagination"
+    default_message = "Pass either cursor or offset, not both."
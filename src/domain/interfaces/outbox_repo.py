@@ -0,0 +1,28 @@
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Protocol
+
+from src.domain.entities.outbox import OutboxMessageEntity
+
+
+class IOutboxRepository(Protocol):
+    """
+    Repository interface for the transactional outbox.
+    """
+
+    async def claim(
+        self, limit: int, now: datetime, lease_until: datetime, max_attempts: int
+    ) -> Sequence[OutboxMessageEntity]:
+        """
+        Lease up to `limit` due messages: count an attempt and hide them from other relays until
+        `lease_until`, so a relay that dies mid-delivery only delays them.
+        """
+
+    async def mark_sent(self, message_ids: Sequence[int], now: datetime) -> None:
+        """Record successful delivery."""
+
+    async def reschedule(self, message_id: int, next_attempt_at: datetime, error: str) -> None:
+        """Record a failed attempt and when to try again."""
+
+    async def purge_sent(self, before: datetime, limit: int) -> int:
+        """Delete up to `limit` messages delivered before `before`; return how many were deleted."""
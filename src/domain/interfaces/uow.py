@@ -1,6 +1,7 @@
 from types import TracebackType
 from typing import Protocol
 
+from src.domain.interfaces.outbox_repo import IOutboxRepository
 from src.domain.interfaces.user_repo import IUserRepository
 from src.domain.interfaces.verification_repo import IVerificationRepository
 
@@ -12,6 +13,16 @@ class IUnitOfWork(Protocol):
 
     users: IUserRepository
     verifications: IVerificationRepository
+    outbox: IOutboxRepository
+
+    def read_only(self, use_replica: bool = True) -> "IUnitOfWork":
+        """
+        Return a unit of work for pure reads: it rejects writes and never commits.
+
+        With `use_replica` it may read from a replica that lags behind the primary, except right after
+        the caller's own writes; pass False when the result must be fresh regardless.
+        """
+        ...
 
     async def __aenter__(self) -> "IUnitOfWork": ...
 
@@ -1,8 +1,10 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
 from typing import Protocol
 
 from src.domain.entities.user import UserEntity
 from src.domain.value_objects.email_address import EmailAddress
+from src.domain.value_objects.user_filter import UserFilter
 
 
 class IUserRepository(Protocol):
@@ -11,20 +13,70 @@ class IUserRepository(Protocol):
     Application services depend on this, not on concrete ORMs.
     """
 
-    async def get_by_id(self, user_id: int) -> UserEntity | None:
+    async def get_by_id(self, user_id: int, include_password: bool = False) -> UserEntity | None:
         """Return user by id or None if not found."""
 
-    async def get_by_email(self, email: EmailAddress) -> UserEntity | None:
-        """Return user by email or None if not found."""
+    async def get_by_email(self, email: EmailAddress, include_password: bool = False) -> UserEntity | None:
+        """
+        Return user by email or None if not found.
+
+        Reads leave `password` as None unless `include_password` is set (only credential checks need it).
+        """
 
     async def list_paginated(self, offset: int, limit: int) -> Sequence[UserEntity]:
-        """Return a paginated list of users."""
+        """Return a paginated list of users (OFFSET based, legacy)."""
+
+    async def list_after(self, after_id: int | None, limit: int) -> Sequence[UserEntity]:
+        """Return up to `limit` users with id greater than `after_id`, ordered by id (keyset pagination)."""
+
+    def stream_all(self, batch_size: int) -> AsyncIterator[UserEntity]:
+        """Yield all users ordered by id, fetching `batch_size` rows at a time from a server-side cursor."""
 
     async def add(self, data: dict) -> UserEntity:
         """Persist a new user and return it with assigned identity."""
 
+    async def add_with_verification(self, data: dict, verification: dict, outbox: dict | None = None) -> UserEntity | None:
+        """
+        Atomically persist a new user with its first verification and an optional outbox message
+        (`kind`, `payload`); return None if the email is taken.
+        """
+
+    async def verify_with_code(self, email: EmailAddress, code: str, now: datetime) -> tuple[int, bool] | None:
+        """
+        Atomically consume the latest verification of the user with `email` if it matches `code`,
+        is unexpired and unconsumed, and mark the user verified.
+
+        Returns None if there is no such user, else (user_id, verified).
+        """
+
+    async def bulk_insert(self, records: Sequence[dict]) -> list[str]:
+        """Insert many users, skipping emails that already exist; return the emails that were inserted."""
+
     async def update(self, user_id: int, data: dict) -> UserEntity:
         """Persist changes to an existing user and return it."""
 
     async def delete(self, user_id: int) -> None:
         """Delete user by id (idempotent)."""
+
+    async def update_many(
+        self,
+        data: dict,
+        ids: Sequence[int] | None = None,
+        where: UserFilter | None = None,
+        limit: int | None = None,
+        exclude_id: int | None = None,
+    ) -> list[int]:
+        """
+        Apply `data` to all users selected by `ids` and/or `where` in one statement; return the updated ids.
+
+        `limit` caps the selection at the first `limit` matches by id; `exclude_id` is never selected.
+        """
+
+    async def delete_many(
+        self,
+        ids: Sequence[int] | None = None,
+        where: UserFilter | None = None,
+        limit: int | None = None,
+        exclude_id: int | None = None,
+    ) -> list[int]:
+        """Delete all users selected by `ids` and/or `where` in one statement (see update_many); return the deleted ids."""
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Protocol
 
 
@@ -11,3 +12,15 @@ class PasswordHasher(Protocol):
 
     def verify(self, raw: str, hashed: str) -> bool:
         """Return True if raw password matches the given hash."""
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """Return True if the hash was produced with weaker parameters than the current ones."""
+
+    async def hash_async(self, raw: str) -> str:
+        """Same as `hash`, without blocking the event loop."""
+
+    async def verify_async(self, raw: str, hashed: str) -> bool:
+        """Same as `verify`, without blocking the event loop."""
+
+    async def hash_many_async(self, raws: Sequence[str]) -> list[str]:
+        """Hash many passwords in parallel (bulk jobs); results are in input order."""
@@ -14,3 +14,6 @@ class TokenProvider(Protocol):
 
     def decode(self, token: str) -> dict:
         """Decode token and return claims; raise on invalid tokens."""
+
+    def jwks(self) -> dict:
+        """Return public keys that verify issued tokens, as a JWKS document."""
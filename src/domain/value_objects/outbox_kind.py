@@ -0,0 +1,9 @@
+import enum
+
+
+class OutboxKind(enum.StrEnum):
+    """
+    Kinds of outbox messages (one handler each).
+    """
+
+    VERIFICATION_EMAIL = "verification_email"
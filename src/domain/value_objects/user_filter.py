@@ -0,0 +1,21 @@
+from dataclasses import dataclass, fields
+from datetime import datetime
+
+from src.domain.value_objects.user_role import UserRole
+
+
+@dataclass(frozen=True, slots=True)
+class UserFilter:
+    """
+    Criteria selecting users for batch operations; unset fields match everything.
+    """
+
+    role: UserRole | None = None
+    is_verified: bool | None = None
+    created_before: datetime | None = None
+    created_after: datetime | None = None
+    email_domain: str | None = None
+
+    def is_empty(self) -> bool:
+        """Return True if the filter would match every user."""
+        return all(getattr(self, f.name) is None for f in fields(self))
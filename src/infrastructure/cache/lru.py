@@ -0,0 +1,51 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+
+class TTLLRUCache[K, V]:
+    """
+    Bounded in-process LRU with per-entry expiry.
+
+    Not thread-safe: meant to be used from a single event loop. `on_evict` is called for every
+    entry dropped to make room (e.g. to count evictions in a metric).
+    """
+
+    def __init__(self, max_entries: int, ttl_sec: float, on_evict: Callable[[], object] | None = None) -> None:
+        self._max_entries = max_entries
+        self._ttl_sec = ttl_sec
+        self._on_evict = on_evict
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        """Return a live value (and mark it recently used) or None."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl_sec: float | None = None) -> None:
+        """Store a value, evicting the least recently used entries when full."""
+        self._data[key] = (time.monotonic() + (self._ttl_sec if ttl_sec is None else ttl_sec), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_entries:
+            self._data.popitem(last=False)
+            self.evictions += 1
+            if self._on_evict is not None:
+                self._on_evict()
+
+    def pop(self, key: K) -> None:
+        """Drop a key if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -0,0 +1,371 @@
+import asyncio
+import copy
+import dataclasses
+import json
+import logging
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import RedisError
+
+from src.configs.cache import CacheSettings, cache_settings
+from src.domain.entities.user import UserEntity
+from src.domain.interfaces.user_repo import IUserRepository
+from src.domain.value_objects.email_address import EmailAddress
+from src.domain.value_objects.user_filter import UserFilter
+from src.domain.value_objects.user_role import UserRole
+from src.infrastructure.cache.lru import TTLLRUCache
+from src.infrastructure.monitoring.metrics import (
+    USER_CACHE_EVICTIONS,
+    USER_CACHE_HITS,
+    USER_CACHE_MISSES,
+    USER_CACHE_REDIS_ERRORS,
+)
+from src.infrastructure.redis_client import get_redis
+
+log = logging.getLogger(__name__)
+
+REDIS_BACKOFF_SEC = 5.0  # how long to skip Redis after a failure
+
+_GEN_KEY = "user:gen"  # bumped by every invalidation
+
+# KEYS: generation, entity, email link; ARGV: generation seen before the DB read, entity, id, ttl
+_PUT_IF_CURRENT_LUA = """
+if (redis.call('GET', KEYS[1]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[4])
+redis.call('SET', KEYS[3], ARGV[3], 'EX', ARGV[4])
+return 1
+"""
+
+# (local generation, Redis generation or None if Redis was unavailable) taken before a DB read
+FillToken = tuple[int, str | None]
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters of a UserCache."""
+
+    l1_hits: int = 0
+    l1_misses: int = 0
+    l1_evictions: int = 0
+    l1_size: int = 0
+    redis_hits: int = 0
+    redis_misses: int = 0
+    redis_errors: int = 0
+
+
+class UserCache:
+    """
+    Two-tier cache of user entities: in-process TTL LRU (L1) in front of Redis (L2).
+
+    Entities are keyed by id; emails map to ids so that both lookups share one entry and
+    invalidating by id is enough. Password hashes are never cached: entries come back with
+    `password=None`. Redis failures are logged and treated as misses. Hits, misses and
+    evictions are exported as user_cache_* metrics.
+
+    L1 is per worker and only invalidated locally, so it may serve data up to `l1_ttl_sec` old.
+    Lookups that must see the latest state pass `use_l1=False` and go to Redis, which is
+    invalidated on every write.
+
+    Fills are conditional: callers take a `fill_token()` before reading the database and `put()`
+    drops the entity if any invalidation happened in between, so a reader that loaded a row just
+    before a concurrent write committed cannot cache the old version after that write's invalidation.
+    """
+
+    def __init__(self, redis: Redis, max_entries: int, l1_ttl_sec: float, redis_ttl_sec: int) -> None:
+        self._redis = redis
+        self._l1: TTLLRUCache[str, UserEntity | int] = TTLLRUCache(
+            max_entries, l1_ttl_sec, on_evict=USER_CACHE_EVICTIONS.inc
+        )
+        self._redis_ttl_sec = redis_ttl_sec
+        self._put_script = redis.register_script(_PUT_IF_CURRENT_LUA)
+        self._local_gen = 0
+        self._redis_down_until = 0.0
+        self._stats = CacheStats()
+        self._pending: set[asyncio.Task] = set()
+
+    @classmethod
+    def from_settings(cls, settings: CacheSettings) -> "UserCache":
+        return cls(get_redis(settings.REDIS_DB), settings.L1_MAX_ENTRIES, settings.L1_TTL_SEC, settings.REDIS_TTL_SEC)
+
+    def stats(self) -> CacheStats:
+        """Return hit/miss/eviction counters."""
+        self._stats.l1_evictions = self._l1.evictions
+        self._stats.l1_size = len(self._l1)
+        return copy.copy(self._stats)
+
+    # ---------- lookups ----------
+    async def get_by_id(self, user_id: int, use_l1: bool = True) -> UserEntity | None:
+        key = _id_key(user_id)
+        if use_l1:
+            user = self._l1.get(key)
+            if user is not None:
+                self._stats.l1_hits += 1
+                USER_CACHE_HITS.labels("l1").inc()
+                return copy.copy(user)  # callers may mutate entities
+            self._stats.l1_misses += 1
+            USER_CACHE_MISSES.labels("l1").inc()
+
+        raw = await self._redis_call("get", key)
+        if raw is None:
+            self._stats.redis_misses += 1
+            USER_CACHE_MISSES.labels("redis").inc()
+            return None
+        self._stats.redis_hits += 1
+        USER_CACHE_HITS.labels("redis").inc()
+        user = _loads(raw)
+        self._l1.set(key, user)
+        return copy.copy(user)
+
+    async def get_id_by_email(self, email: str) -> int | None:
+        # Email links never change for a live user, so L1 is safe here.
+        key = _email_key(email)
+        user_id = self._l1.get(key)
+        if user_id is not None:
+            self._stats.l1_hits += 1
+            USER_CACHE_HITS.labels("l1").inc()
+            return user_id
+        self._stats.l1_misses += 1
+        USER_CACHE_MISSES.labels("l1").inc()
+
+        raw = await self._redis_call("get", key)
+        if raw is None:
+            self._stats.redis_misses += 1
+            USER_CACHE_MISSES.labels("redis").inc()
+            return None
+        self._stats.redis_hits += 1
+        USER_CACHE_HITS.labels("redis").inc()
+        self._l1.set(key, int(raw))
+        return int(raw)
+
+    async def fill_token(self) -> FillToken:
+        """Snapshot the invalidation generation; take it before reading the entity that will be put()."""
+        raw = await self._redis_call("get", _GEN_KEY)
+        if raw is None and time.monotonic() < self._redis_down_until:
+            return self._local_gen, None
+        return self._local_gen, raw.decode() if isinstance(raw, bytes) else str(raw or 0)
+
+    async def put(self, user: UserEntity, token: FillToken) -> None:
+        """Cache `user` unless an invalidation happened since `token` was taken."""
+        local_gen, redis_gen = token
+        if local_gen != self._local_gen:
+            return
+        id_key, email_key = _id_key(user.id), _email_key(user.email.as_str())
+        if redis_gen is not None and not await self._redis_put(user, redis_gen):
+            return
+        self._l1.set(id_key, dataclasses.replace(user, password=None))
+        self._l1.set(email_key, user.id)
+
+    async def invalidate(self, user_ids: Sequence[int]) -> None:
+        """Drop cached entities (email -> id links are left to expire; stale ones are detected on read)."""
+        keys = [_id_key(user_id) for user_id in user_ids]
+        if not keys:
+            return
+        self._local_gen += 1
+        for key in keys:
+            self._l1.pop(key)
+        await self._redis_pipeline(lambda p: p.incr(_GEN_KEY).delete(*keys))
+
+    def invalidate_later(self, user_ids: Sequence[int], delay_sec: float) -> None:
+        """Schedule another invalidate() in the background."""
+        task = asyncio.get_running_loop().create_task(self._invalidate_after(user_ids, delay_sec))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _invalidate_after(self, user_ids: Sequence[int], delay_sec: float) -> None:
+        await asyncio.sleep(delay_sec)
+        await self.invalidate(user_ids)
+
+    # ---------- redis helpers ----------
+    async def _redis_put(self, user: UserEntity, redis_gen: str) -> bool:
+        """Write the entity and its email link if the generation is still `redis_gen`; False if refused."""
+        if time.monotonic() < self._redis_down_until:
+            return True
+        keys = [_GEN_KEY, _id_key(user.id), _email_key(user.email.as_str())]
+        try:
+            return bool(await self._put_script(keys=keys, args=[redis_gen, _dumps(user), user.id, self._redis_ttl_sec]))
+        except (RedisError, OSError) as err:
+            self._redis_failed(err)
+            return True  # the local generation check still applies to L1
+
+    async def _redis_call(self, method: str, *args: object) -> object | None:
+        if time.monotonic() < self._redis_down_until:
+            return None
+        try:
+            return await getattr(self._redis, method)(*args)
+        except (RedisError, OSError) as err:
+            self._redis_failed(err)
+            return None
+
+    async def _redis_pipeline(self, build: Callable[[Pipeline], object]) -> None:
+        if time.monotonic() < self._redis_down_until:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                build(pipe)
+                await pipe.execute()
+        except (RedisError, OSError) as err:
+            self._redis_failed(err)
+
+    def _redis_failed(self, err: Exception) -> None:
+        self._stats.redis_errors += 1
+        USER_CACHE_REDIS_ERRORS.inc()
+        self._redis_down_until = time.monotonic() + REDIS_BACKOFF_SEC
+        log.warning("user cache: redis unavailable, using L1 only for %.0fs: %s", REDIS_BACKOFF_SEC, err)
+
+
+class CachedUserRepository(IUserRepository):
+    """
+    Read-through caching decorator for IUserRepository.
+
+    Point lookups go through UserCache; writes invalidate the affected ids right away and once more
+    after the surrounding transaction commits (see SqlAlchemyUnitOfWork.commit). Cache fills carry a
+    token taken before the database read, so a concurrent reader holding pre-commit data cannot put
+    it back after either invalidation.
+    """
+
+    def __init__(self, inner: IUserRepository, cache: UserCache) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._dirty: set[int] = set()
+
+    async def get_by_id(self, user_id: int, include_password: bool = False) -> UserEntity | None:
+        if not include_password:  # the cache holds no password hashes
+            user = await self._cache.get_by_id(user_id)
+            if user is not None:
+                return user
+        token = await self._cache.fill_token()
+        user = await self._inner.get_by_id(user_id, include_password)
+        if user is not None and user_id not in self._dirty:
+            await self._cache.put(user, token)
+        return user
+
+    async def get_by_email(self, email: EmailAddress, include_password: bool = False) -> UserEntity | None:
+        user_id = None if include_password else await self._cache.get_id_by_email(email.as_str())
+        if user_id is not None:
+            # Skip the per-worker L1 copy of the entity: email lookups must see the latest is_verified/role.
+            user = await self._cache.get_by_id(user_id, use_l1=False)
+            # The link may outlive a deleted user whose email was taken again.
+            if user is not None and user.email.as_str() == email.as_str():
+                return user
+        token = await self._cache.fill_token()
+        user = await self._inner.get_by_email(email, include_password)
+        if user is not None and user.id not in self._dirty:
+            await self._cache.put(user, token)
+        return user
+
+    async def list_paginated(self, offset: int, limit: int) -> Sequence[UserEntity]:
+        return await self._inner.list_paginated(offset, limit)
+
+    async def list_after(self, after_id: int | None, limit: int) -> Sequence[UserEntity]:
+        return await self._inner.list_after(after_id, limit)
+
+    def stream_all(self, batch_size: int) -> AsyncIterator[UserEntity]:
+        return self._inner.stream_all(batch_size)
+
+    async def add(self, data: dict) -> UserEntity:
+        return await self._inner.add(data)
+
+    async def add_with_verification(self, data: dict, verification: dict, outbox: dict | None = None) -> UserEntity | None:
+        return await self._inner.add_with_verification(data, verification, outbox)
+
+    async def verify_with_code(self, email: EmailAddress, code: str, now: datetime) -> tuple[int, bool] | None:
+        result = await self._inner.verify_with_code(email, code, now)
+        if result is not None and result[1]:
+            await self._invalidate([result[0]])
+        return result
+
+    async def bulk_insert(self, records: Sequence[dict]) -> list[str]:
+        return await self._inner.bulk_insert(records)
+
+    async def update(self, user_id: int, data: dict) -> UserEntity | None:
+        user = await self._inner.update(user_id, data)
+        await self._invalidate([user_id])
+        return user
+
+    async def delete(self, user_id: int) -> None:
+        await self._inner.delete(user_id)
+        await self._invalidate([user_id])
+
+    async def update_many(
+        self,
+        data: dict,
+        ids: Sequence[int] | None = None,
+        where: UserFilter | None = None,
+        limit: int | None = None,
+        exclude_id: int | None = None,
+    ) -> list[int]:
+        updated = await self._inner.update_many(data, ids, where, limit, exclude_id)
+        await self._invalidate(updated)
+        return updated
+
+    async def delete_many(
+        self,
+        ids: Sequence[int] | None = None,
+        where: UserFilter | None = None,
+        limit: int | None = None,
+        exclude_id: int | None = None,
+    ) -> list[int]:
+        deleted = await self._inner.delete_many(ids, where, limit, exclude_id)
+        await self._invalidate(deleted)
+        return deleted
+
+    async def after_commit(self, replica_lag_sec: float = 0) -> None:
+        """Invalidate everything written in the committed transaction once more (and again after `replica_lag_sec`)."""
+        if self._dirty:
+            await self._cache.invalidate(list(self._dirty))
+            if replica_lag_sec > 0:
+                self._cache.invalidate_later(list(self._dirty), replica_lag_sec)
+            self._dirty.clear()
+
+    async def _invalidate(self, user_ids: Sequence[int]) -> None:
+        self._dirty.update(user_ids)
+        await self._cache.invalidate(user_ids)
+
+
+# ---------- serialization ----------
+def _id_key(user_id: int) -> str:
+    return f"user:id:{user_id}"
+
+
+def _email_key(email: str) -> str:
+    return f"user:email:{email}"
+
+
+def _dumps(user: UserEntity) -> str:
+    return json.dumps(
+        {
+            "id": user.id,
+            "created_at": user.created_at.isoformat(),
+            "updated_at": user.updated_at.isoformat() if user.updated_at else None,
+            "email": user.email.as_str(),
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "is_verified": user.is_verified,
+            "role": user.role.value,
+        }
+    )
+
+
+def _loads(raw: bytes | str) -> UserEntity:
+    data = json.loads(raw)
+    return UserEntity(
+        id=data["id"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"]) if data["updated_at"] else None,
+        email=EmailAddress(data["email"]),
+        password=None,
+        first_name=data["first_name"],
+        last_name=data["last_name"],
+        is_verified=data["is_verified"],
+        role=UserRole(data["role"]),
+    )
+
+
+user_cache = UserCache.from_settings(cache_settings)
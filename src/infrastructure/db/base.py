@@ -1,13 +1,11 @@
-import logging
-
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from src.configs.database import settings
-
-logging.basicConfig()
-logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
-logging.getLogger("sqlalchemy.pool").setLevel(logging.WARNING)
+from src.infrastructure.db.instrumentation import instrument_engine
+from src.infrastructure.db.pool import InstrumentedAsyncQueuePool
+from src.infrastructure.db.routing import ReplicaRouter
+from src.infrastructure.redis_client import get_redis
 
 
 class ORMBase(DeclarativeBase):
@@ -20,6 +18,7 @@ db_settings = settings
 
 engine = create_async_engine(
     url=db_settings.DSN,
+    poolclass=InstrumentedAsyncQueuePool,
     pool_size=db_settings.POOL_SIZE,
     max_overflow=db_settings.MAX_POOL_OVERFLOW,
     pool_timeout=db_settings.POOL_TIMEOUT,
@@ -28,4 +27,30 @@ engine = create_async_engine(
     pool_logging_name=f"sqlalchemy.pool.Postgres.{db_settings.NAME}",
 )
 
+replica_engines = [
+    create_async_engine(
+        url=dsn,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=db_settings.POOL_SIZE,
+        max_overflow=db_settings.MAX_POOL_OVERFLOW,
+        pool_timeout=db_settings.POOL_TIMEOUT,
+        echo=False,
+        logging_name=f"sqlalchemy.engine.Postgres.{db_settings.NAME}.replica{i}",
+        pool_logging_name=f"sqlalchemy.pool.Postgres.{db_settings.NAME}.replica{i}",
+    )
+    for i, dsn in enumerate(db_settings.REPLICA_DSNS)
+]
+
+for _engine in (engine, *replica_engines):
+    instrument_engine(_engine)
+
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+# Read-only units of work bind each session to one of these; transactions open as BEGIN READ ONLY.
+replica_router = ReplicaRouter(
+    primary=engine.execution_options(postgresql_readonly=True),
+    replicas=[e.execution_options(postgresql_readonly=True) for e in replica_engines],
+    sticky_sec=db_settings.READ_YOUR_WRITES_SEC,
+    redis=get_redis(db_settings.STICKY_REDIS_DB),
+)
+read_only_session_maker = async_sessionmaker(replica_router.primary, class_=AsyncSession, expire_on_commit=False)
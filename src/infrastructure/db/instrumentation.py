@@ -0,0 +1,101 @@
+"""
+Per-request SQL statistics.
+
+The HTTP middleware (ServerTimingMiddleware) opens a RequestDbStats for every request; the cursor
+event hooks installed by `instrument_engine` and the instrumented pool add each statement's
+execution time and each connection checkout's wait to it. Statements slower than DB_SLOW_QUERY_MS
+are logged whether or not a request is in progress (Celery tasks included).
+
+A request may declare a query budget (see `query_budget` in ui/api/deps.py). Going over it logs a
+warning, or raises QueryBudgetExceededError right at the offending statement when
+DB_QUERY_BUDGET_STRICT is on (tests/CI), so N+1 regressions fail loudly there.
+"""
+
+import logging
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.configs.database import settings as db_settings
+
+log = logging.getLogger(__name__)
+
+_STATEMENT_LOG_CHARS = 500
+
+
+class QueryBudgetExceededError(RuntimeError):
+    """A request issued more SQL statements than its declared budget (strict mode only)."""
+
+
+@dataclass(slots=True)
+class RequestDbStats:
+    """SQL counters of one request."""
+
+    queries: int = 0
+    db_time_sec: float = 0.0
+    pool_wait_sec: float = 0.0
+    slow_queries: int = 0
+    budget: int | None = None
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.queries > self.budget
+
+
+_stats: ContextVar[RequestDbStats | None] = ContextVar("request_db_stats", default=None)
+
+
+def start_request_stats() -> tuple[RequestDbStats, Token]:
+    """Begin collecting stats for the current request (pass the token to `stop_request_stats`)."""
+    stats = RequestDbStats()
+    return stats, _stats.set(stats)
+
+
+def stop_request_stats(token: Token) -> None:
+    _stats.reset(token)
+
+
+def current_stats() -> RequestDbStats | None:
+    """Stats of the request being served, or None outside of a request."""
+    return _stats.get()
+
+
+def record_pool_wait(elapsed_sec: float) -> None:
+    """Add a connection checkout wait to the current request (called by the pool)."""
+    stats = _stats.get()
+    if stats is not None:
+        stats.pool_wait_sec += elapsed_sec
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Install the cursor hooks on an engine."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(
+    _conn: Connection, _cursor: object, _statement: str, _params: object, context: ExecutionContext, _many: bool
+) -> None:
+    stats = _stats.get()
+    if stats is not None and db_settings.QUERY_BUDGET_STRICT and stats.budget is not None and stats.queries >= stats.budget:
+        raise QueryBudgetExceededError(f"Query budget of {stats.budget} statements exceeded")
+    context._query_started_at = time.perf_counter()  # type: ignore[attr-defined]
+
+
+def _after_cursor_execute(
+    _conn: Connection, _cursor: object, statement: str, _params: object, context: ExecutionContext, _many: bool
+) -> None:
+    elapsed = time.perf_counter() - context._query_started_at  # type: ignore[attr-defined]
+    slow = elapsed * 1000 >= db_settings.SLOW_QUERY_MS
+    if slow:
+        log.warning("slow query (%.1f ms): %s", elapsed * 1000, " ".join(statement.split())[:_STATEMENT_LOG_CHARS])
+
+    stats = _stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_time_sec += elapsed
+        stats.slow_queries += slow
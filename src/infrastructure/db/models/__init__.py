@@ -1,2 +1,3 @@
+from .outbox import OutboxORM
 from .user import UserORM
 from .verification import VerificationORM
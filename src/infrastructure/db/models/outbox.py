@@ -0,0 +1,24 @@
+import datetime as dt
+
+from sqlalchemy import Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.db.base import ORMBase
+from src.infrastructure.db.mixins import IdTimestampMixin
+
+
+class OutboxORM(IdTimestampMixin, ORMBase):
+    """
+    ORM model for outbox.
+    """
+
+    __tablename__ = "outbox"
+    __table_args__ = (Index("ix_outbox_pending", "next_attempt_at", "id", postgresql_where=text("sent_at IS NULL")),)
+
+    kind: Mapped[str] = mapped_column(String(64))
+    payload: Mapped[dict] = mapped_column(JSONB)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    next_attempt_at: Mapped[dt.datetime] = mapped_column(server_default=text("now()"))
+    sent_at: Mapped[dt.datetime | None]
+    last_error: Mapped[str | None] = mapped_column(String(500))
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Enum, String
+from sqlalchemy import Boolean, Enum, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.domain.value_objects.user_role import UserRole
@@ -12,6 +12,10 @@ class UserORM(IdTimestampMixin, ORMBase):
     """
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Cleanup of stale unverified users walks this in (created_at, id) order.
+        Index("ix_users_unverified_created", "created_at", "id", postgresql_where=text("NOT is_verified")),
+    )
 
     email: Mapped[str] = mapped_column(String(255), index=True, unique=True)
     password: Mapped[str] = mapped_column(String(255))
@@ -1,6 +1,6 @@
 import datetime as dt
 
-from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy import ForeignKey, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.domain.value_objects.verification_channel import VerificationChannel
@@ -14,7 +14,7 @@ class VerificationORM(IdTimestampMixin, ORMBase):
     """
 
     __tablename__ = "verifications"
-    __table_args__ = (Index("ix_verif_user_created", "user_id", "created_at"),)
+    __table_args__ = (Index("ix_verif_user_latest", "user_id", text("created_at DESC"), text("id DESC")),)
 
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), index=True)
     code: Mapped[str] = mapped_column(String(32))
@@ -0,0 +1,36 @@
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from src.infrastructure.db.instrumentation import record_pool_wait
+from src.infrastructure.monitoring.metrics import DB_POOL_CHECKED_OUT, DB_POOL_CHECKOUT_WAIT, DB_POOL_OVERFLOW
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that reports checkout wait time, checked-out connections and overflow
+    to Prometheus, labelled with the pool's logging name. Wait time is also added to the current
+    request's SQL stats.
+    """
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = time.perf_counter() - start
+            DB_POOL_CHECKOUT_WAIT.labels(self._metrics_label()).observe(elapsed)
+            record_pool_wait(elapsed)
+            self._report_usage()
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        super()._do_return_conn(record)
+        self._report_usage()
+
+    def _report_usage(self) -> None:
+        label = self._metrics_label()
+        DB_POOL_CHECKED_OUT.labels(label).set(self.checkedout())
+        DB_POOL_OVERFLOW.labels(label).set(max(self.overflow(), 0))
+
+    def _metrics_label(self) -> str:
+        return getattr(self, "logging_name", None) or "default"
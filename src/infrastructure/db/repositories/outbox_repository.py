@@ -0,0 +1,81 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import Integer, any_, cast, delete, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.outbox import OutboxMessageEntity
+from src.domain.interfaces.outbox_repo import IOutboxRepository
+from src.infrastructure.db.models.outbox import OutboxORM
+
+
+class OutboxRepository(IOutboxRepository):
+    """
+    SQLAlchemy-based repository for outbox messages.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def claim(
+        self, limit: int, now: datetime, lease_until: datetime, max_attempts: int
+    ) -> Sequence[OutboxMessageEntity]:
+        """Lease due messages (skipping rows another relay is claiming right now)."""
+        due = (
+            select(OutboxORM.id)
+            .where(OutboxORM.sent_at.is_(None), OutboxORM.next_attempt_at <= now, OutboxORM.attempts < max_attempts)
+            .order_by(OutboxORM.next_attempt_at, OutboxORM.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(OutboxORM)
+            .where(OutboxORM.id == any_(func.array(due.scalar_subquery())))
+            .values(attempts=OutboxORM.attempts + 1, next_attempt_at=lease_until)
+            .returning(OutboxORM)
+        )
+        rows = (await self.session.execute(stmt)).scalars().all()
+        return sorted((self._to_domain(o) for o in rows), key=lambda m: m.id)
+
+    async def mark_sent(self, message_ids: Sequence[int], now: datetime) -> None:
+        """Record successful delivery."""
+        if message_ids:
+            await self.session.execute(
+                update(OutboxORM)
+                .where(OutboxORM.id == any_(cast(list(message_ids), ARRAY(Integer))))
+                .values(sent_at=now, last_error=None)
+            )
+
+    async def reschedule(self, message_id: int, next_attempt_at: datetime, error: str) -> None:
+        """Record a failed attempt and when to try again."""
+        await self.session.execute(
+            update(OutboxORM)
+            .where(OutboxORM.id == message_id)
+            .values(next_attempt_at=next_attempt_at, last_error=error[:500])
+        )
+
+    async def purge_sent(self, before: datetime, limit: int) -> int:
+        """Delete up to `limit` messages delivered before `before`."""
+        old = select(OutboxORM.id).where(OutboxORM.sent_at < before).limit(limit)
+        result = await self.session.execute(
+            delete(OutboxORM).where(OutboxORM.id == any_(func.array(old.scalar_subquery()))).returning(OutboxORM.id)
+        )
+        return len(result.all())
+
+    # ---------- mapping helpers ----------
+
+    @staticmethod
+    def _to_domain(orm: OutboxORM) -> OutboxMessageEntity:
+        """Convert ORM model into domain object."""
+        return OutboxMessageEntity(
+            id=orm.id,
+            created_at=orm.created_at,
+            updated_at=orm.updated_at,
+            kind=orm.kind,
+            payload=orm.payload,
+            attempts=orm.attempts,
+            next_attempt_at=orm.next_attempt_at,
+            sent_at=orm.sent_at,
+            last_error=orm.last_error,
+        )
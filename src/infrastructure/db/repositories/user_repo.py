@@ -1,13 +1,66 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import (
+    CTE,
+    Boolean,
+    Column,
+    ColumnElement,
+    Integer,
+    MetaData,
+    Row,
+    String,
+    Table,
+    any_,
+    cast,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.domain.entities.user import UserEntity
 from src.domain.interfaces.user_repo import IUserRepository
 from src.domain.value_objects.email_address import EmailAddress
+from src.domain.value_objects.user_filter import UserFilter
 from src.domain.value_objects.user_role import UserRole
+from src.infrastructure.db.models.outbox import OutboxORM
 from src.infrastructure.db.models.user import UserORM
+from src.infrastructure.db.models.verification import VerificationORM
+
+# Staging table for bulk_insert: COPY cannot skip conflicting rows, INSERT ... SELECT can.
+_users_import = Table(
+    "users_import",
+    MetaData(),
+    Column("email", String(255)),
+    Column("password", String(255)),
+    Column("first_name", String(120)),
+    Column("last_name", String(120)),
+    Column("is_verified", Boolean),
+    Column("role", String(16)),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+_IMPORT_COLUMNS = [c.name for c in _users_import.c]
+
+# Reads select these as plain rows: no identity map, no change tracking. The hash is added on request.
+_ENTITY_COLUMNS = (
+    UserORM.id,
+    UserORM.created_at,
+    UserORM.updated_at,
+    UserORM.email,
+    UserORM.first_name,
+    UserORM.last_name,
+    UserORM.is_verified,
+    UserORM.role,
+)
 
 
 class UserRepository(IUserRepository):
@@ -18,22 +71,38 @@ class UserRepository(IUserRepository):
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def get_by_id(self, user_id: int) -> UserEntity | None:
+    async def get_by_id(self, user_id: int, include_password: bool = False) -> UserEntity | None:
         """Return domain User by id or None if not found."""
-        orm = await self.session.get(UserORM, user_id)
-        return self._to_domain(orm)
+        stmt = select(*self._columns(include_password)).where(UserORM.id == user_id)
+        row = (await self.session.execute(stmt)).one_or_none()
+        return self._row_to_domain(row, include_password)
 
-    async def get_by_email(self, email: EmailAddress) -> UserEntity | None:
+    async def get_by_email(self, email: EmailAddress, include_password: bool = False) -> UserEntity | None:
         """Return domain User by email or None if not found."""
-        stmt = select(UserORM).where(UserORM.email == email.as_str())
-        orm = (await self.session.execute(stmt)).scalar_one_or_none()
-        return self._to_domain(orm)
+        stmt = select(*self._columns(include_password)).where(UserORM.email == email.as_str())
+        row = (await self.session.execute(stmt)).one_or_none()
+        return self._row_to_domain(row, include_password)
 
     async def list_paginated(self, offset: int, limit: int) -> Sequence[UserEntity]:
         """Return a page of domain Users."""
-        stmt = select(UserORM).order_by(UserORM.id).offset(offset).limit(limit)
-        rows = (await self.session.execute(stmt)).scalars().all()
-        return [self._to_domain(o) for o in rows]
+        stmt = select(*_ENTITY_COLUMNS).order_by(UserORM.id).offset(offset).limit(limit)
+        rows = (await self.session.execute(stmt)).all()
+        return [self._row_to_domain(r) for r in rows]
+
+    async def list_after(self, after_id: int | None, limit: int) -> Sequence[UserEntity]:
+        """Return the next page of domain Users after `after_id` (index range scan on the primary key)."""
+        stmt = select(*_ENTITY_COLUMNS).order_by(UserORM.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(UserORM.id > after_id)
+        rows = (await self.session.execute(stmt)).all()
+        return [self._row_to_domain(r) for r in rows]
+
+    async def stream_all(self, batch_size: int) -> AsyncIterator[UserEntity]:
+        """Yield all domain Users ordered by id from a server-side cursor (constant memory)."""
+        stmt = select(*_ENTITY_COLUMNS).order_by(UserORM.id).execution_options(yield_per=batch_size)
+        result = await self.session.stream(stmt)
+        async for row in result:
+            yield self._row_to_domain(row)
 
     async def add(self, data: dict) -> UserEntity:
         """Persist a new domain User and return it with identity assigned."""
@@ -42,6 +111,104 @@ class UserRepository(IUserRepository):
         orm: UserORM = result.scalar_one()
         return self._to_domain(orm)
 
+    async def add_with_verification(self, data: dict, verification: dict, outbox: dict | None = None) -> UserEntity | None:
+        """
+        Insert a user, its first verification and (optionally) an outbox message in one statement;
+        return None if the email is taken.
+
+        ON CONFLICT (email) DO NOTHING makes the duplicate check atomic, and the dependent inserts
+        select from the first CTE, so nothing else is written for a duplicate and everything is a
+        single round-trip.
+        """
+        new_user = (
+            pg_insert(UserORM)
+            .values(**data)
+            .on_conflict_do_nothing(index_elements=[UserORM.email])
+            .returning(*UserORM.__table__.c)
+            .cte("new_user")
+        )
+        stmt = select(aliased(UserORM, new_user)).add_cte(
+            self._insert_for_new_user(
+                VerificationORM, new_user, {"user_id": new_user.c.id}, verification, "new_verification"
+            )
+        )
+        if outbox is not None:
+            stmt = stmt.add_cte(self._insert_for_new_user(OutboxORM, new_user, {}, outbox, "new_outbox"))
+        orm = (await self.session.execute(stmt)).scalar_one_or_none()
+        return self._to_domain(orm)
+
+    @staticmethod
+    def _insert_for_new_user(model: type, new_user: CTE, columns: dict, values: dict, name: str) -> CTE:
+        """INSERT ... SELECT over the `new_user` CTE: one row if the user was inserted, none otherwise."""
+        table = model.__table__
+        exprs = {**columns, **{k: literal(v, table.c[k].type) for k, v in values.items()}}
+        return insert(model).from_select(list(exprs), select(*exprs.values()).select_from(new_user)).cte(name)
+
+    async def verify_with_code(self, email: EmailAddress, code: str, now: datetime) -> tuple[int, bool] | None:
+        """
+        Consume the user's latest verification if it matches `code` and mark the user verified.
+
+        One statement: the latest-code lookup, the consume and the user flip are CTEs. The consume
+        re-checks `consumed_at IS NULL` on the row it updates, so of two concurrent requests with
+        the same code only one wins.
+        """
+        target = select(UserORM.id).where(UserORM.email == email.as_str()).cte("target")
+        latest = (
+            select(VerificationORM.id)
+            .where(VerificationORM.user_id == target.c.id)
+            .order_by(VerificationORM.created_at.desc(), VerificationORM.id.desc())
+            .limit(1)
+            # Not correlated to the UPDATE's own verifications row, or every code of the user would match.
+            .correlate(None)
+            .scalar_subquery()
+        )
+        consumed = (
+            update(VerificationORM)
+            .where(
+                VerificationORM.id == latest,
+                VerificationORM.code == code,
+                VerificationORM.expires_at > now,
+                VerificationORM.consumed_at.is_(None),
+            )
+            .values(consumed_at=now)
+            .returning(VerificationORM.user_id)
+            .cte("consumed")
+        )
+        verified = (
+            update(UserORM)
+            .where(UserORM.id == consumed.c.user_id)
+            .values(is_verified=True)
+            .returning(UserORM.id)
+            .cte("verified")
+        )
+        stmt = select(target.c.id, exists(select(verified.c.id)))
+        row = (await self.session.execute(stmt)).one_or_none()
+        return None if row is None else (row[0], row[1])
+
+    async def bulk_insert(self, records: Sequence[dict]) -> list[str]:
+        """
+        Insert many users, skipping emails that already exist; return the emails actually inserted.
+
+        Rows are streamed with COPY into a temporary table (dropped on commit) and moved into `users`
+        with one INSERT ... SELECT ... ON CONFLICT (email) DO NOTHING.
+        """
+        conn = await self.session.connection()
+        await conn.run_sync(lambda sync_conn: _users_import.create(sync_conn))
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            _users_import.name,
+            records=[(*(r[c] for c in _IMPORT_COLUMNS[:-1]), UserRole(r["role"]).name) for r in records],
+            columns=_IMPORT_COLUMNS,
+        )
+        columns = [c for c in _users_import.c if c.name != "role"]
+        stmt = (
+            pg_insert(UserORM)
+            .from_select(_IMPORT_COLUMNS, select(*columns, cast(_users_import.c.role, UserORM.__table__.c.role.type)))
+            .on_conflict_do_nothing(index_elements=[UserORM.email])
+            .returning(UserORM.email)
+        )
+        return list((await conn.execute(stmt)).scalars())
+
     async def update(self, user_id: int, data: dict) -> UserEntity | None:
         """Persist changes to existing User and return it."""
 
@@ -56,7 +223,91 @@ class UserRepository(IUserRepository):
         stmt = delete(UserORM).where(UserORM.id == user_id)
         await self.session.execute(stmt)
 
+    async def update_many(
+        self,
+        data: dict,
+        ids: Sequence[int] | None = None,
+        where: UserFilter | None = None,
+        limit: int | None = None,
+        exclude_id: int | None = None,
+    ) -> list[int]:
+        """Apply the same changes to every selected user in one statement; return the ids updated."""
+        stmt = update(UserORM).where(*self._selection(ids, where, limit, exclude_id)).values(**data)
+        return list((await self.session.execute(stmt.returning(UserORM.id))).scalars())
+
+    async def delete_many(
+        self,
+        ids: Sequence[int] | None = None,
+        where: UserFilter | None = None,
+        limit: int | None = None,
+        exclude_id: int | None = None,
+    ) -> list[int]:
+        """Delete every selected user in one statement; return the ids deleted."""
+        stmt = delete(UserORM).where(*self._selection(ids, where, limit, exclude_id)).returning(UserORM.id)
+        return list((await self.session.execute(stmt)).scalars())
+
+    @staticmethod
+    def _selection(
+        ids: Sequence[int] | None, where: UserFilter | None, limit: int | None = None, exclude_id: int | None = None
+    ) -> list[ColumnElement[bool]]:
+        """
+        WHERE clauses for batch operations; refuses to select every user.
+
+        With `limit`, only the first `limit` matching ids (by id) are selected.
+        """
+        if ids is None and (where is None or where.is_empty()):
+            raise ValueError("Batch operation needs ids or a non-empty filter")
+        clauses: list[ColumnElement[bool]] = []
+        if exclude_id is not None:
+            clauses.append(UserORM.id != exclude_id)
+        if ids is not None:
+            # One array parameter instead of one bind parameter per id.
+            clauses.append(UserORM.id == any_(cast(list(ids), ARRAY(Integer))))
+        if where is not None:
+            clauses.extend(UserRepository._filter_clauses(where))
+        if limit is not None:
+            # = ANY(ARRAY(...)) keeps the outer statement a primary key lookup (as in cleanup_unverified).
+            capped = select(UserORM.id).where(*clauses).order_by(UserORM.id).limit(limit)
+            return [UserORM.id == any_(func.array(capped.scalar_subquery()))]
+        return clauses
+
+    @staticmethod
+    def _filter_clauses(where: UserFilter) -> list[ColumnElement[bool]]:
+        clauses: list[ColumnElement[bool]] = []
+        if where.role is not None:
+            clauses.append(UserORM.role == where.role)
+        if where.is_verified is not None:
+            clauses.append(UserORM.is_verified == where.is_verified)
+        if where.created_before is not None:
+            clauses.append(UserORM.created_at < where.created_before)
+        if where.created_after is not None:
+            clauses.append(UserORM.created_at >= where.created_after)
+        if where.email_domain is not None:
+            clauses.append(UserORM.email.endswith(f"@{where.email_domain.lower()}", autoescape=True))
+        return clauses
+
     # ---------- mapping helpers ----------
+    @staticmethod
+    def _columns(include_password: bool) -> tuple:
+        return (*_ENTITY_COLUMNS, UserORM.password) if include_password else _ENTITY_COLUMNS
+
+    @staticmethod
+    def _row_to_domain(row: Row | None, include_password: bool = False) -> UserEntity | None:
+        """Convert a row of _columns() into domain entity (`password` is None unless selected)."""
+        if row is None:
+            return None
+        return UserEntity(
+            id=row.id,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            email=EmailAddress(row.email),
+            password=row.password if include_password else None,
+            first_name=row.first_name,
+            last_name=row.last_name,
+            is_verified=row.is_verified,
+            role=row.role,  # already a UserRole, the column type converts it
+        )
+
     @staticmethod
     def _to_domain(orm: UserORM | None) -> UserEntity | None:
         """Convert ORM model into domain entity."""
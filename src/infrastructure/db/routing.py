@@ -0,0 +1,92 @@
+import itertools
+import logging
+import time
+from contextvars import ContextVar
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.cache.lru import TTLLRUCache
+
+log = logging.getLogger(__name__)
+
+REDIS_BACKOFF_SEC = 5.0  # how long to skip Redis after a failure
+
+# Who the current request acts for (JWT subject), and whether it has already committed a write.
+_route_key: ContextVar[str | None] = ContextVar("db_route_key", default=None)
+_wrote: ContextVar[bool] = ContextVar("db_wrote", default=False)
+
+
+def bind_route_key(key: str | None) -> None:
+    """Attach the caller's identity to the current request for read-your-writes routing."""
+    _route_key.set(key)
+
+
+class ReplicaRouter:
+    """
+    Picks the engine for read-only units of work.
+
+    Reads are spread round-robin over the replicas, except for callers that wrote recently: after a
+    write commits, the same request and, for `sticky_sec`, every request bound to the same route key
+    read from the primary so they see their own changes despite replication lag. The sticky marks
+    live in Redis (shared by all workers) with a per-worker copy; if Redis is down, marked callers
+    found only on other workers may briefly read from a replica.
+    """
+
+    def __init__(self, primary: AsyncEngine, replicas: list[AsyncEngine], sticky_sec: float, redis: Redis) -> None:
+        self.primary = primary
+        self.replicas = replicas
+        self._cycle = itertools.cycle(replicas)
+        self._sticky_sec = sticky_sec
+        self._redis = redis
+        self._local: TTLLRUCache[str, bool] = TTLLRUCache(10_000, sticky_sec)
+        self._redis_down_until = 0.0
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self.replicas)
+
+    async def engine_for_read(self) -> AsyncEngine:
+        """Return a replica engine, or the primary when the caller must read its own writes."""
+        if not self.replicas or _wrote.get():
+            return self.primary
+        key = _route_key.get()
+        if key is not None and await self._is_sticky(key):
+            return self.primary
+        return next(self._cycle)
+
+    async def record_write(self) -> None:
+        """Pin the current request (and its route key) to the primary after a committed write."""
+        if not self.replicas:
+            return
+        _wrote.set(True)
+        key = _route_key.get()
+        if key is None:
+            return
+        self._local.set(key, True)
+        if time.monotonic() < self._redis_down_until:
+            return
+        try:
+            await self._redis.set(_sticky_key(key), 1, px=int(self._sticky_sec * 1000))
+        except (RedisError, OSError) as err:
+            self._redis_failed(err)
+
+    async def _is_sticky(self, key: str) -> bool:
+        if self._local.get(key):
+            return True
+        if time.monotonic() < self._redis_down_until:
+            return False
+        try:
+            return bool(await self._redis.exists(_sticky_key(key)))
+        except (RedisError, OSError) as err:
+            self._redis_failed(err)
+            return False
+
+    def _redis_failed(self, err: Exception) -> None:
+        self._redis_down_until = time.monotonic() + REDIS_BACKOFF_SEC
+        log.warning("replica router: redis unavailable, using per-worker sticky marks for %.0fs: %s", REDIS_BACKOFF_SEC, err)
+
+
+def _sticky_key(key: str) -> str:
+    return f"db:rw:{key}"
@@ -2,22 +2,49 @@ from types import TracebackType
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.configs.cache import cache_settings
 from src.domain.interfaces.uow import IUnitOfWork
-from src.infrastructure.db.base import async_session_maker
+from src.domain.interfaces.user_repo import IUserRepository
+from src.infrastructure.cache.user_cache import CachedUserRepository, user_cache
+from src.infrastructure.db.base import async_session_maker, db_settings, read_only_session_maker, replica_router
+from src.infrastructure.db.repositories.outbox_repository import OutboxRepository
 from src.infrastructure.db.repositories.user_repo import UserRepository
 from src.infrastructure.db.repositories.verification_repository import VerificationRepository
 
 
 class SqlAlchemyUnitOfWork(IUnitOfWork):
-    def __init__(self) -> None:
+    """
+    Transaction boundary over one AsyncSession.
+
+    The connection is checked out on the first query, not on enter. In read-only mode the
+    transaction is opened as READ ONLY and is never committed: exit just releases the connection.
+    Read-only units of work may be routed to a replica (see ReplicaRouter); committed writes pin
+    the caller to the primary for a while so it reads its own changes.
+    """
+
+    def __init__(self, read_only: bool = False, use_replica: bool = False) -> None:
+        self.is_read_only = read_only
+        self.use_replica = read_only and use_replica
         self.session: AsyncSession | None = None
-        self.users: UserRepository | None = None
+        self.users: IUserRepository | None = None
         self.verifications: VerificationRepository | None = None
+        self.outbox: OutboxRepository | None = None
+
+    def read_only(self, use_replica: bool = True) -> "SqlAlchemyUnitOfWork":
+        return SqlAlchemyUnitOfWork(read_only=True, use_replica=use_replica)
 
     async def __aenter__(self) -> "SqlAlchemyUnitOfWork":
-        self.session = async_session_maker()
+        if self.use_replica:
+            self.session = read_only_session_maker(bind=await replica_router.engine_for_read())
+        elif self.is_read_only:
+            self.session = read_only_session_maker()
+        else:
+            self.session = async_session_maker()
         self.users = UserRepository(self.session)
+        if cache_settings.ENABLED:
+            self.users = CachedUserRepository(self.users, user_cache)
         self.verifications = VerificationRepository(self.session)
+        self.outbox = OutboxRepository(self.session)
         return self
 
     async def __aexit__(
@@ -28,12 +55,18 @@ class SqlAlchemyUnitOfWork(IUnitOfWork):
     ) -> None:
         if exc_type:
             await self.rollback()
-        else:
+        elif not self.is_read_only:
             await self.commit()
         await self.session.close()
 
     async def commit(self) -> None:
         await self.session.commit()
+        await replica_router.record_write()
+        if isinstance(self.users, CachedUserRepository):
+            # A lagging replica may re-cache pre-commit rows; drop them again once it has caught up.
+            await self.users.after_commit(
+                replica_lag_sec=db_settings.READ_YOUR_WRITES_SEC if replica_router.has_replicas else 0
+            )
 
     async def rollback(self) -> None:
         await self.session.rollback()
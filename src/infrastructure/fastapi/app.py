@@ -1,13 +1,35 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 
-from src.ui.api.routers import auth, users
+from src.configs.metrics import metrics_settings
+from src.infrastructure.monitoring.middleware import PrometheusMiddleware, ServerTimingMiddleware
+from src.infrastructure.redis_client import close_redis
+from src.infrastructure.security.argon2_password_hasher import hasher
+from src.ui.api.routers import auth, jwks, metrics, users
 from src.ui.errors import install_error_handlers
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Release per-worker resources on shutdown."""
+    yield
+    hasher.pool.shutdown()
+    hasher.bulk_pool.shutdown()
+    await close_redis()
+
+
 def create_app() -> FastAPI:
     """Build FastAPI application."""
-    app_ = FastAPI(title="Coffee Shop API - Users", version="1.0.0")
+    app_ = FastAPI(
+        title="Coffee Shop API - Users",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
 
     app_.add_middleware(
         CORSMiddleware,
@@ -15,11 +37,17 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
-        expose_headers=[],
+        expose_headers=["Server-Timing"],
     )
+    app_.add_middleware(ServerTimingMiddleware, header=metrics_settings.SERVER_TIMING)
+    if metrics_settings.ENABLED:
+        app_.add_middleware(PrometheusMiddleware)  # added last = outermost, so it times everything
 
     install_error_handlers(app_)
     app_.include_router(auth.router)
     app_.include_router(users.router)
+    app_.include_router(jwks.router)
+    if metrics_settings.ENABLED:
+        app_.include_router(metrics.router)
 
     return app_
@@ -0,0 +1,117 @@
+"""
+Prometheus metrics of the API and the Celery worker.
+
+Every process records into prometheus_client's default registry. When PROMETHEUS_MULTIPROC_DIR is
+set (it must be, before prometheus_client is imported, whenever a host runs several worker
+processes), values are written to files in that directory and `registry()` aggregates the files
+of all processes, so any worker can serve the totals. The directory has to be emptied before the
+server starts (start_app.sh / start_celery.sh) and exited workers are marked dead with
+`mark_process_dead` (gunicorn.conf.py, worker_process_shutdown) so their live gauges are dropped.
+"""
+
+import os
+from functools import cache
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# ---------- HTTP ----------
+HTTP_REQUESTS = Counter("http_requests_total", "HTTP requests by route template and status.", ["method", "route", "status"])
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency until the response is fully sent.",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "HTTP requests being served.", ["method"], multiprocess_mode="livesum"
+)
+
+# ---------- admission control ----------
+ADMISSION_WAITING = Gauge("admission_waiting", "Requests queued for an Argon2 admission slot.", multiprocess_mode="livesum")
+ADMISSION_REJECTED = Counter("admission_rejected_total", "Requests rejected with 503 by admission control.", ["reason"])
+
+# ---------- caches and rate limiting ----------
+USER_CACHE_HITS = Counter("user_cache_hits_total", "User cache hits by tier (l1, redis).", ["tier"])
+USER_CACHE_MISSES = Counter("user_cache_misses_total", "User cache misses by tier (l1, redis).", ["tier"])
+USER_CACHE_EVICTIONS = Counter("user_cache_evictions_total", "Entries evicted from the in-process user cache (L1).")
+USER_CACHE_REDIS_ERRORS = Counter("user_cache_redis_errors_total", "Redis failures of the user cache.")
+TOKEN_CACHE_HITS = Counter("token_cache_hits_total", "Access tokens served from the verified-token cache.")
+TOKEN_CACHE_MISSES = Counter("token_cache_misses_total", "Access tokens that needed a full signature check.")
+TOKEN_CACHE_EVICTIONS = Counter("token_cache_evictions_total", "Entries evicted from the verified-token cache.")
+RATE_LIMIT_REQUESTS = Counter(
+    "rate_limit_requests_total", "Rate-limited requests by result (allowed, rejected).", ["result"]
+)
+RATE_LIMIT_REDIS_ERRORS = Counter("rate_limit_redis_errors_total", "Redis failures of the rate limiter.")
+
+# ---------- DB connection pool ----------
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Connections currently checked out of the pool.", ["pool"], multiprocess_mode="livesum"
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Connections open beyond pool_size (max_overflow).", ["pool"], multiprocess_mode="livesum"
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time to get a connection from the pool, including opening a new one.",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+# ---------- password hashing ----------
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Argon2 call latency, including the wait for a hashing pool worker.",
+    ["op"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+# ---------- mail ----------
+MAIL_SEND_DURATION = Histogram(
+    "mail_send_duration_seconds",
+    "SMTP send latency per message (pool checkout, reconnects and retry included).",
+    ["result"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+# ---------- background tasks ----------
+CELERY_TASKS = Counter("celery_tasks_total", "Finished Celery tasks by final state.", ["task", "state"])
+CELERY_TASK_DURATION = Histogram(
+    "celery_task_duration_seconds",
+    "Celery task run time.",
+    ["task"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0),
+)
+CLEANUP_DELETED_USERS = Counter("cleanup_deleted_users_total", "Stale unverified users deleted by cleanup_unverified.")
+OUTBOX_MESSAGES = Counter(
+    "outbox_messages_total", "Outbox delivery attempts by result (sent, failed, gave_up).", ["kind", "result"]
+)
+
+
+@cache
+def registry() -> CollectorRegistry:
+    """Registry to expose: all processes' values in multiprocess mode, else this process's."""
+    if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return REGISTRY
+    reg = CollectorRegistry()
+    multiprocess.MultiProcessCollector(reg)
+    return reg
+
+
+def render() -> tuple[bytes, str]:
+    """Return the exposition text and its content type."""
+    return generate_latest(registry()), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop live gauges of an exited worker process (no-op in single-process mode)."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
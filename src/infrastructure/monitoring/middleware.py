@@ -0,0 +1,99 @@
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.db.instrumentation import RequestDbStats, start_request_stats, stop_request_stats
+from src.infrastructure.monitoring.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS, HTTP_REQUESTS_IN_PROGRESS
+
+log = logging.getLogger(__name__)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class PrometheusMiddleware:
+    """
+    Pure ASGI middleware recording request count, status and latency per route.
+
+    Requests are labelled with the route template (`/users/{user_id}`), which FastAPI stores in
+    the scope while routing, so label cardinality stays bounded; 404s share one label.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500  # if the app raises before starting a response
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_progress.dec()
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+            HTTP_REQUEST_DURATION.labels(method, route).observe(elapsed)
+
+
+class ServerTimingMiddleware:
+    """
+    Pure ASGI middleware collecting SQL stats for every request (see db/instrumentation.py).
+
+    With `header` on, responses carry `Server-Timing: db;dur=..;desc="N queries", db-pool;dur=..,
+    app;dur=..` (time in SQL statements, waiting for pooled connections, and until the response
+    started). Requests over their query budget are logged.
+    """
+
+    def __init__(self, app: ASGIApp, header: bool = True) -> None:
+        self.app = app
+        self.header = header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_request_stats()
+        start = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.header:
+                MutableHeaders(scope=message).append("Server-Timing", _server_timing(stats, time.perf_counter() - start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            stop_request_stats(token)
+            if stats.over_budget:
+                route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+                log.warning(
+                    "query budget exceeded: %s %s issued %d statements (budget %d)",
+                    scope["method"],
+                    route,
+                    stats.queries,
+                    stats.budget,
+                )
+
+
+def _server_timing(stats: RequestDbStats, elapsed_sec: float) -> str:
+    return (
+        f'db;dur={stats.db_time_sec * 1000:.2f};desc="{stats.queries} queries", '
+        f"db-pool;dur={stats.pool_wait_sec * 1000:.2f}, "
+        f"app;dur={elapsed_sec * 1000:.2f}"
+    )
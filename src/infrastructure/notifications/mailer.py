@@ -1,21 +1,57 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import email.utils
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
 from email.mime.text import MIMEText
 from typing import Final
 
 import aiosmtplib
 
-from src.configs.mail_settings import MailSettings
+from src.configs.mail_settings import MailSettings, mail_settings
+from src.infrastructure.monitoring.metrics import MAIL_SEND_DURATION
+
+# Errors after which a pooled connection is known to be dead (the server closed it or never answered).
+_DISCONNECTED: Final = (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPTimeoutError, ConnectionError)
+
+
+@dataclass(frozen=True, slots=True)
+class OutgoingEmail:
+    """Plain text email to one recipient."""
+
+    to_email: str
+    subject: str
+    body: str
+
+
+@dataclass(slots=True)
+class _PooledConnection:
+    smtp: aiosmtplib.SMTP
+    last_used: float
+    sent: int = 0
 
 
 class AioSMTPMailer:
     """
     Mailer adapter using aiosmtplib.
+
+    Keeps up to `pool_size` authenticated SMTP connections open and reuses them across messages,
+    so a send costs one MAIL/RCPT/DATA exchange instead of connect + EHLO + STARTTLS + AUTH.
+    A connection idle for longer than `pool_check_idle_sec` is checked with NOOP before reuse; a
+    connection found dead while sending is replaced and the message retried once.
+
+    Connections belong to the event loop that opened them: use one mailer per process and loop
+    (see `mailer`), and `close()` it on shutdown.
     """
 
     def __init__(self, settings: MailSettings) -> None:
         self._cfg = settings
+        self._idle: list[_PooledConnection] = []
+        self._slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     async def send_text(
         self,
@@ -31,30 +67,137 @@ class AioSMTPMailer:
             subject: Email subject.
             body: Plain text content.
         """
-        msg = MIMEText(body, _charset="utf-8")
-        sender_formatted = email.utils.formataddr((self._cfg.sender_name, self._cfg.sender_email))
-        msg["From"] = sender_formatted
-        msg["To"] = to_email
-        msg["Subject"] = subject
-
-        # Connect & send
-        await aiosmtplib.send(
-            msg,
+        async with self._pool_slots():
+            await self._send(self._build(OutgoingEmail(to_email, subject, body)))
+
+    async def send_many(self, messages: Sequence[OutgoingEmail]) -> list[Exception | None]:
+        """
+        Send messages over up to `pool_size` connections in parallel.
+
+        Failures do not stop the batch: returns, in input order, None for each delivered message
+        or the exception that prevented its delivery.
+        """
+        results: list[Exception | None] = [None] * len(messages)
+        pending = iter(range(len(messages)))
+
+        async def worker() -> None:
+            async with self._pool_slots():
+                for i in pending:
+                    try:
+                        await self._send(self._build(messages[i]))
+                    except (aiosmtplib.SMTPException, OSError) as err:
+                        results[i] = err
+
+        await asyncio.gather(*(worker() for _ in range(min(self._cfg.pool_size, len(messages)))))
+        return results
+
+    async def close(self) -> None:
+        """QUIT every idle connection (call on shutdown)."""
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await self._quit(conn)
+
+    # ---------- pool ----------
+    def _pool_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Connections opened on another (closed) loop cannot be used or closed cleanly from here.
+            self._idle = []
+            self._slots = asyncio.Semaphore(self._cfg.pool_size)
+            self._loop = loop
+        assert self._slots is not None
+        return self._slots
+
+    async def _send(self, msg: MIMEText) -> None:
+        start = time.perf_counter()
+        result = "error"
+        try:
+            await self._send_pooled(msg)
+            result = "ok"
+        finally:
+            MAIL_SEND_DURATION.labels(result).observe(time.perf_counter() - start)
+
+    async def _send_pooled(self, msg: MIMEText) -> None:
+        conn = await self._acquire()
+        try:
+            await conn.smtp.send_message(msg)
+        except _DISCONNECTED:
+            conn.smtp.close()
+            if not conn.sent:  # a fresh connection failed: the relay is down, do not retry
+                raise
+            conn = await self._connect()
+            try:
+                await conn.smtp.send_message(msg)
+            except BaseException:
+                conn.smtp.close()
+                raise
+        except BaseException:
+            # The session may be mid-transaction (e.g. a refused recipient): start over next time.
+            conn.smtp.close()
+            raise
+        conn.sent += 1
+        await self._release(conn)
+
+    async def _acquire(self) -> _PooledConnection:
+        # LIFO: keep the most recently used connections busy and let the rest go idle.
+        while self._idle:
+            conn = self._idle.pop()
+            if time.monotonic() - conn.last_used < self._cfg.pool_check_idle_sec:
+                return conn
+            try:
+                await conn.smtp.noop()
+            except (aiosmtplib.SMTPException, OSError):
+                conn.smtp.close()
+                continue
+            return conn
+        return await self._connect()
+
+    async def _release(self, conn: _PooledConnection) -> None:
+        if conn.sent >= self._cfg.pool_max_messages:
+            await self._quit(conn)
+            return
+        conn.last_used = time.monotonic()
+        self._idle.append(conn)
+
+    async def _connect(self) -> _PooledConnection:
+        smtp = aiosmtplib.SMTP(
             hostname=self._cfg.smtp_host,
             port=self._cfg.smtp_port,
             username=self._cfg.smtp_username,
             password=self._cfg.smtp_password,
             start_tls=self._cfg.smtp_starttls,
-            timeout=10.0,
+            timeout=self._cfg.smtp_timeout_sec,
         )
+        await smtp.connect()  # also does STARTTLS and AUTH when configured
+        return _PooledConnection(smtp, last_used=time.monotonic())
+
+    @staticmethod
+    async def _quit(conn: _PooledConnection) -> None:
+        with contextlib.suppress(aiosmtplib.SMTPException, OSError):
+            await conn.smtp.quit()
+        conn.smtp.close()
+
+    def _build(self, message: OutgoingEmail) -> MIMEText:
+        msg = MIMEText(message.body, _charset="utf-8")
+        msg["From"] = email.utils.formataddr((self._cfg.sender_name, self._cfg.sender_email))
+        msg["To"] = message.to_email
+        msg["Subject"] = message.subject
+        return msg
+
+
+def verification_code_email(to_email: str, code: str) -> OutgoingEmail:
+    """Build the verification code email."""
+    subject: Final[str] = "Your Coffee Shop verification code"
+    body: Final[str] = f"Your verification code: {code}\nIf you didn't request this, ignore this email."
+    return OutgoingEmail(to_email, subject, body)
 
 
 async def send_verification_code_email(to_email: str, code: str) -> None:
     """
-    Send verification code email, using default MailSettings.
+    Send verification code email through the process-wide mailer.
     """
-    settings = MailSettings()
-    mailer = AioSMTPMailer(settings)
-    subject: Final[str] = "Your Coffee Shop verification code"
-    body: Final[str] = f"Your verification code: {code}\nIf you didn't request this, ignore this email."
-    await mailer.send_text(to_email, subject, body)
+    message = verification_code_email(to_email, code)
+    await mailer.send_text(message.to_email, message.subject, message.body)
+
+
+mailer = AioSMTPMailer(mail_settings)
@@ -0,0 +1,25 @@
+from redis.asyncio import Redis
+
+from src.configs.redis import redis_settings
+
+_clients: dict[int, Redis] = {}
+
+
+def get_redis(db: int) -> Redis:
+    """Return the process-wide asyncio Redis client for the given logical database."""
+    client = _clients.get(db)
+    if client is None:
+        client = _clients[db] = Redis.from_url(
+            redis_settings.DSN(db),
+            socket_connect_timeout=0.2,
+            socket_timeout=0.2,
+        )
+    return client
+
+
+async def close_redis() -> None:
+    """Close every client created by get_redis (call on shutdown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
@@ -0,0 +1,95 @@
+"""
+Argon2 parameter calibration.
+
+Benchmarks the current host and picks the strongest parameters whose verify latency stays
+around a target within a memory budget. Usage:
+
+    python -m src.infrastructure.security.argon2_calibration --target-ms 250 --max-memory-mb 64
+
+Prints HASHER_* assignments that can be put into `.env` or eval'ed by the entrypoint.
+Stored hashes are upgraded transparently on the next successful login (see AuthService.login).
+"""
+
+import argparse
+import os
+import statistics
+import time
+from dataclasses import dataclass
+
+from argon2 import PasswordHasher
+
+from src.configs.hasher import hasher_settings
+
+MIN_MEMORY_KB = 19 * 1024  # OWASP floor for argon2id
+SAMPLES = 3
+
+
+@dataclass(frozen=True, slots=True)
+class Argon2Params:
+    time_cost: int
+    memory_cost_kb: int
+    parallelism: int
+
+    def as_env(self, prefix: str = "") -> str:
+        """Render parameters as HASHER_* assignments (one per line)."""
+        return "\n".join(
+            [
+                f"{prefix}HASHER_TIME_COST={self.time_cost}",
+                f"{prefix}HASHER_MEMORY_COST_KB={self.memory_cost_kb}",
+                f"{prefix}HASHER_PARALLELISM={self.parallelism}",
+            ]
+        )
+
+
+def measure_verify_ms(params: Argon2Params, samples: int = SAMPLES) -> float:
+    """Return median verify latency in milliseconds for the given parameters."""
+    ph = PasswordHasher(
+        time_cost=params.time_cost,
+        memory_cost=params.memory_cost_kb,
+        parallelism=params.parallelism,
+    )
+    hashed = ph.hash("calibration-password")
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        ph.verify(hashed, "calibration-password")
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, max_memory_kb: int, parallelism: int | None = None) -> Argon2Params:
+    """
+    Pick Argon2 parameters for this host.
+
+    Memory is the primary cost (it is what makes GPU attacks expensive), so it starts at the budget
+    and is halved only while even a single pass is slower than the target. The remaining time budget
+    is then spent on passes (time_cost), which scale latency roughly linearly.
+    """
+    parallelism = parallelism or min(os.cpu_count() or 1, 4)
+    memory_kb = max_memory_kb
+
+    one_pass_ms = measure_verify_ms(Argon2Params(1, memory_kb, parallelism))
+    while one_pass_ms > target_ms and memory_kb // 2 >= MIN_MEMORY_KB:
+        memory_kb //= 2
+        one_pass_ms = measure_verify_ms(Argon2Params(1, memory_kb, parallelism))
+
+    time_cost = max(1, int(target_ms // max(one_pass_ms, 0.001)))
+    while time_cost > 1 and measure_verify_ms(Argon2Params(time_cost, memory_kb, parallelism)) > target_ms:
+        time_cost -= 1
+    return Argon2Params(time_cost, memory_kb, parallelism)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Calibrate Argon2 parameters for this host.")
+    parser.add_argument("--target-ms", type=float, default=hasher_settings.CALIBRATION_TARGET_MS)
+    parser.add_argument("--max-memory-mb", type=int, default=hasher_settings.CALIBRATION_MAX_MEMORY_KB // 1024)
+    parser.add_argument("--parallelism", type=int, default=None)
+    parser.add_argument("--export", action="store_true", help="prefix lines with `export ` for shell eval")
+    args = parser.parse_args(argv)
+
+    params = calibrate(args.target_ms, args.max_memory_mb * 1024, args.parallelism)
+    print(params.as_env(prefix="export " if args.export else ""))
+
+
+if __name__ == "__main__":
+    main()
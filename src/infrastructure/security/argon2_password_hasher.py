@@ -1,21 +1,61 @@
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
+import asyncio
+from collections.abc import Sequence
+from functools import lru_cache
 
+from argon2 import PasswordHasher, extract_parameters
+from argon2.exceptions import InvalidHashError, VerifyMismatchError
+from argon2.low_level import ARGON2_VERSION
+
+from src.configs.hasher import HasherSettings, hasher_settings
 from src.domain.ports.password_hasher import PasswordHasher as PasswordHasherPort
+from src.infrastructure.monitoring.metrics import PASSWORD_HASH_DURATION
+from src.infrastructure.security.hashing_pool import BoundedExecutor
 
 
 class Argon2PasswordHasher(PasswordHasherPort):
     """
     Argon2 adapter for PasswordHasher port.
+
+    Async methods run in a bounded worker pool so that hashing never stalls the event loop.
+    Bulk hashing uses its own small process pool: imports cannot fill the interactive pool's
+    queue, but they do compete with it for CPU.
     """
 
-    def __init__(self, time_cost: int = 3, memory_cost_kb: int = 64 * 1024, parallelism: int = 4) -> None:
-        self._ph = PasswordHasher(
-            time_cost=time_cost,
-            memory_cost=memory_cost_kb,
-            parallelism=parallelism,
+    def __init__(
+        self,
+        time_cost: int = 3,
+        memory_cost_kb: int = 64 * 1024,
+        parallelism: int = 4,
+        pool: BoundedExecutor | None = None,
+        bulk_pool: BoundedExecutor | None = None,
+        bulk_chunk_size: int = 64,
+    ) -> None:
+        self._params = (time_cost, memory_cost_kb, parallelism)
+        self._ph = _argon2(*self._params)
+        self._pool = pool or BoundedExecutor("thread", max_workers=None, queue_size=32)
+        self._bulk_pool = bulk_pool or BoundedExecutor("process", max_workers=None, queue_size=0)
+        self._bulk_chunk_size = bulk_chunk_size
+
+    @classmethod
+    def from_settings(cls, settings: HasherSettings) -> "Argon2PasswordHasher":
+        """Build hasher and its worker pool from HasherSettings."""
+        return cls(
+            time_cost=settings.TIME_COST,
+            memory_cost_kb=settings.MEMORY_COST_KB,
+            parallelism=settings.PARALLELISM,
+            pool=BoundedExecutor(settings.POOL_KIND, settings.POOL_WORKERS, settings.POOL_QUEUE_SIZE),
+            bulk_pool=BoundedExecutor("process", settings.BULK_POOL_WORKERS, queue_size=0),
+            bulk_chunk_size=settings.BULK_CHUNK_SIZE,
         )
 
+    @property
+    def pool(self) -> BoundedExecutor:
+        return self._pool
+
+    @property
+    def bulk_pool(self) -> BoundedExecutor:
+        return self._bulk_pool
+
     def hash(self, raw: str) -> str:
         """Hash a raw password using Argon2."""
         return self._ph.hash(raw)
@@ -27,5 +67,70 @@ class Argon2PasswordHasher(PasswordHasherPort):
         except VerifyMismatchError:
             return False
 
+    def needs_rehash(self, hashed: str) -> bool:
+        """
+        Return True if the stored hash is weaker than the current parameters.
+
+        Work is compared as time_cost * memory_cost, not parameter by parameter: hosts calibrated
+        differently then agree on which hash is stronger instead of rewriting each other's hashes
+        on every login.
+        """
+        try:
+            stored = extract_parameters(hashed)
+        except InvalidHashError:
+            return True
+        ph = self._ph
+        if stored.type is not ph.type or stored.version != ARGON2_VERSION:
+            return True
+        if stored.hash_len < ph.hash_len or stored.salt_len < ph.salt_len:
+            return True
+        return stored.time_cost * stored.memory_cost < ph.time_cost * ph.memory_cost
+
+    async def hash_async(self, raw: str) -> str:
+        """Hash a raw password in the worker pool."""
+        with PASSWORD_HASH_DURATION.labels("hash").time():
+            return await self._pool.run(_hash, self._params, raw)
+
+    async def verify_async(self, raw: str, hashed: str) -> bool:
+        """Verify a raw password in the worker pool."""
+        with PASSWORD_HASH_DURATION.labels("verify").time():
+            return await self._pool.run(_verify, self._params, raw, hashed)
+
+    async def hash_many_async(self, raws: Sequence[str]) -> list[str]:
+        """Hash passwords in chunks on the bulk process pool, at most one chunk per worker at a time."""
+        chunks = [raws[i : i + self._bulk_chunk_size] for i in range(0, len(raws), self._bulk_chunk_size)]
+        results: list[list[str]] = [[] for _ in chunks]
+        slots = asyncio.Semaphore(self._bulk_pool.max_workers)
+
+        async def run(i: int) -> None:
+            async with slots:
+                with PASSWORD_HASH_DURATION.labels("hash_many").time():
+                    results[i] = await self._bulk_pool.run(_hash_many, self._params, chunks[i])
+
+        await asyncio.gather(*(run(i) for i in range(len(chunks))))
+        return [hashed for chunk in results for hashed in chunk]
+
+
+# ---------- pool entry points (module-level so they can be pickled for process pools) ----------
+@lru_cache(maxsize=4)
+def _argon2(time_cost: int, memory_cost_kb: int, parallelism: int) -> PasswordHasher:
+    return PasswordHasher(time_cost=time_cost, memory_cost=memory_cost_kb, parallelism=parallelism)
+
+
+def _hash(params: tuple[int, int, int], raw: str) -> str:
+    return _argon2(*params).hash(raw)
+
+
+def _hash_many(params: tuple[int, int, int], raws: Sequence[str]) -> list[str]:
+    ph = _argon2(*params)
+    return [ph.hash(raw) for raw in raws]
+
+
+def _verify(params: tuple[int, int, int], raw: str, hashed: str) -> bool:
+    try:
+        return _argon2(*params).verify(hashed, raw)
+    except VerifyMismatchError:
+        return False
+
 
-hasher = Argon2PasswordHasher()
+hasher = Argon2PasswordHasher.from_settings(hasher_settings)
@@ -0,0 +1,68 @@
+import asyncio
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Literal, TypeVar
+
+from src.domain.exceptions import ServiceBusyError
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """
+    Thread/process pool with a bounded backlog for CPU-bound work.
+
+    At most `max_workers` calls run at once and at most `queue_size` more may wait for a worker.
+    Anything beyond that is rejected with ServiceBusyError instead of piling up in memory.
+    """
+
+    def __init__(self, kind: Literal["thread", "process"], max_workers: int | None, queue_size: int) -> None:
+        self._kind = kind
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._capacity = self._max_workers + queue_size
+        self._in_flight = 0
+        self._executor: Executor | None = None
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def in_flight(self) -> int:
+        """Number of submitted calls that have not finished yet (running + queued)."""
+        return self._in_flight
+
+    async def run(self, fn: Callable[..., T], *args: object) -> T:
+        """Run `fn(*args)` in the pool; raise ServiceBusyError if the backlog is full."""
+        if self._in_flight >= self._capacity:
+            raise ServiceBusyError("Too many concurrent password hashing requests")
+
+        loop = asyncio.get_running_loop()
+        fut: Future[T] = self._get_executor().submit(fn, *args)
+        self._in_flight += 1
+        # Release the slot when the work is really done, not when the awaiting request gives up.
+        fut.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+        return await asyncio.wrap_future(fut, loop=loop)
+
+    def shutdown(self) -> None:
+        """Stop the underlying pool (pending calls are cancelled)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+
+    def _get_executor(self) -> Executor:
+        # Created lazily so that every gunicorn worker gets its own pool after fork.
+        if self._executor is None:
+            if self._kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="hasher")
+        return self._executor
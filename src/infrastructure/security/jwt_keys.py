@@ -0,0 +1,121 @@
+"""
+Asymmetric JWT signing keys.
+
+Every `<kid>.pem` private key in JWT_KEYS_DIR is trusted for verification and published at
+/.well-known/jwks.json; JWT_ACTIVE_KID (or the newest kid) signs new tokens. Rotation:
+
+1. With JWT_ACTIVE_KID pinned to the current key, `python -m src.infrastructure.security.jwt_keys
+   --dir keys --alg EdDSA` adds a key. It is published right away but not used for signing yet.
+2. Once downstream JWKS caches have refreshed (JWT_JWKS_MAX_AGE_SEC), point JWT_ACTIVE_KID at it.
+3. After the longest token lifetime (JWT_REFRESH_TTL_DAYS) has passed, delete the old key file and
+   restart the workers. Keys are only read at startup, so the restart is what stops trusting the
+   old kid; it also drops the verified-token caches, which would otherwise keep accepting tokens
+   signed with it until they expire.
+"""
+
+import argparse
+import secrets
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes, PublicKeyTypes
+from jwt.algorithms import get_default_algorithms
+from jwt.exceptions import InvalidKeyError, InvalidTokenError
+
+ASYMMETRIC_ALGORITHMS = ("EdDSA", "RS256")
+_KEY_TYPES = {"EdDSA": ed25519.Ed25519PrivateKey, "RS256": rsa.RSAPrivateKey}
+
+
+@dataclass(frozen=True, slots=True)
+class SigningKey:
+    kid: str
+    private_key: PrivateKeyTypes
+    public_key: PublicKeyTypes
+
+
+class KeyRing:
+    """
+    Set of asymmetric keys: one signs, all of them verify.
+    """
+
+    def __init__(self, algorithm: str, keys: list[SigningKey], active_kid: str | None = None) -> None:
+        if algorithm not in ASYMMETRIC_ALGORITHMS:
+            raise InvalidKeyError(f"Unsupported asymmetric JWT algorithm: {algorithm}")
+        if not keys:
+            raise InvalidKeyError("No JWT signing keys configured")
+        for key in keys:
+            if not isinstance(key.private_key, _KEY_TYPES[algorithm]):
+                raise InvalidKeyError(f"JWT key {key.kid!r} is not a {algorithm} key")
+        self.algorithm = algorithm
+        self._keys = {k.kid: k for k in keys}
+        active_kid = active_kid or max(self._keys)  # kids are generated sortable by creation time
+        if active_kid not in self._keys:
+            raise InvalidKeyError(f"Active JWT key {active_kid!r} not found")
+        self._active = self._keys[active_kid]
+
+    @classmethod
+    def from_dir(cls, algorithm: str, keys_dir: str, active_kid: str | None = None) -> "KeyRing":
+        """Load every `<kid>.pem` private key from a directory."""
+        keys = []
+        for path in sorted(Path(keys_dir).glob("*.pem")):
+            private_key = serialization.load_pem_private_key(path.read_bytes(), password=None)
+            keys.append(SigningKey(kid=path.stem, private_key=private_key, public_key=private_key.public_key()))
+        return cls(algorithm, keys, active_kid)
+
+    @property
+    def signing_key(self) -> SigningKey:
+        return self._active
+
+    def verification_key(self, kid: str | None) -> PublicKeyTypes:
+        """Return the public key for a token's `kid` header; raise InvalidTokenError for unknown kids."""
+        key = self._keys.get(kid) if kid else None
+        if key is None:
+            raise InvalidTokenError("Unknown signing key")
+        return key.public_key
+
+    def jwks(self) -> dict:
+        """Return all public keys as a JWKS document."""
+        algorithm = get_default_algorithms()[self.algorithm]
+        keys = []
+        for key in self._keys.values():
+            jwk = algorithm.to_jwk(key.public_key, as_dict=True)
+            jwk.update(kid=key.kid, use="sig", alg=self.algorithm)
+            keys.append(jwk)
+        return {"keys": keys}
+
+
+def generate_key(keys_dir: str, algorithm: str) -> Path:
+    """Create a new private key file in `keys_dir` and return its path (file name is the kid)."""
+    if algorithm == "EdDSA":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    elif algorithm == "RS256":
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=3072)
+    else:
+        raise InvalidKeyError(f"Unsupported asymmetric JWT algorithm: {algorithm}")
+
+    kid = f"{datetime.now(UTC):%Y%m%d%H%M%S}-{secrets.token_hex(4)}"
+    path = Path(keys_dir) / f"{kid}.pem"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    path.write_bytes(pem)
+    path.chmod(0o600)
+    return path
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a JWT signing key.")
+    parser.add_argument("--dir", required=True, help="keys directory (JWT_KEYS_DIR)")
+    parser.add_argument("--alg", choices=ASYMMETRIC_ALGORITHMS, default="EdDSA")
+    args = parser.parse_args(argv)
+    print(generate_key(args.dir, args.alg).stem)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,17 +3,32 @@ from collections.abc import Mapping
 
 import jwt
 
-from src.configs.jwt import jwt_settings
+from src.configs.jwt import JWTSettings, jwt_settings
 from src.domain.ports.token_provider import TokenProvider
+from src.infrastructure.security.jwt_keys import ASYMMETRIC_ALGORITHMS, KeyRing
+from src.infrastructure.security.token_cache import VerifiedTokenCache
 
 
 class JwtTokenProvider(TokenProvider):
     """
     PyJWT adapter for TokenProvider port.
+
+    HS* algorithms use the shared secret. EdDSA/RS256 sign with the active key of a KeyRing and put
+    its `kid` in the header, so other services can verify tokens locally against the JWKS.
     """
 
-    def __init__(self) -> None:
-        self._settings = jwt_settings
+    def __init__(self, settings: JWTSettings = jwt_settings) -> None:
+        self._settings = settings
+        self._keys: KeyRing | None = None
+        if settings.algorithm in ASYMMETRIC_ALGORITHMS:
+            if not settings.keys_dir:
+                raise ValueError(f"JWT_KEYS_DIR is required for {settings.algorithm}")
+            self._keys = KeyRing.from_dir(settings.algorithm, settings.keys_dir, settings.active_kid)
+        self._cache = VerifiedTokenCache(settings.decode_cache_size) if settings.decode_cache_size else None
+
+    @property
+    def cache(self) -> VerifiedTokenCache | None:
+        return self._cache
 
     def issue_access(self, subject: str, claims: Mapping[str, str]) -> str:
         now = int(time.time())
@@ -24,7 +39,7 @@ class JwtTokenProvider(TokenProvider):
             "exp": now + self._settings.access_ttl_min * 60,
             **claims,
         }
-        return jwt.encode(payload, self._settings.secret, algorithm=self._settings.algorithm)
+        return self._encode(payload)
 
     def issue_refresh(self, subject: str) -> str:
         now = int(time.time())
@@ -34,10 +49,33 @@ class JwtTokenProvider(TokenProvider):
             "iat": now,
             "exp": now + self._settings.refresh_ttl_days * 86400,
         }
-        return jwt.encode(payload, self._settings.secret, algorithm=self._settings.algorithm)
+        return self._encode(payload)
 
     def decode(self, token: str) -> dict:
-        return jwt.decode(token, self._settings.secret, algorithms=[self._settings.algorithm])
+        """Return claims of a valid token; repeat tokens are served from the verified-token cache."""
+        if self._cache is None:
+            return self._decode(token)
+        claims = self._cache.get(token)
+        if claims is None:
+            claims = self._decode(token)
+            self._cache.put(token, claims)
+        return dict(claims)  # callers get their own copy
+
+    def jwks(self) -> dict:
+        """Return public verification keys as a JWKS document (no keys for HS* algorithms)."""
+        return self._keys.jwks() if self._keys else {"keys": []}
+
+    def _encode(self, payload: dict) -> str:
+        if self._keys is None:
+            return jwt.encode(payload, self._settings.secret, algorithm=self._settings.algorithm)
+        key = self._keys.signing_key
+        return jwt.encode(payload, key.private_key, algorithm=self._keys.algorithm, headers={"kid": key.kid})
+
+    def _decode(self, token: str) -> dict:
+        if self._keys is None:
+            return jwt.decode(token, self._settings.secret, algorithms=[self._settings.algorithm])
+        kid = jwt.get_unverified_header(token).get("kid")
+        return jwt.decode(token, self._keys.verification_key(kid), algorithms=[self._keys.algorithm])
 
 
 token_provider = JwtTokenProvider()
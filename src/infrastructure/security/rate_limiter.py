@@ -0,0 +1,147 @@
+import copy
+import logging
+import math
+import secrets
+import time
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.configs.rate_limit import RateLimitSettings, rate_limit_settings
+from src.infrastructure.cache.lru import TTLLRUCache
+from src.infrastructure.monitoring.metrics import RATE_LIMIT_REDIS_ERRORS, RATE_LIMIT_REQUESTS
+from src.infrastructure.redis_client import get_redis
+
+log = logging.getLogger(__name__)
+
+REDIS_BACKOFF_SEC = 5.0  # how long to use the in-process fallback after a Redis failure
+KEY_PREFIX = "rl:"
+
+# Sliding log per key in a sorted set (score = request time in ms). All rules are checked before
+# any is counted, so a request rejected by one rule does not use up the others.
+# KEYS: one per rule; ARGV: now_ms, member, then window_ms and limit for each rule.
+# Returns 0 if the request was counted, else milliseconds until it would be allowed.
+_SLIDING_WINDOW_LUA = """
+local now = tonumber(ARGV[1])
+local wait = 0
+for i, key in ipairs(KEYS) do
+    local window = tonumber(ARGV[1 + 2 * i])
+    local limit = tonumber(ARGV[2 + 2 * i])
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    if redis.call('ZCARD', key) >= limit then
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        wait = math.max(wait, tonumber(oldest[2]) + window - now)
+    end
+end
+if wait > 0 then
+    return wait
+end
+for i, key in ipairs(KEYS) do
+    redis.call('ZADD', key, now, ARGV[2])
+    redis.call('PEXPIRE', key, ARGV[1 + 2 * i])
+end
+return 0
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitRule:
+    """At most `limit` requests per `window_sec` for one key (e.g. "login:ip:10.0.0.1")."""
+
+    key: str
+    limit: int
+    window_sec: int
+
+
+@dataclass(slots=True)
+class RateLimiterStats:
+    """Counters of a SlidingWindowRateLimiter."""
+
+    allowed: int = 0
+    rejected: int = 0
+    redis_errors: int = 0
+
+
+class SlidingWindowRateLimiter:
+    """
+    Sliding-window rate limiter backed by a Redis Lua script.
+
+    One script call checks and counts a request against several rules atomically. While Redis is
+    unavailable the same algorithm runs on an in-process LRU, so limits keep working but apply per
+    worker instead of globally.
+    """
+
+    def __init__(self, redis: Redis, local_max_keys: int) -> None:
+        self._redis = redis
+        self._script = redis.register_script(_SLIDING_WINDOW_LUA)
+        self._local: TTLLRUCache[str, deque[float]] = TTLLRUCache(local_max_keys, ttl_sec=0)
+        self._redis_down_until = 0.0
+        self._stats = RateLimiterStats()
+
+    @classmethod
+    def from_settings(cls, settings: RateLimitSettings) -> "SlidingWindowRateLimiter":
+        return cls(get_redis(settings.REDIS_DB), settings.LOCAL_MAX_KEYS)
+
+    def stats(self) -> RateLimiterStats:
+        """Return allowed/rejected counters."""
+        return copy.copy(self._stats)
+
+    async def acquire(self, rules: Sequence[RateLimitRule]) -> int:
+        """
+        Count one request against every rule.
+
+        Returns 0 if it is allowed, otherwise the number of seconds to wait before retrying
+        (and the request is not counted).
+        """
+        if not rules:
+            return 0
+        wait_ms = await self._acquire_redis(rules)
+        if wait_ms is None:
+            wait_ms = self._acquire_local(rules)
+        if wait_ms > 0:
+            self._stats.rejected += 1
+            RATE_LIMIT_REQUESTS.labels("rejected").inc()
+            return max(1, math.ceil(wait_ms / 1000))
+        self._stats.allowed += 1
+        RATE_LIMIT_REQUESTS.labels("allowed").inc()
+        return 0
+
+    async def _acquire_redis(self, rules: Sequence[RateLimitRule]) -> float | None:
+        if time.monotonic() < self._redis_down_until:
+            return None
+        args: list[int | str] = [int(time.time() * 1000), secrets.token_hex(8)]
+        for rule in rules:
+            args += [rule.window_sec * 1000, rule.limit]
+        try:
+            return float(await self._script(keys=[KEY_PREFIX + rule.key for rule in rules], args=args))
+        except (RedisError, OSError) as err:
+            self._stats.redis_errors += 1
+            RATE_LIMIT_REDIS_ERRORS.inc()
+            self._redis_down_until = time.monotonic() + REDIS_BACKOFF_SEC
+            log.warning("rate limiter: redis unavailable, limiting per worker for %.0fs: %s", REDIS_BACKOFF_SEC, err)
+            return None
+
+    def _acquire_local(self, rules: Sequence[RateLimitRule]) -> float:
+        now_ms = time.monotonic() * 1000
+        logs: list[deque[float]] = []
+        wait_ms = 0.0
+        for rule in rules:
+            window_ms = rule.window_sec * 1000
+            hits = self._local.get(rule.key) or deque()
+            while hits and hits[0] <= now_ms - window_ms:
+                hits.popleft()
+            if len(hits) >= rule.limit:
+                wait_ms = max(wait_ms, hits[0] + window_ms - now_ms)
+            logs.append(hits)
+        if wait_ms > 0:
+            return wait_ms
+        for rule, hits in zip(rules, logs, strict=True):
+            hits.append(now_ms)
+            self._local.set(rule.key, hits, ttl_sec=rule.window_sec)
+        return 0.0
+
+
+rate_limiter = SlidingWindowRateLimiter.from_settings(rate_limit_settings)
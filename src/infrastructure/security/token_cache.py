@@ -0,0 +1,68 @@
+import copy
+import hashlib
+import time
+from dataclasses import dataclass
+
+from src.infrastructure.cache.lru import TTLLRUCache
+from src.infrastructure.monitoring.metrics import TOKEN_CACHE_EVICTIONS, TOKEN_CACHE_HITS, TOKEN_CACHE_MISSES
+
+
+@dataclass(slots=True)
+class TokenCacheStats:
+    """Counters of a VerifiedTokenCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of claims of tokens whose signature was already verified.
+
+    Keyed by a digest of the token (the raw token is never stored). Entries expire at the token's
+    `exp`, so an expired token always falls through to a full decode and fails there. Hits, misses
+    and evictions are exported as token_cache_* metrics.
+
+    Entries are not re-checked against the KeyRing. That is safe because the ring is loaded once per
+    process: a key is retired by deleting its file and restarting the workers (see jwt_keys), which
+    also empties this per-worker cache.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._lru: TTLLRUCache[bytes, dict] = TTLLRUCache(max_entries, ttl_sec=0, on_evict=TOKEN_CACHE_EVICTIONS.inc)
+        self._stats = TokenCacheStats()
+
+    def get(self, token: str) -> dict | None:
+        claims = self._lru.get(_digest(token))
+        if claims is None:
+            self._stats.misses += 1
+            TOKEN_CACHE_MISSES.inc()
+            return None
+        self._stats.hits += 1
+        TOKEN_CACHE_HITS.inc()
+        return claims
+
+    def put(self, token: str, claims: dict) -> None:
+        exp = claims.get("exp")
+        if not isinstance(exp, int | float):
+            return
+        ttl_sec = exp - time.time()
+        if ttl_sec > 0:
+            self._lru.set(_digest(token), claims, ttl_sec=ttl_sec)
+
+    def stats(self) -> TokenCacheStats:
+        """Return hit/miss/eviction counters."""
+        self._stats.evictions = self._lru.evictions
+        self._stats.size = len(self._lru)
+        return copy.copy(self._stats)
+
+
+def _digest(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
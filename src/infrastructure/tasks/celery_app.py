@@ -1,19 +1,33 @@
 from celery import Celery
 from celery.schedules import crontab
 
+from src.configs.celery_beat import celery_beat_settings
 from src.configs.redis import redis_settings
 
 celery = Celery(
     "coffee_users",
     broker=redis_settings.DSN(0),
     backend=redis_settings.DSN(1),
-    include=["src.infrastructure.tasks.cleanup"],
+    include=[
+        "src.infrastructure.tasks.cleanup",
+        "src.infrastructure.tasks.outbox",
+        "src.infrastructure.tasks.monitoring",  # signal handlers only
+    ],
 )
 celery.conf.update(
     beat_schedule={
         "cleanup-unverified-every-day": {
             "task": "src.infrastructure.tasks.cleanup.cleanup_unverified",
             "schedule": crontab(hour=0, minute=0),  # every day at midnight
-        }
+        },
+        "deliver-outbox": {
+            "task": "src.infrastructure.tasks.outbox.deliver_outbox",
+            "schedule": celery_beat_settings.OUTBOX_POLL_SEC,
+            "options": {"expires": celery_beat_settings.OUTBOX_POLL_SEC},  # skip runs that queued up
+        },
+        "purge-outbox-every-day": {
+            "task": "src.infrastructure.tasks.outbox.purge_outbox",
+            "schedule": crontab(hour=0, minute=30),
+        },
     },
 )
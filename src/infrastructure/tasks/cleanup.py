@@ -1,41 +1,115 @@
 import asyncio
 import datetime as dt
+import time
+from collections import deque
+from collections.abc import Sequence
 from typing import Final
 
 from celery.utils.log import get_task_logger
-from sqlalchemy import and_, delete
+from sqlalchemy import any_, delete, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.configs.cache import cache_settings
 from src.configs.celery_beat import celery_beat_settings
-from src.infrastructure.db.base import async_session_maker
+from src.infrastructure.cache.user_cache import user_cache
+from src.infrastructure.db.base import async_session_maker, db_settings, replica_router
 from src.infrastructure.db.models.user import UserORM
+from src.infrastructure.monitoring.metrics import CLEANUP_DELETED_USERS
 from src.infrastructure.tasks.celery_app import celery
+from src.infrastructure.tasks.runtime import run_async
 
 log = get_task_logger(__name__)
 UNVERIFIED_TTL_DAYS: Final[int] = celery_beat_settings.UNVERIFIED_TTL_DAYS
+BATCH_SIZE: Final[int] = celery_beat_settings.CLEANUP_BATCH_SIZE
+SLEEP_SEC: Final[float] = celery_beat_settings.CLEANUP_SLEEP_SEC
+
+
+async def _delete_batch(
+    session: AsyncSession, cutoff: dt.datetime, after: tuple[dt.datetime, int] | None
+) -> tuple[list[int], tuple[dt.datetime, int] | None]:
+    """
+    Delete the next BATCH_SIZE stale unverified users after the (created_at, id) cursor.
+
+    Return the deleted ids and the new cursor. Rows locked by someone else are skipped, not
+    waited for; they are picked up by the next run.
+    """
+    batch = (
+        select(UserORM.id)
+        .where(~UserORM.is_verified, UserORM.created_at < cutoff)  # must match the partial index predicate
+        .order_by(UserORM.created_at, UserORM.id)
+        .limit(BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )
+    if after is not None:
+        batch = batch.where(tuple_(UserORM.created_at, UserORM.id) > tuple_(*after))
+    # = ANY(ARRAY(...)) makes the outer delete a primary key lookup rather than a join.
+    stmt = (
+        delete(UserORM)
+        .where(UserORM.id == any_(func.array(batch.scalar_subquery())))
+        .returning(UserORM.created_at, UserORM.id)
+    )
+    rows = (await session.execute(stmt)).all()
+    return [r.id for r in rows], max(((r.created_at, r.id) for r in rows), default=None)
+
+
+async def _forget_cached(user_ids: Sequence[int], lagging: deque[tuple[float, Sequence[int]]]) -> None:
+    """
+    Drop deleted users from the user cache, which this raw DELETE bypasses.
+
+    With replicas, each batch is dropped once more READ_YOUR_WRITES_SEC later, since a lagging
+    replica may re-cache it meanwhile (as SqlAlchemyUnitOfWork.commit does); `lagging` holds
+    the batches still due.
+    """
+    await user_cache.invalidate(user_ids)
+    if replica_router.has_replicas:
+        lagging.append((time.monotonic() + db_settings.READ_YOUR_WRITES_SEC, user_ids))
+    while lagging and lagging[0][0] <= time.monotonic():
+        await user_cache.invalidate(lagging.popleft()[1])
+
+
+async def _forget_lagging(lagging: deque[tuple[float, Sequence[int]]]) -> None:
+    """Wait for and run the remaining delayed invalidations."""
+    while lagging:
+        due, user_ids = lagging.popleft()
+        await asyncio.sleep(max(0.0, due - time.monotonic()))
+        await user_cache.invalidate(user_ids)
 
 
 @celery.task(name="src.infrastructure.tasks.cleanup.cleanup_unverified")
 def cleanup_unverified() -> int:
     """
     Delete users who are not verified within UNVERIFIED_TTL_DAYS.
-    Synchronous Celery task that runs async DB code via asyncio.run.
+
+    Works in batches of CLEANUP_BATCH_SIZE, each in its own transaction, walking the
+    ix_users_unverified_created index with a keyset cursor and pausing CLEANUP_SLEEP_SEC between
+    batches. Committed batches stay deleted, so a run that dies halfway is simply resumed by the next one.
+    Each committed batch is invalidated in the user cache, so deleted users stop being served from it.
+    Synchronous Celery task that runs async DB code on the worker's event loop (see runtime).
     Returns the number of deleted users.
     """
 
     async def _run() -> int:
         cutoff = dt.datetime.now() - dt.timedelta(days=UNVERIFIED_TTL_DAYS)
-        async with async_session_maker() as s:
-            result = await s.execute(
-                delete(UserORM)
-                .where(and_(UserORM.is_verified.is_(False), UserORM.created_at < cutoff))
-                .returning(UserORM.id)
-            )
-            ids = result.scalars().all()
-            if ids:
+        total = batches = 0
+        cursor: tuple[dt.datetime, int] | None = None
+        lagging: deque[tuple[float, Sequence[int]]] = deque()
+        while True:
+            async with async_session_maker() as s:
+                deleted, last = await _delete_batch(s, cutoff, cursor)
                 await s.commit()
-                log.info("cleanup_unverified: deleted %d users (ids=%s)", len(ids), ids)
-            else:
-                log.info("cleanup_unverified: nothing to delete")
-            return len(ids)
+            if not deleted:
+                break
+            if cache_settings.ENABLED:
+                await _forget_cached(deleted, lagging)
+            total += len(deleted)
+            batches += 1
+            CLEANUP_DELETED_USERS.inc(len(deleted))
+            cursor = last
+            if len(deleted) < BATCH_SIZE:
+                break
+            await asyncio.sleep(SLEEP_SEC)
+        await _forget_lagging(lagging)
+        log.info("cleanup_unverified: deleted %d users in %d batches", total, batches)
+        return total
 
-    return asyncio.run(_run())
+    return run_async(_run())
@@ -0,0 +1,46 @@
+"""
+Prometheus metrics of the Celery worker.
+
+Every task's final state and run time are recorded from Celery signals. The worker's main process
+serves /metrics on METRICS_CELERY_PORT; with the prefork pool, set PROMETHEUS_MULTIPROC_DIR so it
+can see what the child processes recorded (start_celery.sh does).
+"""
+
+import time
+
+from celery import Task
+from celery.signals import task_postrun, task_prerun, worker_init, worker_process_shutdown
+from celery.utils.log import get_task_logger
+from prometheus_client import start_http_server
+
+from src.configs.metrics import metrics_settings
+from src.infrastructure.monitoring.metrics import CELERY_TASK_DURATION, CELERY_TASKS, mark_process_dead, registry
+
+log = get_task_logger(__name__)
+_started: dict[str, float] = {}  # task id -> perf_counter at prerun
+
+
+@task_prerun.connect
+def _task_started(task_id: str, **_kwargs: object) -> None:
+    _started[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def _task_finished(task_id: str, task: Task, state: str | None = None, **_kwargs: object) -> None:
+    start = _started.pop(task_id, None)
+    if start is not None:
+        CELERY_TASK_DURATION.labels(task.name).observe(time.perf_counter() - start)
+    CELERY_TASKS.labels(task.name, state or "UNKNOWN").inc()
+
+
+@worker_init.connect
+def _serve_metrics(**_kwargs: object) -> None:
+    if metrics_settings.ENABLED and metrics_settings.CELERY_PORT:
+        start_http_server(metrics_settings.CELERY_PORT, registry=registry())
+        log.info("metrics: serving /metrics on port %d", metrics_settings.CELERY_PORT)
+
+
+@worker_process_shutdown.connect
+def _forget_process(pid: int | None = None, **_kwargs: object) -> None:
+    if pid is not None:
+        mark_process_dead(pid)
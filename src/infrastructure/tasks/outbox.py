@@ -0,0 +1,133 @@
+import datetime as dt
+import random
+from collections.abc import Callable
+from typing import Final
+
+from celery.utils.log import get_task_logger
+
+from src.configs.celery_beat import celery_beat_settings
+from src.domain.entities.outbox import OutboxMessageEntity
+from src.domain.value_objects.outbox_kind import OutboxKind
+from src.infrastructure.db.uow import SqlAlchemyUnitOfWork
+from src.infrastructure.monitoring.metrics import OUTBOX_MESSAGES
+from src.infrastructure.notifications.mailer import OutgoingEmail, mailer, verification_code_email
+from src.infrastructure.tasks.celery_app import celery
+from src.infrastructure.tasks.runtime import run_async
+
+log = get_task_logger(__name__)
+
+
+def _verification_email(payload: dict) -> OutgoingEmail:
+    return verification_code_email(payload["to"], payload["code"])
+
+
+# Outbox kind -> email built from the message payload
+RENDERERS: Final[dict[str, Callable[[dict], OutgoingEmail]]] = {
+    OutboxKind.VERIFICATION_EMAIL: _verification_email,
+}
+
+
+def _backoff(attempts: int) -> dt.timedelta:
+    """Exponential backoff with full jitter."""
+    delay = min(
+        celery_beat_settings.OUTBOX_BACKOFF_BASE_SEC * 2 ** (attempts - 1), celery_beat_settings.OUTBOX_BACKOFF_MAX_SEC
+    )
+    return dt.timedelta(seconds=random.uniform(delay / 2, delay))
+
+
+async def _deliver(messages: list[OutboxMessageEntity]) -> tuple[list[int], list[tuple[OutboxMessageEntity, str]]]:
+    failed: list[tuple[OutboxMessageEntity, str]] = []
+    renderable: list[OutboxMessageEntity] = []
+    emails: list[OutgoingEmail] = []
+    for msg in messages:
+        render = RENDERERS.get(msg.kind)
+        try:
+            if render is None:
+                raise LookupError(f"no renderer for outbox kind {msg.kind!r}")
+            emails.append(render(msg.payload))
+        except Exception as err:  # a bad payload is retried like any other failure, then given up on
+            failed.append((msg, f"{type(err).__name__}: {err}"))
+        else:
+            renderable.append(msg)
+
+    sent: list[int] = []
+    for msg, error in zip(renderable, await mailer.send_many(emails), strict=True):
+        if error is None:
+            sent.append(msg.id)
+        else:
+            failed.append((msg, f"{type(error).__name__}: {error}"))
+    return sent, failed
+
+
+@celery.task(name="src.infrastructure.tasks.outbox.deliver_outbox")
+def deliver_outbox() -> int:
+    """
+    Deliver due outbox messages in batches of OUTBOX_BATCH_SIZE.
+
+    Each batch is leased in one short transaction, delivered outside of it, and its results are
+    written back in another, so no row lock is held during SMTP calls. Failed messages are retried
+    with exponential backoff up to OUTBOX_MAX_ATTEMPTS. Delivery is at-least-once.
+    Returns the number of delivered messages.
+    """
+
+    async def _run() -> int:
+        total_sent = total_failed = 0
+        deadline = dt.datetime.now() + dt.timedelta(seconds=celery_beat_settings.OUTBOX_LEASE_SEC / 2)
+        while dt.datetime.now() < deadline:
+            now = dt.datetime.now()
+            async with SqlAlchemyUnitOfWork() as uow:
+                messages = list(
+                    await uow.outbox.claim(
+                        celery_beat_settings.OUTBOX_BATCH_SIZE,
+                        now,
+                        now + dt.timedelta(seconds=celery_beat_settings.OUTBOX_LEASE_SEC),
+                        celery_beat_settings.OUTBOX_MAX_ATTEMPTS,
+                    )
+                )
+            if not messages:
+                break
+
+            sent, failed = await _deliver(messages)
+            now = dt.datetime.now()
+            async with SqlAlchemyUnitOfWork() as uow:
+                await uow.outbox.mark_sent(sent, now)
+                for msg, error in failed:
+                    await uow.outbox.reschedule(msg.id, now + _backoff(msg.attempts), error)
+
+            total_sent += len(sent)
+            total_failed += len(failed)
+            sent_ids = set(sent)
+            for msg in messages:
+                if msg.id in sent_ids:
+                    OUTBOX_MESSAGES.labels(msg.kind, "sent").inc()
+            for msg, error in failed:
+                gave_up = msg.attempts >= celery_beat_settings.OUTBOX_MAX_ATTEMPTS
+                OUTBOX_MESSAGES.labels(msg.kind, "gave_up" if gave_up else "failed").inc()
+                level = log.error if gave_up else log.warning
+                level("deliver_outbox: message %d (%s) attempt %d failed: %s", msg.id, msg.kind, msg.attempts, error)
+            if len(messages) < celery_beat_settings.OUTBOX_BATCH_SIZE:
+                break
+        if total_sent or total_failed:
+            log.info("deliver_outbox: sent %d, failed %d", total_sent, total_failed)
+        return total_sent
+
+    return run_async(_run())
+
+
+@celery.task(name="src.infrastructure.tasks.outbox.purge_outbox")
+def purge_outbox() -> int:
+    """Delete delivered messages older than OUTBOX_RETENTION_DAYS in batches. Returns the number deleted."""
+
+    async def _run() -> int:
+        before = dt.datetime.now() - dt.timedelta(days=celery_beat_settings.OUTBOX_RETENTION_DAYS)
+        total = 0
+        while True:
+            async with SqlAlchemyUnitOfWork() as uow:
+                deleted = await uow.outbox.purge_sent(before, celery_beat_settings.CLEANUP_BATCH_SIZE)
+            total += deleted
+            if deleted < celery_beat_settings.CLEANUP_BATCH_SIZE:
+                break
+        log.info("purge_outbox: deleted %d messages", total)
+        return total
+
+    return run_async(_run())
@@ -0,0 +1,64 @@
+"""
+One asyncio event loop per Celery worker process.
+
+Async engines, Redis clients and the SMTP mailer keep connections bound to the loop that opened
+them, so tasks must not create a fresh loop per call (asyncio.run). Instead, each worker process
+starts one loop on worker_process_init and tasks run coroutines on it with `run_async`. The pools
+survive between tasks and are disposed on shutdown. Meant for the prefork and solo pools (one task
+at a time per process), not the threads pool.
+"""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+from celery.utils.log import get_task_logger
+
+from src.infrastructure.db.base import engine, replica_engines
+from src.infrastructure.notifications.mailer import mailer
+from src.infrastructure.redis_client import close_redis
+
+log = get_task_logger(__name__)
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on this process's event loop (started on first use)."""
+    return _get_loop().run_until_complete(coro)
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+@worker_process_init.connect
+def _init_process(**_kwargs: object) -> None:
+    # The forked child inherits the parent's pooled connections: forget them without closing
+    # (they still belong to the parent) so this process opens its own on its own loop.
+    for eng in (engine, *replica_engines):
+        eng.sync_engine.dispose(close=False)
+    _get_loop()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect  # solo pool: tasks run in the main process
+def _shutdown_process(**_kwargs: object) -> None:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        return
+    try:
+        for eng in (engine, *replica_engines):
+            _loop.run_until_complete(eng.dispose())
+        _loop.run_until_complete(close_redis())
+        _loop.run_until_complete(mailer.close())
+        _loop.run_until_complete(_loop.shutdown_asyncgens())
+    except Exception:  # best effort on the way out
+        log.exception("task runtime: failed to release connections")
+    finally:
+        _loop.close()
+        _loop = None
@@ -0,0 +1,61 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from src.configs.admission import AdmissionSettings, admission_settings
+from src.domain.exceptions import ServiceBusyError
+from src.infrastructure.monitoring.metrics import ADMISSION_REJECTED, ADMISSION_WAITING
+
+
+class AdmissionLimiter:
+    """
+    Per-worker concurrency limiter used as a FastAPI dependency.
+
+    Up to `max_concurrency` requests run the guarded endpoint at once and up to `max_queue`
+    wait for a slot for at most `max_wait_sec`. Everything else fails fast with 503 + Retry-After.
+    The queue length and the rejections are exported as admission_* metrics.
+    """
+
+    def __init__(self, max_concurrency: int, max_queue: int, max_wait_sec: float, retry_after_sec: int) -> None:
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._max_concurrency = max_concurrency
+        self._max_queue = max_queue
+        self._max_wait_sec = max_wait_sec
+        self._retry_after_sec = retry_after_sec
+
+        self._in_flight = 0
+        self._queued = 0
+
+    @classmethod
+    def from_settings(cls, settings: AdmissionSettings) -> "AdmissionLimiter":
+        return cls(settings.MAX_CONCURRENCY, settings.MAX_QUEUE, settings.MAX_WAIT_SEC, settings.RETRY_AFTER_SEC)
+
+    async def __call__(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the request."""
+        if self._in_flight + self._queued >= self._max_concurrency + self._max_queue:
+            ADMISSION_REJECTED.labels("queue_full").inc()
+            raise self._overloaded()
+
+        self._queued += 1
+        ADMISSION_WAITING.inc()
+        try:
+            await asyncio.wait_for(self._sem.acquire(), timeout=self._max_wait_sec)
+        except TimeoutError:
+            ADMISSION_REJECTED.labels("timeout").inc()
+            raise self._overloaded() from None
+        finally:
+            self._queued -= 1
+            ADMISSION_WAITING.dec()
+
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._sem.release()
+
+    def _overloaded(self) -> ServiceBusyError:
+        return ServiceBusyError("Server is busy, please retry later", retry_after_sec=self._retry_after_sec)
+
+
+# Login and signup share one limiter: both compete for the same Argon2 CPU and memory.
+argon2_admission = AdmissionLimiter.from_settings(admission_settings)
@@ -1,3 +1,4 @@
+from collections.abc import Awaitable, Callable
 from typing import Annotated
 
 from fastapi import Depends, HTTPException
@@ -6,27 +7,32 @@ from jwt import ExpiredSignatureError, InvalidTokenError, PyJWTError
 from starlette import status
 
 from src.domain.value_objects.user_role import UserRole
+from src.infrastructure.db.instrumentation import current_stats
+from src.infrastructure.db.routing import bind_route_key
 from src.infrastructure.security.jwt_token_provider import token_provider
 
 bearer = HTTPBearer(auto_error=True)
 
 
-def get_claims(creds: Annotated[HTTPAuthorizationCredentials, Depends(bearer)]) -> dict:
+async def get_claims(creds: Annotated[HTTPAuthorizationCredentials, Depends(bearer)]) -> dict:
     """
     Decode token from Authorization header.
     Returns decoded claims; raises HTTP 401 on failure.
+    Async on purpose: decoding is a cache lookup for repeat tokens, not worth a threadpool hop.
     """
     try:
-        return token_provider.decode(creds.credentials)
+        claims = token_provider.decode(creds.credentials)
     except ExpiredSignatureError as err:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired") from err
     except InvalidTokenError as err:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token") from err
     except PyJWTError as err:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token") from err
+    bind_route_key(claims.get("sub"))  # read-your-writes routing is per subject
+    return claims
 
 
-def get_subject_id(claims: Annotated[dict, Depends(get_claims)]) -> int:
+async def get_subject_id(claims: Annotated[dict, Depends(get_claims)]) -> int:
     """Extract subject id from claims."""
     return int(claims.get("sub"))
 
@@ -36,3 +42,18 @@ def require_role(claims: dict, *roles: UserRole) -> None:
     role = claims.get("role")
     if roles and role not in {r.value for r in roles}:
         raise HTTPException(status_code=403, detail="Forbidden")
+
+
+def query_budget(max_queries: int) -> Callable[[], Awaitable[None]]:
+    """
+    Dependency declaring how many SQL statements a route may issue.
+
+    Going over it is logged, or fails the request when DB_QUERY_BUDGET_STRICT is on (tests/CI).
+    """
+
+    async def _declare_budget() -> None:
+        stats = current_stats()
+        if stats is not None:
+            stats.budget = max_queries
+
+    return _declare_budget
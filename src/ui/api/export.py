@@ -0,0 +1,56 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from enum import StrEnum
+
+from src.domain.entities.user import UserEntity
+
+EXPORT_FIELDS = ("id", "email", "first_name", "last_name", "is_verified", "role", "created_at")
+CHUNK_SIZE = 64 * 1024  # bytes buffered before a chunk is sent to the client
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def _export_row(user: UserEntity) -> tuple:
+    return (
+        user.id,
+        user.email.as_str(),
+        user.first_name,
+        user.last_name,
+        user.is_verified,
+        user.role.value,
+        user.created_at.isoformat(),
+    )
+
+
+async def encode_users(users: AsyncIterable[UserEntity], fmt: ExportFormat) -> AsyncIterator[bytes]:
+    """Encode users as NDJSON or CSV, yielding ~CHUNK_SIZE byte chunks as rows arrive."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    if fmt is ExportFormat.CSV:
+        writer.writerow(EXPORT_FIELDS)
+
+    async for user in users:
+        row = _export_row(user)
+        if fmt is ExportFormat.CSV:
+            writer.writerow(row)
+        else:
+            buf.write(json.dumps(dict(zip(EXPORT_FIELDS, row, strict=True)), ensure_ascii=False))
+            buf.write("\n")
+        if buf.tell() >= CHUNK_SIZE:
+            yield buf.getvalue().encode()
+            buf.seek(0)
+            buf.truncate()
+
+    if buf.tell():
+        yield buf.getvalue().encode()
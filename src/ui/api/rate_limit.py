@@ -0,0 +1,68 @@
+import hashlib
+
+from fastapi import Request
+
+from src.configs.rate_limit import rate_limit_settings
+from src.domain.exceptions import RateLimitedError
+from src.infrastructure.security.rate_limiter import RateLimitRule, SlidingWindowRateLimiter, rate_limiter
+
+
+class AuthRateLimit:
+    """
+    Per-IP (and optionally per-email) rate limit used as a FastAPI dependency.
+
+    The email is read from the JSON body, which FastAPI has already parsed and cached by the time
+    dependencies run. List this dependency before `argon2_admission`, so that rejected requests get
+    429 + Retry-After without taking an admission slot, touching the DB or hashing a password.
+    Client IPs come from `request.client`; behind a proxy run uvicorn/gunicorn with
+    FORWARDED_ALLOW_IPS set so it is taken from X-Forwarded-For.
+    """
+
+    def __init__(
+        self,
+        scope: str,
+        per_ip: int,
+        per_email: int | None = None,
+        window_sec: int = rate_limit_settings.WINDOW_SEC,
+        limiter: SlidingWindowRateLimiter = rate_limiter,
+        enabled: bool = rate_limit_settings.ENABLED,
+    ) -> None:
+        self._scope = scope
+        self._per_ip = per_ip
+        self._per_email = per_email
+        self._window_sec = window_sec
+        self._limiter = limiter
+        self._enabled = enabled
+
+    async def __call__(self, request: Request) -> None:
+        if not self._enabled:
+            return
+        ip = request.client.host if request.client else "unknown"
+        rules = [RateLimitRule(f"{self._scope}:ip:{ip}", self._per_ip, self._window_sec)]
+        if self._per_email:
+            email = await _body_email(request)
+            if email:
+                rules.append(RateLimitRule(f"{self._scope}:email:{_digest(email)}", self._per_email, self._window_sec))
+
+        retry_after = await self._limiter.acquire(rules)
+        if retry_after:
+            raise RateLimitedError(retry_after_sec=retry_after)
+
+
+async def _body_email(request: Request) -> str | None:
+    try:
+        data = await request.json()
+    except ValueError:  # malformed bodies are rejected by validation; limit them per IP only
+        return None
+    email = data.get("email") if isinstance(data, dict) else None
+    return email.strip().lower() if isinstance(email, str) else None
+
+
+def _digest(email: str) -> str:
+    # Bounded key length whatever clients send, and no raw emails in Redis.
+    return hashlib.blake2b(email.encode(), digest_size=16).hexdigest()
+
+
+login_rate_limit = AuthRateLimit("login", rate_limit_settings.LOGIN_PER_IP, rate_limit_settings.LOGIN_PER_EMAIL)
+signup_rate_limit = AuthRateLimit("signup", rate_limit_settings.SIGNUP_PER_IP)
+verify_rate_limit = AuthRateLimit("verify", rate_limit_settings.VERIFY_PER_IP, rate_limit_settings.VERIFY_PER_EMAIL)
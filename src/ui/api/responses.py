@@ -1,7 +1,23 @@
+from pydantic import BaseModel
 from starlette import status
+from starlette.responses import JSONResponse
 
 from src.ui.schemas.error import ErrorResponse
 
+
+class DTOResponse(JSONResponse):
+    """
+    JSON response for a DTO that is valid by construction.
+
+    FastAPI passes returned Response objects through as is, so the DTO is not dumped, re-validated
+    against the response model and encoded again; pydantic-core writes the JSON in one step. Declare
+    the DTO with `response_model=` on the route to keep it in the OpenAPI schema.
+    """
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content)
+
+
 # Generic error responses you can reuse per router/endpoint
 GENERIC_ERROR_RESPONSES = {
     status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Bad Request"},
@@ -11,17 +27,30 @@ GENERIC_ERROR_RESPONSES = {
     status.HTTP_409_CONFLICT: {"model": ErrorResponse, "description": "Conflict"},
 }
 
+OVERLOAD_RESPONSES = {
+    status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ErrorResponse, "description": "Overloaded, retry after Retry-After"},
+}
+
+RATE_LIMIT_RESPONSES = {
+    status.HTTP_429_TOO_MANY_REQUESTS: {"model": ErrorResponse, "description": "Rate limited, retry after Retry-After"},
+}
+
 # Focused sets for specific endpoints (can be extended)
 AUTH_SIGNUP_RESPONSES = {
     **{status.HTTP_409_CONFLICT: {"model": ErrorResponse, "description": "Email already taken"}},
     **{status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Validation/Business error"}},
+    **OVERLOAD_RESPONSES,
+    **RATE_LIMIT_RESPONSES,
 }
 
 AUTH_LOGIN_RESPONSES = {
     **{status.HTTP_401_UNAUTHORIZED: {"model": ErrorResponse, "description": "Invalid credentials or unverified"}},
+    **OVERLOAD_RESPONSES,
+    **RATE_LIMIT_RESPONSES,
 }
 
 AUTH_VERIFY_RESPONSES = {
     **{status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse, "description": "Invalid/expired code"}},
     **{status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "User not found"}},
+    **RATE_LIMIT_RESPONSES,
 }
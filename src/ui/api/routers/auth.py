@@ -1,16 +1,17 @@
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from starlette.responses import JSONResponse
 
 from src.application.dto.auth import AccessTokenOUTDTO, LoginDTO, SignUpDTO, SignUpResponseDTO, TokenPairDTO, VerifyDTO
 from src.application.services.auth_service import AuthService
 from src.configs.jwt import jwt_settings
 from src.infrastructure.db.uow import SqlAlchemyUnitOfWork
-from src.infrastructure.notifications.mailer import send_verification_code_email
 from src.infrastructure.security.argon2_password_hasher import hasher
 from src.infrastructure.security.jwt_token_provider import token_provider
-from src.ui.api.deps import get_claims
+from src.ui.api.admission import argon2_admission
+from src.ui.api.deps import get_claims, query_budget
+from src.ui.api.rate_limit import login_rate_limit, signup_rate_limit, verify_rate_limit
 from src.ui.api.responses import AUTH_LOGIN_RESPONSES, AUTH_SIGNUP_RESPONSES, AUTH_VERIFY_RESPONSES, GENERIC_ERROR_RESPONSES
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
@@ -20,11 +21,12 @@ router = APIRouter(prefix="/auth", tags=["Auth"])
     "/signup",
     status_code=201,
     responses=AUTH_SIGNUP_RESPONSES,
+    dependencies=[Depends(signup_rate_limit), Depends(argon2_admission), Depends(query_budget(1))],
     summary="Register a new user",
-    description="Creates an unverified user and sends a verification code (printed to logs).",
+    description="Creates an unverified user; the verification code is emailed shortly after by a background worker.",
 )
-async def signup(payload: SignUpDTO, bg: Annotated[BackgroundTasks, BackgroundTasks]) -> SignUpResponseDTO:
-    """Create user and emit verification code (email channel)."""
+async def signup(payload: SignUpDTO) -> SignUpResponseDTO:
+    """Create user and queue the verification code (email channel)."""
     svc = AuthService(
         uow=SqlAlchemyUnitOfWork(),
         hasher=hasher,
@@ -32,17 +34,13 @@ async def signup(payload: SignUpDTO, bg: Annotated[BackgroundTasks, BackgroundTa
         verif_ttl_min=jwt_settings.access_ttl_min,
     )
     user = await svc.signup(payload.email, payload.password, payload.first_name, payload.last_name)
-
-    async with SqlAlchemyUnitOfWork() as uow:
-        ver = await uow.verifications.get_latest_for_user(user.id)
-        if ver:
-            bg.add_task(send_verification_code_email, user.email.as_str(), ver.code)
     return SignUpResponseDTO(id=user.id, email=user.email.as_str(), is_verified=user.is_verified)
 
 
 @router.post(
     "/login",
     responses=AUTH_LOGIN_RESPONSES,
+    dependencies=[Depends(login_rate_limit), Depends(argon2_admission), Depends(query_budget(2))],  # + rehash
     summary="Login with email/password",
     description="Issues access and refresh tokens for a verified user.",
 )
@@ -56,6 +54,7 @@ async def login(payload: LoginDTO) -> TokenPairDTO:
 @router.post(
     "/refresh",
     responses=GENERIC_ERROR_RESPONSES,
+    dependencies=[Depends(query_budget(1))],
     summary="Refresh access token",
     description="Exchanges a refresh token for a new access token. Send refresh token in Authorization header.",
 )
@@ -73,6 +72,7 @@ async def refresh(claims: Annotated[dict, Depends(get_claims)]) -> AccessTokenOU
     "/verify",
     summary="Verify user",
     responses=AUTH_VERIFY_RESPONSES,
+    dependencies=[Depends(verify_rate_limit), Depends(query_budget(1))],
     description="Confirms user verification by code.",
 )
 async def verify(payload: VerifyDTO) -> JSONResponse:
@@ -0,0 +1,20 @@
+from fastapi import APIRouter
+from starlette.responses import JSONResponse
+
+from src.configs.jwt import jwt_settings
+from src.infrastructure.security.jwt_token_provider import token_provider
+
+router = APIRouter(tags=["Auth"])
+
+
+@router.get(
+    "/.well-known/jwks.json",
+    summary="JSON Web Key Set",
+    description="Public keys for verifying access/refresh tokens locally (empty when tokens use a shared secret).",
+)
+async def jwks() -> JSONResponse:
+    """Return the public signing keys."""
+    return JSONResponse(
+        content=token_provider.jwks(),
+        headers={"Cache-Control": f"public, max-age={jwt_settings.jwks_max_age_sec}"},
+    )
@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+from starlette.responses import Response
+
+from src.infrastructure.monitoring.metrics import render
+
+router = APIRouter(tags=["Monitoring"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus scrape endpoint (aggregated over all workers of this host)."""
+    body, content_type = render()
+    return Response(content=body, media_type=content_type)
@@ -1,111 +1,221 @@
+import asyncio
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from starlette.responses import StreamingResponse
 
-from src.application.dto.user import UserOutDTO, UserUpdateDTO
+from src.application.dto.user import (
+    MAX_BATCH_IDS,
+    UserBatchItemDTO,
+    UserBatchResultDTO,
+    UserBatchSelectionDTO,
+    UserBatchUpdateDTO,
+    UserOutDTO,
+    UserPageDTO,
+    UserUpdateDTO,
+)
+from src.application.dto.user_import import UserImportReportDTO
+from src.application.services.user_import_service import UserImportService
 from src.application.services.user_service import UserService
+from src.domain.exceptions import ServiceBusyError
+from src.domain.value_objects.user_filter import UserFilter
 from src.domain.value_objects.user_role import UserRole
 from src.infrastructure.db.uow import SqlAlchemyUnitOfWork
-from src.ui.api.deps import get_claims, get_subject_id, require_role
-from src.ui.api.responses import GENERIC_ERROR_RESPONSES
+from src.infrastructure.security.argon2_password_hasher import hasher
+from src.ui.api.deps import get_claims, get_subject_id, query_budget, require_role
+from src.ui.api.export import EXPORT_MEDIA_TYPES, ExportFormat, encode_users
+from src.ui.api.responses import GENERIC_ERROR_RESPONSES, DTOResponse
+from src.ui.api.user_import import decode_rows
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
+# Imports hash on the bulk process pool; one at a time per worker keeps it from oversubscribing the CPUs.
+_import_lock = asyncio.Lock()
+
 
 @router.get(
     "/me",
+    response_model=UserOutDTO,
     responses=GENERIC_ERROR_RESPONSES,
+    dependencies=[Depends(query_budget(1))],
     summary="Get current user",
     description="Returns profile of the caller.",
 )
-async def me(subject_id: Annotated[int, Depends(get_subject_id)]) -> UserOutDTO:
+async def me(subject_id: Annotated[int, Depends(get_subject_id)]) -> DTOResponse:
     """Return current user profile."""
     svc = UserService(SqlAlchemyUnitOfWork())
     user = await svc.me(subject_id)
-    return UserOutDTO(
-        id=user.id,
-        email=user.email.as_str(),
-        first_name=user.first_name,
-        last_name=user.last_name,
-        is_verified=user.is_verified,
-        role=user.role,
-    )
+    return DTOResponse(UserOutDTO.from_entity(user))
 
 
 @router.get(
     "",
+    response_model=UserPageDTO,
     responses=GENERIC_ERROR_RESPONSES,
+    dependencies=[Depends(query_budget(1))],
     summary="List users (admin)",
-    description="Returns a paginated list of users. Admin only.",
+    description=(
+        "Returns a page of users ordered by id. Admin only. "
+        "Pass `next_cursor` from the previous page as `cursor` to get the next one. "
+        "The deprecated `offset` returns the same `{items, next_cursor}` page; it cannot be combined with `cursor` (422)."
+    ),
 )
 async def list_users(
     claims: Annotated[dict, Depends(get_claims)],
-    offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="Opaque cursor returned as `next_cursor`"),
+    offset: int | None = Query(None, ge=0, deprecated=True, description="Legacy offset pagination"),
     limit: int = Query(50, gt=0, le=200),
-) -> list[UserOutDTO]:
+) -> DTOResponse:
     """Return users page (admin only)."""
     require_role(claims, UserRole.ADMIN)
     svc = UserService(SqlAlchemyUnitOfWork())
-    users = await svc.list_users(offset, limit)
-    return [
-        UserOutDTO(
-            id=u.id,
-            email=u.email.as_str(),
-            first_name=u.first_name,
-            last_name=u.last_name,
-            is_verified=u.is_verified,
-            role=u.role,
-        )
-        for u in users
+    users, next_cursor = await svc.list_users(limit, cursor=cursor, offset=offset)
+    return DTOResponse(UserPageDTO(items=[UserOutDTO.from_entity(u) for u in users], next_cursor=next_cursor))
+
+
+@router.get(
+    "/export",
+    responses=GENERIC_ERROR_RESPONSES,
+    response_class=StreamingResponse,
+    summary="Export all users (admin)",
+    description="Streams every user as NDJSON or CSV straight from a server-side cursor. Admin only.",
+)
+async def export_users(
+    claims: Annotated[dict, Depends(get_claims)],
+    fmt: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+) -> StreamingResponse:
+    """Stream users export (admin only)."""
+    require_role(claims, UserRole.ADMIN)
+    svc = UserService(SqlAlchemyUnitOfWork())
+    return StreamingResponse(
+        encode_users(svc.export_users(), fmt),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="users.{fmt.value}"'},
+    )
+
+
+@router.post(
+    "/import",
+    responses=GENERIC_ERROR_RESPONSES,
+    summary="Bulk import users (admin)",
+    description=(
+        "Loads users from a CSV (with header) or NDJSON request body: `email`, `password` or an Argon2 "
+        "`password_hash`, optional `first_name`, `last_name`, `role`, `is_verified` (default true). "
+        "Existing emails are skipped and reported; no verification emails are sent. "
+        "One import runs at a time per worker; another one gets 503. Admin only."
+    ),
+)
+async def import_users(
+    request: Request,
+    claims: Annotated[dict, Depends(get_claims)],
+    fmt: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+) -> UserImportReportDTO:
+    """Bulk import (admin only)."""
+    require_role(claims, UserRole.ADMIN)
+    if _import_lock.locked():
+        raise ServiceBusyError("Another user import is already running")
+    async with _import_lock:
+        svc = UserImportService(SqlAlchemyUnitOfWork(), hasher)
+        return await svc.import_users(decode_rows(request.stream(), fmt))
+
+
+@router.patch(
+    "/batch",
+    response_model=UserBatchResultDTO,
+    responses=GENERIC_ERROR_RESPONSES,
+    dependencies=[Depends(query_budget(1))],
+    summary="Patch many users (admin)",
+    description=(
+        "Applies the same partial update to users selected by `ids` or `filter` in one statement. "
+        f"A filter may select at most {MAX_BATCH_IDS} users (422 otherwise). Role changes skip the caller. Admin only."
+    ),
+)
+async def patch_users(
+    dto: UserBatchUpdateDTO,
+    claims: Annotated[dict, Depends(get_claims)],
+    subject_id: Annotated[int, Depends(get_subject_id)],
+) -> DTOResponse:
+    """Batch partial update."""
+    require_role(claims, UserRole.ADMIN)
+    svc = UserService(SqlAlchemyUnitOfWork())
+    updated = await svc.update_users(dto.changes, subject_id, ids=dto.ids, where=_to_filter(dto))
+    return DTOResponse(_batch_result(dto, updated, "updated", subject_id))
+
+
+@router.post(
+    "/batch/delete",
+    response_model=UserBatchResultDTO,
+    responses=GENERIC_ERROR_RESPONSES,
+    dependencies=[Depends(query_budget(1))],
+    summary="Delete many users (admin)",
+    description=(
+        "Deletes users selected by `ids` or `filter` in one statement, never the caller. "
+        f"A filter may select at most {MAX_BATCH_IDS} users (422 otherwise). Admin only."
+    ),
+)
+async def delete_users(
+    dto: UserBatchSelectionDTO,
+    claims: Annotated[dict, Depends(get_claims)],
+    subject_id: Annotated[int, Depends(get_subject_id)],
+) -> DTOResponse:
+    """Batch delete."""
+    require_role(claims, UserRole.ADMIN)
+    svc = UserService(SqlAlchemyUnitOfWork())
+    deleted = await svc.delete_users(subject_id, ids=dto.ids, where=_to_filter(dto))
+    return DTOResponse(_batch_result(dto, deleted, "deleted", subject_id))
+
+
+def _to_filter(dto: UserBatchSelectionDTO) -> UserFilter | None:
+    return UserFilter(**dto.filter.model_dump()) if dto.filter is not None else None
+
+
+def _batch_result(dto: UserBatchSelectionDTO, affected: list[int], status: str, caller_id: int) -> UserBatchResultDTO:
+    """Per-id outcome: with explicit ids, the ones not affected did not exist, or are the caller's own (skipped)."""
+    done = set(affected)
+    ids = dict.fromkeys(dto.ids) if dto.ids is not None else sorted(done)
+    results = [
+        UserBatchItemDTO(id=i, status=status if i in done else "skipped" if i == caller_id else "not_found") for i in ids
     ]
+    return UserBatchResultDTO(affected=len(done), results=results)
 
 
 @router.get(
     "/{user_id}",
     summary="Get user by id (admin)",
+    response_model=UserOutDTO,
     responses=GENERIC_ERROR_RESPONSES,
+    dependencies=[Depends(query_budget(1))],
     description="Admin-only access to any user by id.",
 )
-async def get_user(user_id: int, claims: Annotated[dict, Depends(get_claims)]) -> UserOutDTO:
+async def get_user(user_id: int, claims: Annotated[dict, Depends(get_claims)]) -> DTOResponse:
     """Return user by id."""
     require_role(claims, UserRole.ADMIN)
     svc = UserService(SqlAlchemyUnitOfWork())
     u = await svc.get_user(user_id)
-    return UserOutDTO(
-        id=u.id,
-        email=u.email.as_str(),
-        first_name=u.first_name,
-        last_name=u.last_name,
-        is_verified=u.is_verified,
-        role=u.role,
-    )
+    return DTOResponse(UserOutDTO.from_entity(u))
 
 
 @router.patch(
     "/{user_id}",
+    response_model=UserOutDTO,
     responses=GENERIC_ERROR_RESPONSES,
+    dependencies=[Depends(query_budget(2))],
     summary="Patch user (admin)",
     description="Partial update of selected user fields. Admin only.",
 )
-async def patch_user(user_id: int, dto: UserUpdateDTO, claims: Annotated[dict, Depends(get_claims)]) -> UserOutDTO:
+async def patch_user(user_id: int, dto: UserUpdateDTO, claims: Annotated[dict, Depends(get_claims)]) -> DTOResponse:
     """Partial update."""
     require_role(claims, UserRole.ADMIN)
     svc = UserService(SqlAlchemyUnitOfWork())
     u = await svc.patch_user(user_id, dto)
-    return UserOutDTO(
-        id=u.id,
-        email=u.email.as_str(),
-        first_name=u.first_name,
-        last_name=u.last_name,
-        is_verified=u.is_verified,
-        role=u.role,
-    )
+    return DTOResponse(UserOutDTO.from_entity(u))
 
 
 @router.delete(
     "/{user_id}",
     status_code=204,
     responses=GENERIC_ERROR_RESPONSES,
+    dependencies=[Depends(query_budget(1))],
     summary="Delete user (admin)",
     description="Deletes a user by id. Admin only.",
 )
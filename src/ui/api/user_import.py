@@ -0,0 +1,44 @@
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+
+from src.ui.api.export import ExportFormat
+
+
+async def decode_rows(chunks: AsyncIterable[bytes], fmt: ExportFormat) -> AsyncIterator[tuple[int, object]]:
+    """
+    Decode an uploaded CSV (header row first) or NDJSON stream into `(line_number, row)` pairs.
+
+    One record per line. Lines that cannot be decoded are passed on as raw strings, so they are
+    reported as invalid rows instead of aborting the import.
+    """
+    header: list[str] | None = None
+    async for line_no, line in _lines(chunks):
+        if not line.strip():
+            continue
+        if fmt is ExportFormat.CSV:
+            values = next(csv.reader([line]))
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+            yield line_no, dict(zip(header, values, strict=False))
+        else:
+            try:
+                yield line_no, json.loads(line)
+            except ValueError:
+                yield line_no, line
+
+
+async def _lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[tuple[int, str]]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    tail = ""
+    line_no = 0
+    async for chunk in chunks:
+        *lines, tail = (tail + decoder.decode(chunk)).split("\n")
+        for line in lines:
+            line_no += 1
+            yield line_no, line.rstrip("\r")
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield line_no + 1, tail.rstrip("\r")
@@ -0,0 +1,51 @@
+"""
+Bulk user import from a file, same format as POST /users/import:
+
+    python -m src.ui.cli.import_users users.csv --format csv
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from src.application.services.user_import_service import UserImportService
+from src.infrastructure.db.uow import SqlAlchemyUnitOfWork
+from src.infrastructure.security.argon2_password_hasher import hasher
+from src.ui.api.export import ExportFormat
+from src.ui.api.user_import import decode_rows
+
+READ_SIZE = 1024 * 1024
+
+
+async def _read_chunks(path: Path) -> AsyncIterator[bytes]:
+    f = await asyncio.to_thread(path.open, "rb")
+    try:
+        while chunk := await asyncio.to_thread(f.read, READ_SIZE):
+            yield chunk
+    finally:
+        f.close()
+
+
+async def run(path: Path, fmt: ExportFormat, batch_size: int) -> str:
+    svc = UserImportService(SqlAlchemyUnitOfWork(), hasher, batch_size=batch_size)
+    try:
+        report = await svc.import_users(decode_rows(_read_chunks(path), fmt))
+    finally:
+        hasher.bulk_pool.shutdown()
+    return report.model_dump_json(indent=2)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Bulk import users from CSV or NDJSON.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", dest="fmt", type=ExportFormat, choices=list(ExportFormat), default=None)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    fmt = args.fmt or (ExportFormat.CSV if args.path.suffix.lower() == ".csv" else ExportFormat.NDJSON)
+    print(asyncio.run(run(args.path, fmt, args.batch_size)))
+
+
+if __name__ == "__main__":
+    main()
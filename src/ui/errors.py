@@ -6,10 +6,16 @@ from starlette import status
 
 from src.domain.exceptions import (
     AccessDeniedError,
+    BatchTooLargeError,
+    ConflictingPaginationError,
     DomainError,
     EmailAlreadyTakenError,
     InvalidCredentialsError,
+    InvalidCursorError,
     InvalidEmailAddressError,
+    RateLimitedError,
+    RetryLaterError,
+    ServiceBusyError,
     UserNotFoundError,
     UserNotVerifiedError,
     VerificationCodeInvalidError,
@@ -25,8 +31,15 @@ DOMAIN_HTTP_STATUS = {
     VerificationCodeInvalidError: status.HTTP_400_BAD_REQUEST,
     AccessDeniedError: status.HTTP_403_FORBIDDEN,
     InvalidEmailAddressError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    InvalidCursorError: status.HTTP_400_BAD_REQUEST,
+    ConflictingPaginationError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    BatchTooLargeError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    ServiceBusyError: status.HTTP_503_SERVICE_UNAVAILABLE,
+    RateLimitedError: status.HTTP_429_TOO_MANY_REQUESTS,
 }
 
+RETRY_AFTER_SEC = 1
+
 
 def install_error_handlers(app: FastAPI) -> None:
     """
@@ -40,4 +53,7 @@ def install_error_handlers(app: FastAPI) -> None:
         """
         http_status = DOMAIN_HTTP_STATUS.get(type(exc), status.HTTP_400_BAD_REQUEST)
         payload = ErrorResponse(code=exc.code, message=exc.message).model_dump()
-        return JSONResponse(status_code=http_status, content=payload)
+        headers = None
+        if isinstance(exc, RetryLaterError):
+            headers = {"Retry-After": str(exc.retry_after_sec or RETRY_AFTER_SEC)}
+        return JSONResponse(status_code=http_status, content=payload, headers=headers)
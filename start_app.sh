@@ -28,6 +28,19 @@ until alembic upgrade head; do
 done
 echo "[entrypoint] Migrations applied."
 
+# Single host only: hosts calibrating on their own pick different parameters. For a fleet, run
+# the calibration once and pin the printed HASHER_* values in the shared config instead.
+if [ "${HASHER_CALIBRATE_ON_STARTUP:-false}" = "true" ]; then
+  echo "[entrypoint] Calibrating Argon2 parameters..."
+  eval "$(python -m src.infrastructure.security.argon2_calibration --export)"
+  echo "[entrypoint] Argon2: time_cost=${HASHER_TIME_COST} memory_kb=${HASHER_MEMORY_COST_KB} parallelism=${HASHER_PARALLELISM}"
+fi
+
+# Workers write metrics here and any of them serves the sum on /metrics; stale files from a
+# previous run would be added to the new totals, so start from an empty directory.
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus-api}"
+rm -rf "${PROMETHEUS_MULTIPROC_DIR}" && mkdir -p "${PROMETHEUS_MULTIPROC_DIR}"
+
 echo "[entrypoint] Starting Gunicorn (${WORKERS} workers) ..."
 exec gunicorn "${APP_IMPORT_PATH}" \
   --worker-class uvicorn.workers.UvicornWorker \
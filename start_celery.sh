@@ -5,6 +5,10 @@ CELERY_APP="${CELERY_APP:-src.infrastructure.tasks.celery_app:celery}"
 LOG_LEVEL="${CELERY_LOG_LEVEL:-INFO}"
 POOL="${CELERY_POOL:-solo}"
 
+# The worker's main process serves /metrics (METRICS_CELERY_PORT) for all pool processes.
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus-celery}"
+rm -rf "${PROMETHEUS_MULTIPROC_DIR}" && mkdir -p "${PROMETHEUS_MULTIPROC_DIR}"
+
 echo "[entrypoint-celery] Starting Celery worker & beat..."
 
 celery -A "$CELERY_APP" worker \
@@ -0,0 +1,62 @@
+"""
+Shared fixtures.
+
+Tests marked `db` drive the app over ASGI against the database and Redis configured in the
+environment (see README) and are skipped when those are not reachable; the rest need no services.
+Query budgets are strict here, so a route issuing more SQL than it declares fails.
+"""
+
+import os
+
+os.environ.setdefault("DB_QUERY_BUDGET_STRICT", "true")
+
+import socket  # noqa: E402
+from collections.abc import AsyncIterator  # noqa: E402
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+import pytest_asyncio  # noqa: E402
+
+from src.configs.database import settings as db_settings  # noqa: E402
+from src.configs.redis import redis_settings  # noqa: E402
+from src.infrastructure.db.base import engine, replica_engines  # noqa: E402
+from src.infrastructure.fastapi.app import create_app  # noqa: E402
+from src.infrastructure.redis_client import close_redis  # noqa: E402
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "db: needs the configured Postgres and Redis")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    db_items = [item for item in items if "db" in item.keywords]
+    if not db_items:
+        return
+    down = [
+        f"{h}:{p}"
+        for h, p in ((db_settings.HOST, db_settings.PORT), (redis_settings.HOST, redis_settings.PORT))
+        if not _reachable(h, p)
+    ]
+    if down:
+        skip = pytest.mark.skip(reason=f"services not reachable: {', '.join(down)}")
+        for item in db_items:
+            item.add_marker(skip)
+
+
+def _reachable(host: str, port: int) -> bool:
+    try:
+        with socket.create_connection((host, port), timeout=1):
+            return True
+    except OSError:
+        return False
+
+
+@pytest_asyncio.fixture
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    """HTTP client bound to a fresh app; connections are dropped afterwards (each test has its own event loop)."""
+    app = create_app()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+    for e in (engine, *replica_engines):
+        await e.dispose()
+    await close_redis()
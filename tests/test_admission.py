@@ -0,0 +1,41 @@
+from typing import Annotated
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+
+from src.domain.exceptions import ServiceBusyError
+from src.ui.api.admission import AdmissionLimiter
+from src.ui.errors import install_error_handlers
+
+
+@pytest.mark.asyncio
+async def test_full_limiter_rejects_with_retry_after() -> None:
+    limiter = AdmissionLimiter(max_concurrency=1, max_queue=0, max_wait_sec=1, retry_after_sec=7)
+    held = limiter()
+    await anext(held)
+
+    with pytest.raises(ServiceBusyError) as exc_info:
+        await anext(limiter())
+    assert exc_info.value.retry_after_sec == 7
+
+    await held.aclose()
+    await anext(limiter())  # the slot is free again
+
+
+@pytest.mark.asyncio
+async def test_overload_is_an_error_response() -> None:
+    limiter = AdmissionLimiter(max_concurrency=0, max_queue=0, max_wait_sec=1, retry_after_sec=3)
+    app = FastAPI()
+    install_error_handlers(app)
+
+    @app.post("/guarded")
+    async def guarded(_slot: Annotated[None, Depends(limiter)]) -> dict:
+        return {}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        r = await client.post("/guarded")
+
+    assert r.status_code == 503
+    assert r.headers["retry-after"] == "3"
+    assert r.json() == {"code": "service_busy", "message": "Server is busy, please retry later"}
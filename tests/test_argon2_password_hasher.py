@@ -0,0 +1,54 @@
+import pytest
+from argon2 import PasswordHasher
+
+from src.infrastructure.security.argon2_password_hasher import Argon2PasswordHasher
+from src.infrastructure.security.hashing_pool import BoundedExecutor
+
+MEMORY_KB = 8 * 1024
+
+
+def _hasher(time_cost: int, memory_cost_kb: int = MEMORY_KB) -> Argon2PasswordHasher:
+    return Argon2PasswordHasher(time_cost=time_cost, memory_cost_kb=memory_cost_kb, parallelism=1)
+
+
+def _stored(time_cost: int, memory_cost_kb: int = MEMORY_KB, **kwargs: int) -> str:
+    kwargs.setdefault("parallelism", 1)
+    return PasswordHasher(time_cost=time_cost, memory_cost=memory_cost_kb, **kwargs).hash("secret")
+
+
+def test_weaker_hash_needs_rehash() -> None:
+    assert _hasher(2).needs_rehash(_stored(1))
+    assert _hasher(1, 2 * MEMORY_KB).needs_rehash(_stored(1))
+    assert _hasher(1).needs_rehash(_stored(1, hash_len=16))
+
+
+def test_equal_or_stronger_hash_is_kept() -> None:
+    hasher = _hasher(2)
+    assert not hasher.needs_rehash(_stored(2))
+    assert not hasher.needs_rehash(_stored(3))
+    assert not hasher.needs_rehash(_stored(2, parallelism=4))  # a different lane count is not weaker
+
+
+def test_hosts_calibrated_differently_do_not_flip_hashes() -> None:
+    """t=2/m=16M and t=4/m=8M cost the same: neither host rewrites the other's hashes."""
+    host_a, host_b = _hasher(2, 2 * MEMORY_KB), _hasher(4)
+    assert not host_a.needs_rehash(_stored(4))
+    assert not host_b.needs_rehash(_stored(2, 2 * MEMORY_KB))
+
+
+def test_non_argon2_hash_needs_rehash() -> None:
+    assert _hasher(1).needs_rehash("$2b$12$" + "x" * 53)
+
+
+@pytest.mark.asyncio
+async def test_hash_many_async_keeps_input_order() -> None:
+    bulk_pool = BoundedExecutor("thread", max_workers=2, queue_size=0)
+    hasher = Argon2PasswordHasher(
+        time_cost=1, memory_cost_kb=MEMORY_KB, parallelism=1, bulk_pool=bulk_pool, bulk_chunk_size=2
+    )
+    raws = [f"password-{i}" for i in range(5)]
+    try:
+        hashes = await hasher.hash_many_async(raws)
+    finally:
+        bulk_pool.shutdown()
+    assert [hasher.verify(raw, hashed) for raw, hashed in zip(raws, hashes, strict=True)] == [True] * 5
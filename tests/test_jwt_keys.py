@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import jwt
+import pytest
+from jwt.exceptions import InvalidKeyError, InvalidTokenError
+
+from src.infrastructure.security.jwt_keys import KeyRing, generate_key
+
+
+@pytest.fixture
+def keys_dir(tmp_path: Path) -> Path:
+    for _ in range(2):
+        generate_key(str(tmp_path), "EdDSA")
+    return tmp_path
+
+
+def test_newest_key_signs_and_every_key_verifies(keys_dir: Path) -> None:
+    ring = KeyRing.from_dir("EdDSA", str(keys_dir))
+    kids = sorted(p.stem for p in keys_dir.glob("*.pem"))
+
+    assert ring.signing_key.kid == kids[-1]
+    for kid in kids:
+        assert ring.verification_key(kid) is not None
+
+
+def test_pinned_active_kid(keys_dir: Path) -> None:
+    oldest = min(p.stem for p in keys_dir.glob("*.pem"))
+    ring = KeyRing.from_dir("EdDSA", str(keys_dir), active_kid=oldest)
+
+    token = jwt.encode({"sub": "1"}, ring.signing_key.private_key, algorithm="EdDSA", headers={"kid": oldest})
+    kid = jwt.get_unverified_header(token)["kid"]
+    assert jwt.decode(token, ring.verification_key(kid), algorithms=["EdDSA"])["sub"] == "1"
+
+
+def test_unknown_kid_is_rejected(keys_dir: Path) -> None:
+    ring = KeyRing.from_dir("EdDSA", str(keys_dir))
+    with pytest.raises(InvalidTokenError):
+        ring.verification_key("retired")
+    with pytest.raises(InvalidTokenError):
+        ring.verification_key(None)
+
+
+def test_jwks_publishes_every_public_key(keys_dir: Path) -> None:
+    ring = KeyRing.from_dir("EdDSA", str(keys_dir))
+    jwks = ring.jwks()
+
+    assert sorted(k["kid"] for k in jwks["keys"]) == sorted(p.stem for p in keys_dir.glob("*.pem"))
+    for jwk in jwks["keys"]:
+        assert (jwk["kty"], jwk["alg"], jwk["use"]) == ("OKP", "EdDSA", "sig")
+        assert "d" not in jwk  # no private material
+
+
+def test_key_of_another_algorithm_is_refused(tmp_path: Path) -> None:
+    generate_key(str(tmp_path), "EdDSA")
+    with pytest.raises(InvalidKeyError):
+        KeyRing.from_dir("RS256", str(tmp_path))
+    with pytest.raises(InvalidKeyError):
+        KeyRing.from_dir("EdDSA", str(tmp_path / "empty"))
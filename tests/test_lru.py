@@ -0,0 +1,46 @@
+import pytest
+
+from src.infrastructure.cache import lru
+from src.infrastructure.cache.lru import TTLLRUCache
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(lru.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_expired_entries_are_dropped(clock: list[float]) -> None:
+    cache: TTLLRUCache[str, int] = TTLLRUCache(max_entries=10, ttl_sec=5)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_sec=20)
+
+    clock[0] += 5
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+def test_least_recently_used_entry_is_evicted(clock: list[float]) -> None:
+    evicted = []
+    cache: TTLLRUCache[str, int] = TTLLRUCache(max_entries=2, ttl_sec=60, on_evict=lambda: evicted.append(1))
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.evictions == 1
+    assert evicted == [1]
+
+
+def test_overwrite_does_not_evict(clock: list[float]) -> None:
+    cache: TTLLRUCache[str, int] = TTLLRUCache(max_entries=1, ttl_sec=60)
+    cache.set("a", 1)
+    cache.set("a", 2)
+    cache.pop("missing")
+
+    assert cache.get("a") == 2
+    assert cache.evictions == 0
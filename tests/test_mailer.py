@@ -0,0 +1,34 @@
+import asyncio
+import random
+from email.mime.text import MIMEText
+
+import aiosmtplib
+import pytest
+
+from src.configs.mail_settings import MailSettings
+from src.infrastructure.notifications.mailer import AioSMTPMailer, OutgoingEmail
+
+
+@pytest.mark.asyncio
+async def test_send_many_reports_results_in_input_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    mailer = AioSMTPMailer(MailSettings(pool_size=3))
+    rnd = random.Random(7)
+    sent: list[str] = []
+
+    async def fake_send(msg: MIMEText) -> None:
+        await asyncio.sleep(rnd.random() / 100)  # finish out of order
+        if msg["To"].startswith("bad"):
+            raise aiosmtplib.SMTPRecipientsRefused([])
+        sent.append(msg["To"])
+
+    monkeypatch.setattr(mailer, "_send", fake_send)
+    recipients = [f"{'bad' if i % 3 == 0 else 'ok'}{i}@x.com" for i in range(10)]
+    results = await mailer.send_many([OutgoingEmail(to, "s", "b") for to in recipients])
+
+    assert [to.startswith("bad") for to in recipients] == [isinstance(r, aiosmtplib.SMTPException) for r in results]
+    assert sorted(sent) == sorted(to for to in recipients if to.startswith("ok"))
+
+
+@pytest.mark.asyncio
+async def test_send_many_with_nothing_to_send() -> None:
+    assert await AioSMTPMailer(MailSettings()).send_many([]) == []
@@ -0,0 +1,30 @@
+import base64
+import json
+
+import pytest
+
+from src.application.dto.pagination import decode_cursor, encode_cursor
+from src.domain.exceptions import InvalidCursorError
+
+
+def _forge(payload: object) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b"=").decode()
+
+
+@pytest.mark.parametrize("last_id", [0, 1, 49, 2**31, 2**63 - 1])
+def test_round_trip(last_id: int) -> None:
+    cursor = encode_cursor(last_id)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == last_id
+
+
+@pytest.mark.parametrize("cursor", ["", "!!!", "abc", _forge([1]), _forge({"after": 1}), "eyJpZCI6MX0x"])
+def test_garbage_is_rejected(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("last_id", [True, False, -1, 1.5, "1", None])
+def test_forged_ids_are_rejected(last_id: object) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(_forge({"id": last_id}))
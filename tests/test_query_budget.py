@@ -0,0 +1,63 @@
+import uuid
+
+import httpx
+import pytest
+from sqlalchemy import text
+
+from src.infrastructure.db.base import async_session_maker
+from src.infrastructure.db.instrumentation import QueryBudgetExceededError
+from src.infrastructure.db.repositories.user_repo import UserRepository
+
+pytestmark = pytest.mark.db
+
+PASSWORD = "password123"
+
+
+def _email() -> str:
+    return f"budget-{uuid.uuid4().hex[:12]}@example.com"
+
+
+async def _verification_code(email: str) -> str:
+    async with async_session_maker() as s:
+        stmt = text(
+            "SELECT v.code FROM verifications v JOIN users u ON u.id = v.user_id"
+            " WHERE u.email = :email ORDER BY v.created_at DESC LIMIT 1"
+        )
+        return (await s.execute(stmt, {"email": email})).scalar_one()
+
+
+def _queries(response: httpx.Response) -> int:
+    """SQL statement count reported in the Server-Timing header ("db;dur=..;desc="N queries"")."""
+    db = next(m for m in response.headers["server-timing"].split(", ") if m.startswith("db;"))
+    return int(db.split('desc="')[1].split()[0])
+
+
+@pytest.mark.asyncio
+async def test_signup_and_login_stay_within_budget(client: httpx.AsyncClient) -> None:
+    email = _email()
+
+    r = await client.post("/auth/signup", json={"email": email, "password": PASSWORD})
+    assert r.status_code == 201, r.text
+    assert _queries(r) <= 1
+
+    r = await client.post("/auth/verify", json={"email": email, "code": await _verification_code(email)})
+    assert r.status_code == 200, r.text
+
+    r = await client.post("/auth/login", json={"email": email, "password": PASSWORD})
+    assert r.status_code == 200, r.text
+    assert _queries(r) <= 2
+
+
+@pytest.mark.asyncio
+async def test_signup_over_budget_fails(client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """An extra lookup before the insert (the old check-then-insert signup) must not pass unnoticed."""
+    add_with_verification = UserRepository.add_with_verification
+
+    async def with_extra_query(self: UserRepository, *args: object, **kwargs: object) -> object:
+        await self.session.execute(text("SELECT 1"))
+        return await add_with_verification(self, *args, **kwargs)
+
+    monkeypatch.setattr(UserRepository, "add_with_verification", with_extra_query)
+
+    with pytest.raises(QueryBudgetExceededError):
+        await client.post("/auth/signup", json={"email": _email(), "password": PASSWORD})
@@ -0,0 +1,54 @@
+import json
+from collections.abc import Sequence
+
+import pytest
+from starlette.requests import Request
+
+from src.domain.exceptions import RateLimitedError
+from src.infrastructure.security.rate_limiter import RateLimitRule
+from src.ui.api.rate_limit import AuthRateLimit, _digest
+
+
+class RecordingLimiter:
+    def __init__(self, retry_after: int = 0) -> None:
+        self.rules: list[RateLimitRule] = []
+        self._retry_after = retry_after
+
+    async def acquire(self, rules: Sequence[RateLimitRule]) -> int:
+        self.rules = list(rules)
+        return self._retry_after
+
+
+def _request(body: bytes) -> Request:
+    async def receive() -> dict:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    scope = {"type": "http", "method": "POST", "path": "/auth/login", "headers": [], "client": ("10.0.0.1", 1234)}
+    return Request(scope, receive)
+
+
+async def _keys(body: bytes) -> list[str]:
+    limiter = RecordingLimiter()
+    await AuthRateLimit("login", per_ip=5, per_email=2, limiter=limiter, enabled=True)(_request(body))  # type: ignore[arg-type]
+    return [rule.key for rule in limiter.rules]
+
+
+@pytest.mark.asyncio
+async def test_email_is_normalized_and_hashed() -> None:
+    keys = await _keys(json.dumps({"email": "  Ada@Example.COM ", "password": "x"}).encode())
+    assert keys == ["login:ip:10.0.0.1", f"login:email:{_digest('ada@example.com')}"]
+    assert "ada" not in keys[1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("body", [b"not json", b"[1, 2]", b'{"email": 42}', b'{"email": ""}', b"{}"])
+async def test_without_a_usable_email_only_the_ip_is_limited(body: bytes) -> None:
+    assert await _keys(body) == ["login:ip:10.0.0.1"]
+
+
+@pytest.mark.asyncio
+async def test_rejection_carries_retry_after() -> None:
+    dependency = AuthRateLimit("signup", per_ip=1, limiter=RecordingLimiter(retry_after=12), enabled=True)  # type: ignore[arg-type]
+    with pytest.raises(RateLimitedError) as exc_info:
+        await dependency(_request(b"{}"))
+    assert exc_info.value.retry_after_sec == 12
@@ -0,0 +1,72 @@
+import pytest
+from pydantic import ValidationError
+from redis.asyncio import Redis
+
+from src.configs.rate_limit import RateLimitSettings
+from src.infrastructure.security import rate_limiter as rate_limiter_module
+from src.infrastructure.security.rate_limiter import RateLimitRule, SlidingWindowRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def limiter(clock: list[float]) -> SlidingWindowRateLimiter:
+    limiter = SlidingWindowRateLimiter(Redis(), local_max_keys=100)
+    limiter._redis_down_until = float("inf")  # in-process fallback only, no Redis calls
+    return limiter
+
+
+@pytest.mark.asyncio
+async def test_window_rolls_over(limiter: SlidingWindowRateLimiter, clock: list[float]) -> None:
+    rule = RateLimitRule("login:ip:a", limit=2, window_sec=10)
+    assert await limiter.acquire([rule]) == 0
+    clock[0] += 4
+    assert await limiter.acquire([rule]) == 0
+    assert await limiter.acquire([rule]) == 6  # the first request leaves the window at t=10
+
+    clock[0] += 6
+    assert await limiter.acquire([rule]) == 0
+    assert await limiter.acquire([rule]) == 4  # the second one (t=4) is still in it
+    assert (limiter.stats().allowed, limiter.stats().rejected) == (3, 2)
+
+
+@pytest.mark.asyncio
+async def test_rejected_request_is_not_counted_by_other_rules(limiter: SlidingWindowRateLimiter) -> None:
+    per_ip = RateLimitRule("login:ip:a", limit=5, window_sec=60)
+    per_email = RateLimitRule("login:email:x", limit=1, window_sec=60)
+    assert await limiter.acquire([per_ip, per_email]) == 0
+    for _ in range(3):
+        assert await limiter.acquire([per_ip, per_email]) > 0
+
+    # Only the allowed request used up the per-IP budget: 4 more fit.
+    other_email = RateLimitRule("login:email:y", limit=10, window_sec=60)
+    assert [await limiter.acquire([per_ip, other_email]) for _ in range(5)] == [0, 0, 0, 0, 60]
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_rounded_up_to_whole_seconds(limiter: SlidingWindowRateLimiter, clock: list[float]) -> None:
+    rule = RateLimitRule("verify:ip:a", limit=1, window_sec=10)
+    assert await limiter.acquire([rule]) == 0
+    clock[0] += 8.2
+    assert await limiter.acquire([rule]) == 2  # 1.8 s left
+    clock[0] += 1.79
+    assert await limiter.acquire([rule]) == 1  # 10 ms left: never 0, which would mean "allowed"
+
+
+@pytest.mark.asyncio
+async def test_longest_wait_wins(limiter: SlidingWindowRateLimiter) -> None:
+    short = RateLimitRule("a", limit=1, window_sec=5)
+    long = RateLimitRule("b", limit=1, window_sec=30)
+    assert await limiter.acquire([short, long]) == 0
+    assert await limiter.acquire([short, long]) == 30
+
+
+@pytest.mark.parametrize("name", ["WINDOW_SEC", "LOGIN_PER_IP", "LOGIN_PER_EMAIL", "SIGNUP_PER_IP", "VERIFY_PER_IP"])
+def test_zero_limits_are_refused(name: str) -> None:
+    with pytest.raises(ValidationError):
+        RateLimitSettings(**{name: 0})
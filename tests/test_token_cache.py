@@ -0,0 +1,77 @@
+from pathlib import Path
+
+import jwt
+import pytest
+from jwt.exceptions import InvalidTokenError
+
+from src.configs.jwt import JWTSettings
+from src.infrastructure.cache import lru
+from src.infrastructure.security import token_cache
+from src.infrastructure.security.jwt_keys import generate_key
+from src.infrastructure.security.jwt_token_provider import JwtTokenProvider
+from src.infrastructure.security.token_cache import VerifiedTokenCache
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Drive both the wall clock (exp) and the monotonic clock (LRU expiry) from one value."""
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(token_cache.time, "time", lambda: now[0])
+    monkeypatch.setattr(lru.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entry_expires_at_exp(clock: list[float]) -> None:
+    cache = VerifiedTokenCache(max_entries=10)
+    claims = {"sub": "1", "exp": clock[0] + 30}
+    cache.put("t", claims)
+
+    clock[0] += 29
+    assert cache.get("t") == claims
+    clock[0] += 1
+    assert cache.get("t") is None
+
+
+def test_expired_or_exp_less_tokens_are_not_cached(clock: list[float]) -> None:
+    cache = VerifiedTokenCache(max_entries=10)
+    cache.put("expired", {"exp": clock[0] - 1})
+    cache.put("no-exp", {"sub": "1"})
+    cache.put("bad-exp", {"exp": "soon"})
+
+    assert cache.stats().size == 0
+
+
+def test_size_is_bounded_and_stats_are_counted(clock: list[float]) -> None:
+    cache = VerifiedTokenCache(max_entries=2)
+    for token in ("a", "b", "c"):
+        cache.put(token, {"exp": clock[0] + 60})
+
+    assert cache.get("a") is None  # least recently used, evicted
+    assert cache.get("c") is not None
+    assert cache.get("c") is not None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 1, 1, 2)
+    assert stats.hit_rate == pytest.approx(2 / 3)
+
+
+def test_provider_serves_repeat_tokens_from_cache() -> None:
+    provider = JwtTokenProvider(JWTSettings(secret="s" * 32))
+    token = provider.issue_access("7", {"role": "user"})
+
+    first = provider.decode(token)
+    first["role"] = "admin"  # callers get their own copy
+    assert provider.decode(token)["role"] == "user"
+    assert (provider.cache.stats().misses, provider.cache.stats().hits) == (1, 1)
+
+
+def test_retired_key_is_not_trusted_after_restart(tmp_path: Path) -> None:
+    old = generate_key(str(tmp_path), "EdDSA")
+    settings = JWTSettings(algorithm="EdDSA", keys_dir=str(tmp_path))
+    token = JwtTokenProvider(settings).issue_access("7", {})
+    assert jwt.get_unverified_header(token)["kid"] == old.stem
+
+    generate_key(str(tmp_path), "EdDSA")
+    old.unlink()
+    restarted = JwtTokenProvider(settings)  # a new worker: fresh KeyRing and an empty cache
+    with pytest.raises(InvalidTokenError):
+        restarted.decode(token)
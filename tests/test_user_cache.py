@@ -0,0 +1,81 @@
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+
+import pytest
+import pytest_asyncio
+from redis.asyncio import Redis
+
+from src.configs.cache import cache_settings
+from src.configs.redis import redis_settings
+from src.domain.entities.user import UserEntity
+from src.domain.value_objects.email_address import EmailAddress
+from src.domain.value_objects.user_role import UserRole
+from src.infrastructure.cache.user_cache import UserCache
+
+
+def _user(user_id: int = 1, role: UserRole = UserRole.USER) -> UserEntity:
+    return UserEntity(
+        id=user_id,
+        created_at=datetime(2024, 1, 1, tzinfo=UTC),
+        updated_at=None,
+        email=EmailAddress(f"user{user_id}@example.com"),
+        password="$argon2id$hash",
+        first_name=None,
+        last_name=None,
+        is_verified=False,
+        role=role,
+    )
+
+
+@pytest_asyncio.fixture
+async def offline_cache() -> AsyncIterator[UserCache]:
+    """A cache whose Redis refuses connections, i.e. L1 only."""
+    redis = Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.2)
+    yield UserCache(redis, max_entries=10, l1_ttl_sec=60, redis_ttl_sec=60)
+    await redis.aclose()
+
+
+@pytest_asyncio.fixture
+async def shared_redis() -> AsyncIterator[Redis]:
+    redis = Redis.from_url(redis_settings.DSN(cache_settings.REDIS_DB))
+    await redis.delete("user:id:1", "user:email:user1@example.com")
+    yield redis
+    await redis.delete("user:id:1", "user:email:user1@example.com")
+    await redis.aclose()
+
+
+@pytest.mark.asyncio
+async def test_put_caches_without_password(offline_cache: UserCache) -> None:
+    token = await offline_cache.fill_token()
+    await offline_cache.put(_user(), token)
+
+    cached = await offline_cache.get_by_id(1)
+    assert cached is not None and cached.password is None
+    assert await offline_cache.get_id_by_email("user1@example.com") == 1
+
+
+@pytest.mark.asyncio
+async def test_put_after_invalidation_is_dropped(offline_cache: UserCache) -> None:
+    token = await offline_cache.fill_token()  # reader starts, then loads the old row
+    await offline_cache.invalidate([1])  # a writer commits meanwhile
+    await offline_cache.put(_user(), token)
+
+    assert await offline_cache.get_by_id(1) is None
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_put_after_invalidation_on_another_worker_is_dropped(shared_redis: Redis) -> None:
+    reader = UserCache(shared_redis, max_entries=10, l1_ttl_sec=60, redis_ttl_sec=60)
+    writer = UserCache(shared_redis, max_entries=10, l1_ttl_sec=60, redis_ttl_sec=60)
+
+    token = await reader.fill_token()
+    await writer.invalidate([1])
+    await reader.put(_user(role=UserRole.USER), token)
+
+    assert await shared_redis.get("user:id:1") is None
+    assert await reader.get_by_id(1) is None
+
+    await reader.put(_user(role=UserRole.ADMIN), await reader.fill_token())
+    cached = await writer.get_by_id(1)
+    assert cached is not None and cached.role is UserRole.ADMIN
@@ -0,0 +1,57 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.domain.value_objects.user_filter import UserFilter
+from src.domain.value_objects.user_role import UserRole
+from src.infrastructure.db.models.user import UserORM
+from src.infrastructure.db.repositories.user_repo import UserRepository
+
+
+def _sql(*clauses: object) -> str:
+    stmt = select(UserORM.id).where(*clauses)
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_empty_filter_matches_everything() -> None:
+    assert UserFilter().is_empty()
+    assert not UserFilter(is_verified=False).is_empty()
+
+
+@pytest.mark.parametrize("where", [None, UserFilter()])
+def test_selecting_every_user_is_refused(where: UserFilter | None) -> None:
+    with pytest.raises(ValueError):
+        UserRepository._selection(None, where)
+
+
+def test_filter_fields_become_clauses() -> None:
+    where = UserFilter(
+        role=UserRole.USER,
+        is_verified=False,
+        created_before=datetime(2025, 1, 1),
+        created_after=datetime(2024, 1, 1),
+        email_domain="Example.COM",
+    )
+    sql = _sql(*UserRepository._selection(None, where))
+
+    assert "users.role = 'USER'" in sql
+    assert "users.is_verified = false" in sql
+    assert "users.created_at < '2025-01-01 00:00:00'" in sql
+    assert "users.created_at >= '2024-01-01 00:00:00'" in sql
+    assert "LIKE '%%' || '@example.com'" in sql
+
+
+def test_email_domain_wildcards_are_escaped() -> None:
+    sql = _sql(*UserRepository._selection(None, UserFilter(email_domain="a_b%.com")))
+    assert "'@a/_b/%%.com' ESCAPE '/'" in sql  # %% is the compiler's escaping of a literal %
+
+
+def test_ids_filter_cap_and_caller_are_combined() -> None:
+    sql = _sql(*UserRepository._selection([3, 1, 2], UserFilter(is_verified=True), limit=5, exclude_id=1))
+
+    assert "users.id = ANY (array((SELECT users.id" in sql
+    assert "users.id != 1" in sql
+    assert "users.id = ANY (CAST(ARRAY[3, 1, 2] AS INTEGER[]))" in sql
+    assert "ORDER BY users.id" in sql and "LIMIT 5" in sql
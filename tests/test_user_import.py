@@ -0,0 +1,40 @@
+from collections.abc import AsyncIterator
+
+import pytest
+
+from src.ui.api.export import ExportFormat
+from src.ui.api.user_import import decode_rows
+
+
+async def _chunks(*parts: bytes) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+
+
+async def _rows(fmt: ExportFormat, *parts: bytes) -> list[tuple[int, object]]:
+    return [row async for row in decode_rows(_chunks(*parts), fmt)]
+
+
+@pytest.mark.asyncio
+async def test_csv_rows_are_keyed_by_header() -> None:
+    rows = await _rows(
+        ExportFormat.CSV,
+        b"\xef\xbb\xbfemail, password\r\na@x.com,secret1\r\n",
+        b'\r\n"b@x.com","a,b"',
+    )
+    assert rows == [
+        (2, {"email": "a@x.com", "password": "secret1"}),
+        (4, {"email": "b@x.com", "password": "a,b"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines_split_across_chunks() -> None:
+    rows = await _rows(ExportFormat.NDJSON, b'{"email": "a@x', b'.com"}\n{"email": "\xc3', b'\xa9@x.com"}\n')
+    assert rows == [(1, {"email": "a@x.com"}), (2, {"email": "é@x.com"})]
+
+
+@pytest.mark.asyncio
+async def test_undecodable_ndjson_line_is_passed_on_raw() -> None:
+    rows = await _rows(ExportFormat.NDJSON, b'{"email": "a@x.com"}\nnot json\n\n{"email": "b@x.com"}')
+    assert rows == [(1, {"email": "a@x.com"}), (2, "not json"), (4, {"email": "b@x.com"})]